@@ -0,0 +1,4 @@
+"""
+    Benchmark suite for the algorithms in string2string (see README.md).
+    Run `python -m benchmarks --help` from the root of the repository.
+"""
@@ -0,0 +1,148 @@
+"""
+    Command-line interface of the benchmark suite.
+
+    Examples:
+        python -m benchmarks run --output results.json
+        python -m benchmarks run --lengths 10 100 1000 10000 100000 --max-cells 100000000 --output results.json
+        python -m benchmarks run --baseline baseline.json --threshold 0.1
+        python -m benchmarks compare baseline.json results.json --threshold 0.1
+        python -m benchmarks import-time --budget 0.1
+"""
+
+# Import relevant libraries and dependencies
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+from benchmarks.import_time import (
+    DEFAULT_BUDGET,
+    DEFAULT_MODULE,
+    check_import_budget,
+    report_import,
+)
+from benchmarks.runner import (
+    COSTS,
+    DEFAULT_MAX_CELLS,
+    DEFAULT_MIN_SECONDS,
+    METHODS,
+    compare_results,
+    run_suite,
+)
+from benchmarks.workloads import DEFAULT_LENGTHS, KINDS, UNITS, generate_workloads
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    case = (
+        f"{result['method']:<48} {result['costs']:<8} {result['kind']:<14} "
+        f"{result['unit']:<5} {result['length']:>7}"
+    )
+    if result["status"] == "skipped":
+        print(f"{case}  skipped ({result['cells']} cells)")
+        return
+    print(
+        f"{case}  {result['seconds'] * 1e3:>10.3f} ms  "
+        f"{result['cells_per_second']:>12.3e} cells/s  "
+        f"{result['peak_bytes'] / 1024:>10.1f} KiB"
+    )
+
+
+def _report(regressions: List[Dict[str, Any]], threshold: float) -> int:
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}.")
+        return 0
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for regression in regressions:
+        print(
+            f"  {regression['method']} {regression['costs']} {regression['kind']} "
+            f"{regression['unit']} {regression['length']}: {regression['metric']} "
+            f"{regression['baseline']:.6g} -> {regression['current']:.6g} "
+            f"(x{regression['ratio']:.2f})"
+        )
+    return 1
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks the methods of EditDistAlgs on generated workloads.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run = subparsers.add_parser("run", help="Run the benchmarks.")
+    run.add_argument("--methods", nargs="+", default=list(METHODS), choices=METHODS)
+    run.add_argument("--costs", nargs="+", default=list(COSTS), choices=COSTS)
+    run.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    run.add_argument("--units", nargs="+", default=list(UNITS), choices=UNITS)
+    run.add_argument("--lengths", nargs="+", type=int, default=list(DEFAULT_LENGTHS))
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument(
+        "--max-cells",
+        type=int,
+        default=DEFAULT_MAX_CELLS,
+        help="Skip the cases with more cells than this.",
+    )
+    run.add_argument("--output", help="Write the results to this JSON file.")
+    run.add_argument("--baseline", help="Compare the results against this JSON file.")
+    run.add_argument("--threshold", type=float, default=0.1)
+    run.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS)
+    run.add_argument("--quiet", action="store_true")
+
+    compare = subparsers.add_parser(
+        "compare", help="Compare two JSON files of results."
+    )
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.1)
+    compare.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS)
+
+    import_time = subparsers.add_parser(
+        "import-time",
+        help="Measure the import time of a module against a budget (in seconds).",
+    )
+    import_time.add_argument("--module", default=DEFAULT_MODULE)
+    import_time.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    import_time.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    if args.command == "compare":
+        regressions = compare_results(
+            _load(args.baseline), _load(args.current), args.threshold, args.min_seconds
+        )
+        return _report(regressions, args.threshold)
+    if args.command == "import-time":
+        result = check_import_budget(args.module, args.budget, args.repeat)
+        report_import(result)
+        return 0 if result["within_budget"] else 1
+
+    workloads = generate_workloads(args.kinds, args.units, args.lengths, args.seed)
+    results = run_suite(
+        workloads,
+        args.methods,
+        args.costs,
+        args.repeat,
+        args.max_cells,
+        progress=None if args.quiet else _print_result,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        regressions = compare_results(
+            _load(args.baseline), results, args.threshold, args.min_seconds
+        )
+        return _report(regressions, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
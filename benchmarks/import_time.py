@@ -0,0 +1,101 @@
+"""
+    Import-time benchmark: the cumulative time of importing a module in a fresh interpreter (as reported by python -X importtime),
+    and the heavy dependencies that the import pulls in.
+"""
+
+# Import relevant libraries and dependencies
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+# Module whose import time is measured by default.
+DEFAULT_MODULE = "string2string.edit_distance"
+
+# Budget (in seconds) of the import of DEFAULT_MODULE.
+DEFAULT_BUDGET = 0.1
+
+# Modules that the import of DEFAULT_MODULE must not pull in.
+HEAVY_MODULES = ("numpy",)
+
+
+def _pythonpath() -> str:
+    # The package is imported from the root of the repository, even if it is not installed.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    existing = os.environ.get("PYTHONPATH")
+    return root if not existing else root + os.pathsep + existing
+
+
+def measure_import(
+    module: str = DEFAULT_MODULE, heavy_modules: Sequence[str] = HEAVY_MODULES
+) -> Dict[str, Any]:
+    """
+    Imports a module in a fresh interpreter with -X importtime, and returns:
+        - seconds: The cumulative import time of the module (including its dependencies that were not imported yet),
+        - heavy_modules: The modules of heavy_modules that were imported along the way.
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {tuple(heavy_modules)!r} if m in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=_pythonpath()),
+        check=True,
+    )
+    # Lines of the form "import time: <self us> | <cumulative us> | <indentation><module>"
+    microseconds = None
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            microseconds = int(fields[1])
+    if microseconds is None:
+        raise RuntimeError(f"The import time of {module} was not reported.")
+    imported = process.stdout.strip()
+    return {
+        "module": module,
+        "seconds": microseconds / 1e6,
+        "heavy_modules": imported.split(",") if imported else [],
+    }
+
+
+def check_import_budget(
+    module: str = DEFAULT_MODULE,
+    budget: float = DEFAULT_BUDGET,
+    repeat: int = 3,
+    heavy_modules: Sequence[str] = HEAVY_MODULES,
+) -> Dict[str, Any]:
+    """
+    Measures the import of a module repeat times (see measure_import), and returns the fastest measurement, with:
+        - budget and within_budget: The budget, and whether the import took at most budget seconds and pulled in none of heavy_modules.
+    """
+    if repeat < 1:
+        raise ValueError("The number of repetitions must be positive.")
+    measurements: List[Dict[str, Any]] = [
+        measure_import(module, heavy_modules) for _ in range(repeat)
+    ]
+    result = min(measurements, key=lambda measurement: measurement["seconds"])
+    result["budget"] = budget
+    result["within_budget"] = (
+        result["seconds"] <= budget and not result["heavy_modules"]
+    )
+    return result
+
+
+def report_import(result: Dict[str, Any], stream: Optional[Any] = None) -> None:
+    """
+    Prints a result of check_import_budget.
+    """
+    stream = stream if stream is not None else sys.stdout
+    status = "ok" if result["within_budget"] else "over budget"
+    print(
+        f"import {result['module']}: {result['seconds'] * 1e3:.1f} ms "
+        f"(budget {result['budget'] * 1e3:.1f} ms) {status}",
+        file=stream,
+    )
+    if result["heavy_modules"]:
+        print(f"  pulled in: {', '.join(result['heavy_modules'])}", file=stream)
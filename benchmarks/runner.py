@@ -0,0 +1,268 @@
+"""
+    Benchmark runner: wall time, throughput (cells per second), and peak memory (tracemalloc) of the methods of EditDistAlgs,
+    and comparison of the results against a stored baseline.
+"""
+
+# Import relevant libraries and dependencies
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+import string2string
+from string2string.edit_distance import EditDistAlgs
+from string2string.instrumentation import linear_cells, quadratic_cells
+
+from benchmarks.workloads import Workload
+
+
+# Number of longest common subsequences enumerated by iter_longest_common_subsequences.
+ENUMERATION_LIMIT = 100
+
+
+def _hamming(algs: EditDistAlgs, str1, str2) -> float:
+    # The Hamming distance is only defined for inputs of the same length.
+    length = min(len(str1), len(str2))
+    return algs.hamming_distance(str1[:length], str2[:length])
+
+
+def _lcs_backtrack(algs: EditDistAlgs, str1, str2) -> Tuple:
+    # All the longest common subsequences are materialized (as lists of tokens for token inputs).
+    return algs.longest_common_subsequence(
+        str1, str2, printBacktrack=True, boolListOfList=not isinstance(str1, str)
+    )
+
+
+def _iter_lcs(algs: EditDistAlgs, str1, str2) -> List:
+    return list(
+        algs.iter_longest_common_subsequences(str1, str2, limit=ENUMERATION_LIMIT)
+    )
+
+
+# Benchmarked methods: name -> (function of (algs, str1, str2), number of cells as a function of the lengths).
+METHODS: Dict[str, Tuple[Callable, Callable[[int, int], int]]] = {
+    "levenshtein_edit_distance": (
+        lambda algs, str1, str2: algs.levenshtein_edit_distance(str1, str2),
+        quadratic_cells,
+    ),
+    "damerau_levenshtein_edit_distance": (
+        lambda algs, str1, str2: algs.damerau_levenshtein_edit_distance(str1, str2),
+        quadratic_cells,
+    ),
+    "damerau_levenshtein_edit_distance[unrestricted]": (
+        lambda algs, str1, str2: algs.damerau_levenshtein_edit_distance(
+            str1, str2, restricted=False
+        ),
+        quadratic_cells,
+    ),
+    "hamming_distance": (_hamming, linear_cells),
+    "jaccard_similarity_coefficient": (
+        lambda algs, str1, str2: algs.jaccard_similarity_coefficient(str1, str2),
+        linear_cells,
+    ),
+    "jaccard_index": (
+        lambda algs, str1, str2: algs.jaccard_index(str1, str2),
+        linear_cells,
+    ),
+    "longest_common_subsequence": (
+        lambda algs, str1, str2: algs.longest_common_subsequence(str1, str2),
+        quadratic_cells,
+    ),
+    "longest_common_subsequence[backtrack]": (_lcs_backtrack, quadratic_cells),
+    "one_longest_common_subsequence": (
+        lambda algs, str1, str2: algs.one_longest_common_subsequence(str1, str2),
+        quadratic_cells,
+    ),
+    f"iter_longest_common_subsequences[limit={ENUMERATION_LIMIT}]": (
+        _iter_lcs,
+        quadratic_cells,
+    ),
+    "count_longest_common_subsequences": (
+        lambda algs, str1, str2: algs.count_longest_common_subsequences(str1, str2),
+        quadratic_cells,
+    ),
+    "longest_common_substring": (
+        lambda algs, str1, str2: algs.longest_common_substring(str1, str2),
+        linear_cells,
+    ),
+    "edit_script": (
+        lambda algs, str1, str2: algs.edit_script(str1, str2),
+        quadratic_cells,
+    ),
+}
+
+# Cost models: name -> keyword arguments of EditDistAlgs.
+COSTS: Dict[str, Dict[str, float]] = {
+    "unit": {},
+    "weighted": {
+        "insert_weight": 1.0,
+        "delete_weight": 2.0,
+        "substite_weight": 1.5,
+        "adjacent_transposition_weight": 1.5,
+    },
+}
+
+# Cases with more cells than this are skipped by default (e.g., quadratic methods on inputs of length 10^5).
+DEFAULT_MAX_CELLS = 10**7
+
+# Methods whose running time can grow exponentially with the lengths, and the largest number of cells for which they are run (whatever max_cells is).
+# The backtracking of longest_common_subsequence already takes seconds on random pairs of about 15 symbols.
+METHOD_MAX_CELLS: Dict[str, int] = {
+    "longest_common_subsequence[backtrack]": quadratic_cells(11, 11),
+}
+
+# Timings below this many seconds (in both runs) are too noisy to be compared.
+DEFAULT_MIN_SECONDS = 1e-3
+
+
+def result_key(result: Dict[str, Any]) -> Tuple:
+    """
+    Returns the key that identifies a benchmark case across runs.
+    """
+    return (
+        result["method"],
+        result["costs"],
+        result["kind"],
+        result["unit"],
+        result["length"],
+    )
+
+
+def run_case(
+    method: str,
+    workload: Workload,
+    costs: str = "unit",
+    repeat: int = 3,
+    max_cells: Optional[int] = DEFAULT_MAX_CELLS,
+) -> Dict[str, Any]:
+    """
+    Runs a single benchmark case and returns its result:
+        - seconds: The minimum wall time over repeat runs (and mean_seconds, their mean),
+        - cells_per_second: The number of cells ((n+1) x (m+1) for the quadratic methods, n + m for the linear ones, as in instrumentation.py) per second,
+        - peak_bytes: The peak memory allocated during one additional run, as measured by tracemalloc.
+    Cases with more than max_cells cells (or, for the methods of METHOD_MAX_CELLS, more than their own limit) are skipped (their status is "skipped").
+    """
+    function, count_cells = METHODS[method]
+    cells = count_cells(len(workload.str1), len(workload.str2))
+    result = {
+        "method": method,
+        "costs": costs,
+        "kind": workload.kind,
+        "unit": workload.unit,
+        "length": workload.length,
+        "cells": cells,
+    }
+    limit = METHOD_MAX_CELLS.get(method)
+    if limit is not None and (max_cells is None or max_cells > limit):
+        max_cells = limit
+    if max_cells is not None and cells > max_cells:
+        result["status"] = "skipped"
+        return result
+
+    algs = EditDistAlgs(**COSTS[costs])
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(algs, workload.str1, workload.str2)
+        timings.append(time.perf_counter() - start)
+
+    # Memory is measured in a separate run, since tracing slows down the allocations.
+    tracemalloc.start()
+    try:
+        function(algs, workload.str1, workload.str2)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = min(timings)
+    result.update(
+        status="ok",
+        seconds=seconds,
+        mean_seconds=sum(timings) / len(timings),
+        cells_per_second=cells / seconds if seconds > 0 else float("inf"),
+        peak_bytes=peak_bytes,
+    )
+    return result
+
+
+def metadata() -> Dict[str, Any]:
+    """
+    Returns a description of the environment of a benchmark run.
+    """
+    return {
+        "string2string": string2string.__version__,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run_suite(
+    workloads: Iterable[Workload],
+    methods: Sequence[str] = tuple(METHODS),
+    costs: Sequence[str] = tuple(COSTS),
+    repeat: int = 3,
+    max_cells: Optional[int] = DEFAULT_MAX_CELLS,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every method under every cost model on every workload, and returns the results (see run_case) together with the metadata of the run.
+    The progress function (if any) is called with each result as soon as it is available.
+    """
+    unknown = [method for method in methods if method not in METHODS]
+    if unknown:
+        raise ValueError(f"Unknown methods: {', '.join(unknown)}.")
+    results = []
+    for workload in workloads:
+        for method in methods:
+            for cost in costs:
+                result = run_case(method, workload, cost, repeat, max_cells)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return {"metadata": metadata(), "results": results}
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.1,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> List[Dict[str, Any]]:
+    """
+    Returns the regressions of the current results with respect to the baseline: the cases whose wall time or peak memory grew by more than threshold (e.g., 0.1 = 10%).
+    Cases that are missing (or skipped) in either run are ignored, and so are the timings below min_seconds in both runs.
+    """
+    baseline_results = {
+        result_key(result): result
+        for result in baseline["results"]
+        if result.get("status") == "ok"
+    }
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(result_key(result))
+        if reference is None or result.get("status") != "ok":
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            old = reference[metric]
+            new = result[metric]
+            if metric == "seconds" and max(old, new) < min_seconds:
+                continue
+            if new > old * (1.0 + threshold):
+                regressions.append(
+                    {
+                        "method": result["method"],
+                        "costs": result["costs"],
+                        "kind": result["kind"],
+                        "unit": result["unit"],
+                        "length": result["length"],
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "ratio": new / old if old else float("inf"),
+                    }
+                )
+    return regressions
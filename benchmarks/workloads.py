@@ -0,0 +1,106 @@
+"""
+    Reproducible workloads for the benchmarks
+        [x] Random, repetitive, and near-identical pairs of inputs
+        [x] Characters (strings) and tokens (lists of strings)
+"""
+
+# Import relevant libraries and dependencies
+import random
+from typing import Iterator, List, NamedTuple, Sequence, Union
+
+# Kinds of pairs of inputs.
+KINDS = ("random", "repetitive", "near_identical")
+
+# Units of the inputs: characters (strings) or tokens (lists of strings).
+UNITS = ("char", "token")
+
+# Default lengths of the inputs.
+DEFAULT_LENGTHS = (10, 100, 1000)
+
+# Alphabet of the character workloads, and size of the vocabulary of the token workloads.
+CHAR_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+TOKEN_VOCABULARY_SIZE = 1000
+
+# Fraction of the positions edited in near-identical pairs.
+NEAR_IDENTICAL_EDIT_RATE = 0.01
+
+
+class Workload(NamedTuple):
+    """
+    A pair of inputs, together with the parameters that generated it
+    """
+
+    kind: str
+    unit: str
+    length: int
+    seed: int
+    str1: Union[str, List[str]]
+    str2: Union[str, List[str]]
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}/{self.unit}/{self.length}"
+
+
+def _symbols(unit: str) -> List[str]:
+    if unit == "char":
+        return list(CHAR_ALPHABET)
+    if unit == "token":
+        return [f"w{index}" for index in range(TOKEN_VOCABULARY_SIZE)]
+    raise ValueError(f"Unknown unit: {unit}. Supported units are: {', '.join(UNITS)}.")
+
+
+def generate_pair(kind: str, unit: str, length: int, seed: int = 0) -> Workload:
+    """
+    Generates a pair of inputs of the given length (near-identical pairs may differ in length by a few symbols).
+        - random: Both inputs are drawn uniformly at random from the alphabet.
+        - repetitive: Both inputs repeat short random periods (the worst case for backtracking and the best case for run-length effects).
+        - near_identical: The second input is the first one with about NEAR_IDENTICAL_EDIT_RATE of its positions edited (at least one).
+    The same arguments always generate the same pair.
+    """
+    rng = random.Random(f"{kind}/{unit}/{length}/{seed}")
+    symbols = _symbols(unit)
+    if kind == "random":
+        sequence1 = [rng.choice(symbols) for _ in range(length)]
+        sequence2 = [rng.choice(symbols) for _ in range(length)]
+    elif kind == "repetitive":
+        period1 = [rng.choice(symbols[:4]) for _ in range(3)]
+        period2 = [rng.choice(symbols[:4]) for _ in range(4)]
+        sequence1 = [period1[index % 3] for index in range(length)]
+        sequence2 = [period2[index % 4] for index in range(length)]
+    elif kind == "near_identical":
+        sequence1 = [rng.choice(symbols) for _ in range(length)]
+        sequence2 = list(sequence1)
+        for _ in range(max(1, round(NEAR_IDENTICAL_EDIT_RATE * length))):
+            position = rng.randrange(max(1, len(sequence2)))
+            operation = rng.choice(("insert", "delete", "substitute"))
+            if operation == "insert" or not sequence2:
+                sequence2.insert(position, rng.choice(symbols))
+            elif operation == "delete":
+                del sequence2[position]
+            else:
+                sequence2[position] = rng.choice(symbols)
+    else:
+        raise ValueError(
+            f"Unknown kind: {kind}. Supported kinds are: {', '.join(KINDS)}."
+        )
+    if unit == "char":
+        return Workload(
+            kind, unit, length, seed, "".join(sequence1), "".join(sequence2)
+        )
+    return Workload(kind, unit, length, seed, sequence1, sequence2)
+
+
+def generate_workloads(
+    kinds: Sequence[str] = KINDS,
+    units: Sequence[str] = UNITS,
+    lengths: Sequence[int] = DEFAULT_LENGTHS,
+    seed: int = 0,
+) -> Iterator[Workload]:
+    """
+    Yields the workloads of all the combinations of kinds, units, and lengths.
+    """
+    for kind in kinds:
+        for unit in units:
+            for length in lengths:
+                yield generate_pair(kind, unit, length, seed)
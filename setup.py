@@ -8,7 +8,7 @@ setup(
     author="Mirac Suzgun",
     author_email="msuzgun@stanford.edu",
     license="MIT",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks", "benchmarks.*")),
     install_requires=[],
     tests_require=["pytest"],
     classifiers=[
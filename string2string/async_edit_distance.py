@@ -0,0 +1,237 @@
+"""
+    Asynchronous (asyncio) interface to the metrics in edit_distance.py
+        [x] Offloading of the computations to a thread (or process) executor, so that the event loop is never blocked
+        [x] Batching of the requests that arrive within a short window into a single executor call
+        [x] Deduplication of identical in-flight requests
+        [x] Back-pressure: a bound on the number of pending requests
+"""
+
+# Import relevant libraries and dependencies
+import asyncio
+import copy
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from string2string.cache import _input_key
+from string2string.edit_distance import METRICS, EditDistAlgs, _metric_function
+
+# Default length (in seconds) of the window in which requests are collected into a batch.
+DEFAULT_BATCH_WINDOW = 0.002
+
+# Default maximum number of requests per batch.
+DEFAULT_MAX_BATCH_SIZE = 64
+
+# Default maximum number of pending (queued or running) requests.
+DEFAULT_MAX_PENDING = 1024
+
+
+def _compute_batch(
+    algs: EditDistAlgs, requests: List[Tuple[str, Any, Any, Dict[str, Any]]]
+) -> List[Tuple[bool, Any]]:
+    """
+    Computes a batch of (metric, str1, str2, kwargs) requests, and returns the (success, result or exception) pair of each of them.
+    This runs in the executor (possibly in another process), so it is a module-level function.
+    """
+    results = []
+    for metric, str1, str2, kwargs in requests:
+        try:
+            results.append((True, _metric_function(algs, metric)(str1, str2, **kwargs)))
+        except Exception as exception:
+            results.append((False, exception))
+    return results
+
+
+def _compute_batch_locked(
+    lock: threading.Lock,
+    algs: EditDistAlgs,
+    requests: List[Tuple[str, Any, Any, Dict[str, Any]]],
+) -> List[Tuple[bool, Any]]:
+    """
+    Computes a batch (see _compute_batch) while holding the lock, so that the batches that run on threads never use algs concurrently.
+    """
+    with lock:
+        return _compute_batch(algs, requests)
+
+
+class AsyncEditDistAlgs:
+    """
+    Class for the asynchronous computation of the metrics of EditDistAlgs in an asyncio application
+    """
+
+    def __init__(
+        self,
+        algs: Optional[EditDistAlgs] = None,
+        executor: Optional[Executor] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """
+        Creates an asynchronous interface to algs (by default, EditDistAlgs()).
+
+        Arguments:
+        (a) executor: The executor that runs the batches (by default, the default executor of the event loop, i.e., a thread pool).
+            With a ProcessPoolExecutor, algs is pickled with each batch, so the computations are not limited by the global interpreter lock (but the cache and instrumentation of algs, if any, are not shared).
+            With any other executor, the batches share algs, whose cache and instrumentation are not thread-safe, so they run one at a time (under a lock).
+        (b) batch_window: The requests that arrive within batch_window seconds of the first request of a batch are computed together, in a single executor call.
+            A batch is also dispatched as soon as it holds max_batch_size requests.
+        (c) max_pending: The maximum number of distinct requests that are queued or running; further requests wait (without blocking the event loop) until a slot is released.
+        """
+        if max_batch_size < 1 or max_pending < 1:
+            raise ValueError(
+                "The batch size and the number of pending requests must be positive."
+            )
+        self.algs = algs if algs is not None else EditDistAlgs()
+        self.executor = executor
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        # Lock of algs for the executors that run the batches on threads (None for process pools, which work on copies of algs)
+        self._lock = (
+            None if isinstance(executor, ProcessPoolExecutor) else threading.Lock()
+        )
+
+        # Requests of the batch that is being collected: (key, metric, str1, str2, kwargs, future)
+        self._batch: List[Tuple[Any, ...]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Futures of the in-flight requests, by key (for deduplication)
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        # Semaphore of the pending requests (created in the event loop on first use)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._num_pending = 0
+
+        self.stats = {"requests": 0, "deduplicated": 0, "batches": 0, "computed": 0}
+
+    def __getattr__(self, name: str) -> Callable:
+        """
+        Returns the asynchronous version of the metric with the given name (see METRICS in edit_distance.py), e.g., await async_algs.levenshtein_edit_distance(str1, str2).
+        """
+        if name not in METRICS:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        async def metric(str1: Any, str2: Any, **kwargs: Any) -> Any:
+            return await self.compute(name, str1, str2, **kwargs)
+
+        metric.__name__ = name
+        return metric
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of distinct requests that are queued or running.
+        """
+        return self._num_pending
+
+    async def compute(self, metric: str, str1: Any, str2: Any, **kwargs: Any) -> Any:
+        """
+        Definition:
+        Returns metric(str1, str2, **kwargs) of algs, computed in the executor.
+
+        Notes:
+        (a) A request that is identical to an in-flight request (the same metric, inputs, and arguments) waits for the result of the latter instead of being computed again.
+            Requests with unhashable inputs (or arguments) are never deduplicated.
+        (b) Cancelling a caller does not cancel the computation, which may be shared with other callers.
+        """
+        _metric_function(self.algs, metric)
+        self.stats["requests"] += 1
+        try:
+            key = (
+                metric,
+                _input_key(str1),
+                _input_key(str2),
+                tuple(sorted(kwargs.items())),
+            )
+            future = self._in_flight.get(key)
+        except TypeError:
+            key = None
+            future = None
+        if future is not None:
+            self.stats["deduplicated"] += 1
+        else:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_pending)
+            await self._slots.acquire()
+            self._num_pending += 1
+            future = asyncio.get_running_loop().create_future()
+            if key is not None:
+                # Another identical request may have started while this one was waiting for a slot.
+                existing = self._in_flight.get(key)
+                if existing is not None:
+                    self._num_pending -= 1
+                    self._slots.release()
+                    self.stats["deduplicated"] += 1
+                    future = existing
+                else:
+                    self._in_flight[key] = future
+                    self._enqueue((key, metric, str1, str2, kwargs, future))
+            else:
+                self._enqueue((key, metric, str1, str2, kwargs, future))
+        value = await asyncio.shield(future)
+        # Results that contain lists are copied, since they may be shared between callers.
+        return value if isinstance(value, (int, float)) else copy.deepcopy(value)
+
+    def _enqueue(self, request: Tuple[Any, ...]) -> None:
+        """
+        Adds a request to the current batch, and dispatches the batch if it is full (or schedules its dispatch at the end of the window).
+        """
+        self._batch.append(request)
+        if len(self._batch) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.batch_window, self._dispatch)
+
+    def _dispatch(self) -> None:
+        """
+        Submits the current batch to the executor.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        self.stats["batches"] += 1
+        self.stats["computed"] += len(batch)
+        loop = asyncio.get_running_loop()
+        requests = [
+            (metric, str1, str2, kwargs) for _, metric, str1, str2, kwargs, _ in batch
+        ]
+        compute = (
+            _compute_batch
+            if self._lock is None
+            else functools.partial(_compute_batch_locked, self._lock)
+        )
+        job = loop.run_in_executor(self.executor, compute, self.algs, requests)
+        job.add_done_callback(lambda job: self._resolve(batch, job))
+
+    def _resolve(self, batch: List[Tuple[Any, ...]], job: asyncio.Future) -> None:
+        """
+        Sets the results of the requests of a finished batch, and releases their slots.
+        """
+        try:
+            results = job.result()
+        except BaseException as exception:
+            # The whole batch failed (e.g., the executor was shut down, or the inputs could not be pickled).
+            results = [(False, exception)] * len(batch)
+        for (key, _, _, _, _, future), (success, value) in zip(batch, results):
+            if key is not None:
+                self._in_flight.pop(key, None)
+            self._num_pending -= 1
+            self._slots.release()
+            if future.done():
+                continue
+            if success:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    async def flush(self) -> None:
+        """
+        Dispatches the current batch immediately, without waiting for the end of the window.
+        """
+        self._dispatch()
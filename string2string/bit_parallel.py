@@ -0,0 +1,170 @@
+"""
+    Bit-parallel engines for unit-cost edit distances.
+    The bit vectors are plain Python integers, so a pattern of any length fits in a single vector.
+        [x] Levenshtein edit distance (Myers, 1999; Hyyrö, 2001)
+        [x] Restricted Damerau-Levenshtein distance, i.e., optimal string alignment (Hyyrö, 2003)
+        [x] Length of the longest common subsequence (Allison and Dix, 1986; Hyyrö, 2004)
+"""
+
+# Import relevant libraries and dependencies
+from typing import Dict, Hashable, Iterable, List, Optional, Union
+
+
+def pattern_match_vectors(pattern: Union[str, List[str]]) -> Dict[Hashable, int]:
+    """
+    Returns the match vectors (also known as "Peq") of a pattern: the i-th bit of the vector of symbol c is set iff pattern[i] == c.
+    """
+    peq = {}
+    bit = 1
+    for symbol in pattern:
+        peq[symbol] = peq.get(symbol, 0) | bit
+        bit <<= 1
+    return peq
+
+
+def myers_levenshtein(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    max_distance: Optional[int] = None,
+) -> int:
+    """
+    Definition:
+    Computes the unit-cost Levenshtein edit distance between two strings (or lists of strings) using Myers' bit-vector algorithm.
+
+    Notes:
+    (a) The shorter input is used as the pattern. Each column of the distance matrix is encoded by two bit vectors (VP and VN) that mark the vertical +1/-1 differences, and a whole column is updated with a constant number of bitwise operations.
+    (b) Since Python integers have arbitrary precision, the column is a single vector regardless of the pattern length. The time complexity is O(ceil(m/w) x n), where w is the word size.
+        The pattern is therefore not split into machine-word blocks: the carries between the words are propagated by the integer arithmetic itself (in C), which is faster than a Python loop over the blocks.
+    (c) If max_distance is given, the function returns max_distance + 1 as soon as the distance is known to exceed max_distance.
+        Since consecutive entries of the last row differ by at most one, the final distance is at least the current score minus the number of remaining symbols.
+    (d) See: Myers, G., 1999. A fast bit-vector algorithm for approximate string matching based on dynamic programming. Journal of the ACM (JACM), 46(3), pp.395-415.
+    """
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    n = len(str1)
+    m = len(str2)
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    return myers_scan(pattern_match_vectors(str2), m, str1, n, max_distance)
+
+
+def myers_scan(
+    peq: Dict[Hashable, int],
+    m: int,
+    text: Iterable[Hashable],
+    n: int,
+    max_distance: Optional[int] = None,
+) -> int:
+    """
+    Returns the unit-cost Levenshtein edit distance between a text of length n (any iterable of symbols, e.g., a stream) and a pattern of length m > 0, given by its match vectors peq (see pattern_match_vectors).
+    This is the main loop of myers_levenshtein; the text is consumed one symbol at a time, so it never needs to be materialized.
+    """
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    score = m
+    remaining = n
+    for symbol in text:
+        remaining -= 1
+        pm = peq.get(symbol, 0)
+        d0 = ((((pm & vp) + vp) & mask) ^ vp) | pm | vn
+        hp = vn | ~(d0 | vp) & mask
+        hn = d0 & vp
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | ~(d0 | hp) & mask
+        vn = hp & d0
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def hyyro_osa(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    max_distance: Optional[int] = None,
+) -> int:
+    """
+    Definition:
+    Computes the unit-cost restricted Damerau-Levenshtein distance (optimal string alignment) between two strings (or lists of strings) using Hyyrö's bit-vector algorithm.
+
+    Notes:
+    (a) This extends Myers' algorithm (see myers_levenshtein): the diagonal zero-difference vector D0 of a column also marks the cells that are reached by a transposition,
+        i.e., TR = (((~D0') & PM) << 1) & PM', where D0' and PM' are the D0 vector and the match vector of the previous column.
+    (b) As in myers_levenshtein, the column is a single Python integer, and max_distance triggers the same early exit (the function then returns max_distance + 1).
+    (c) See: Hyyrö, H., 2003. A bit-vector algorithm for computing Levenshtein and Damerau edit distances. Nordic Journal of Computing, 10(1), pp.29-39.
+    """
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    n = len(str1)
+    m = len(str2)
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+
+    peq = pattern_match_vectors(str2)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    d0 = 0
+    pm_prev = 0
+    score = m
+    remaining = n
+    for symbol in str1:
+        remaining -= 1
+        pm = peq.get(symbol, 0)
+        tr = ((~d0 & pm) << 1) & pm_prev
+        d0 = ((((pm & vp) + vp) & mask) ^ vp) | pm | vn | tr
+        hp = vn | ~(d0 | vp) & mask
+        hn = d0 & vp
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | ~(d0 | hp) & mask
+        vn = hp & d0
+        pm_prev = pm
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def hyyro_lcs_length(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+) -> int:
+    """
+    Definition:
+    Computes the length of the longest common subsequence of two strings (or lists of strings) with a bit-vector algorithm.
+
+    Notes:
+    (a) The shorter input is used as the pattern. A column of the LCS matrix is encoded by a single vector V, whose zero bits mark the rows where the column increases by one,
+        and each symbol of the text updates it with V = (V + U) | (V - U), where U = V & PM. The length of the longest common subsequence is the number of zero bits of the last column.
+    (b) The time complexity is O(ceil(m/w) x n), where w is the word size, and the column is a single Python integer regardless of the pattern length.
+    (c) See: Allison, L. and Dix, T.I., 1986. A bit-string longest-common-subsequence algorithm. Information Processing Letters, 23(5), pp.305-310;
+        and Hyyrö, H., 2004. Bit-parallel LCS-length computation revisited. In Proc. 15th Australasian Workshop on Combinatorial Algorithms (AWOCA 2004).
+    """
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    m = len(str2)
+    if m == 0:
+        return 0
+
+    peq = pattern_match_vectors(str2)
+    mask = (1 << m) - 1
+    v = mask
+    for symbol in str1:
+        u = v & peq.get(symbol, 0)
+        v = ((v + u) | (v - u)) & mask
+    return m - bin(v).count("1")
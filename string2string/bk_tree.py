@@ -0,0 +1,210 @@
+"""
+    BK-tree (Burkhard-Keller tree) metric index for nearest-neighbour queries under the metrics in edit_distance.py
+        [x] Bulk build and incremental insertion
+        [x] Range queries (all the items within a given radius)
+        [x] k-nearest-neighbour queries
+        [x] Statistics on the number of pruned distance evaluations
+"""
+
+# Import relevant libraries and dependencies
+import functools
+import heapq
+import inspect
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from string2string.edit_distance import EditDistAlgs, _is_symmetric
+
+# Metrics (i.e., methods of EditDistAlgs) supported by the BK-tree.
+METRICS = (
+    "levenshtein_edit_distance",
+    "damerau_levenshtein_edit_distance",
+    "hamming_distance",
+    "jaccard_index",
+)
+
+# Tolerance of the triangle-inequality pruning, so that rounding errors in weighted (floating-point) distances never prune a valid subtree.
+_TOLERANCE = 1e-9
+
+
+class BKTree:
+    """
+    Class for a BK-tree over strings (or lists of strings)
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Union[str, List[str]]] = (),
+        metric: str = "levenshtein_edit_distance",
+        algs: Optional[EditDistAlgs] = None,
+    ) -> None:
+        """
+        Builds a BK-tree over items (see update) under the given metric of algs (by default, EditDistAlgs()).
+
+        Notes:
+        (a) Each child of a node is labeled with its distance to the node, so that the triangle inequality prunes every subtree whose label differs from d(query, node) by more than the search radius.
+            The metric must therefore be symmetric and vanish on identical inputs: the insertion and deletion weights must be equal, and the match weight must be zero.
+        (b) The restricted Damerau-Levenshtein distance (optimal string alignment, the default of EditDistAlgs) does not satisfy the triangle inequality (e.g., "ca" -> "ac" -> "abc"),
+            so the tree uses the unrestricted distance (restricted = False), which is a metric as long as 2 x (transposition weight) >= insertion weight + deletion weight.
+        (c) For the Hamming distance, all the items (and queries) must have the same length.
+        (d) The Jaccard index of the character (or token) sets is a pseudometric: distinct items with the same set are at distance zero, and they are all kept.
+        """
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unknown metric: {metric}. Supported metrics are: {', '.join(METRICS)}."
+            )
+        self.algs = algs if algs is not None else EditDistAlgs()
+        if metric != "jaccard_index" and (
+            self.algs.match_weight != 0 or not _is_symmetric(self.algs, metric)
+        ):
+            raise ValueError(
+                "The BK-tree needs a metric: the insertion and deletion weights must be equal, and the match weight must be zero."
+            )
+        if metric == "damerau_levenshtein_edit_distance" and (
+            2 * self.algs.adjacent_transposition_weight
+            < self.algs.insert_weight + self.algs.delete_weight
+        ):
+            raise ValueError(
+                "The BK-tree needs a metric: twice the transposition weight must be at least the sum of the insertion and deletion weights."
+            )
+        self.metric = metric
+        self._distance = getattr(self.algs, metric)
+        if metric == "damerau_levenshtein_edit_distance":
+            self._distance = functools.partial(self._distance, restricted=False)
+        # Whether the metric can stop early once a distance exceeds a bound
+        self._bounded = "max_distance" in inspect.signature(self._distance).parameters
+
+        # Nodes are stored in parallel lists: the item of each node, and the children of each node (a dictionary from distances to nodes).
+        self.items: List[Union[str, List[str]]] = []
+        self.children: List[Dict[float, int]] = []
+
+        # Cumulative statistics over all the queries, and the statistics of the last query
+        self.stats = {"queries": 0, "distance_evaluations": 0, "pruned": 0}
+        self.last_stats = {"distance_evaluations": 0, "pruned": 0}
+
+        self.update(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Union[str, List[str]]) -> bool:
+        return len(self.range_query(item, 0)) > 0
+
+    def _compute_distance(
+        self,
+        query: Union[str, List[str]],
+        item: Union[str, List[str]],
+        bound: Optional[float] = None,
+    ) -> float:
+        """
+        Returns the distance between the query and an item. If a bound is given, any distance above it may be returned as infinity.
+        """
+        if bound is not None and self._bounded:
+            return self._distance(query, item, max_distance=bound)
+        return self._distance(query, item)
+
+    def add(self, item: Union[str, List[str]]) -> bool:
+        """
+        Inserts an item into the tree. Returns False (and does not insert it) if the tree already contains the item.
+        """
+        if not self.items:
+            self.items.append(item)
+            self.children.append({})
+            return True
+        node = 0
+        while True:
+            distance = self._compute_distance(item, self.items[node])
+            if distance == 0 and item == self.items[node]:
+                return False
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = len(self.items)
+                self.items.append(item)
+                self.children.append({})
+                return True
+            node = child
+
+    def update(self, items: Iterable[Union[str, List[str]]]) -> int:
+        """
+        Inserts the items into the tree (bulk build). Returns the number of inserted items.
+        """
+        return sum(self.add(item) for item in items)
+
+    def _record(self, evaluations: int) -> None:
+        """
+        Records the statistics of a query that computed the given number of distances.
+        """
+        self.last_stats = {
+            "distance_evaluations": evaluations,
+            "pruned": len(self.items) - evaluations,
+        }
+        self.stats["queries"] += 1
+        self.stats["distance_evaluations"] += evaluations
+        self.stats["pruned"] += len(self.items) - evaluations
+
+    def range_query(
+        self, query: Union[str, List[str]], radius: float
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (item, distance) pairs of all the items within distance radius of the query, in increasing order of distance.
+        """
+        results = []
+        evaluations = 0
+        stack = [0] if self.items else []
+        while stack:
+            node = stack.pop()
+            children = self.children[node]
+            # Distances beyond radius + (largest label) prune the node and all of its children.
+            bound = radius + max(children) if children else radius
+            distance = self._compute_distance(
+                query, self.items[node], bound + _TOLERANCE
+            )
+            evaluations += 1
+            if distance <= radius:
+                results.append((node, distance))
+            for label, child in children.items():
+                if abs(label - distance) <= radius + _TOLERANCE:
+                    stack.append(child)
+        self._record(evaluations)
+        results.sort(key=lambda result: (result[1], result[0]))
+        return [(self.items[node], distance) for node, distance in results]
+
+    def nearest(
+        self, query: Union[str, List[str]], k: int = 1
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (item, distance) pairs of the k items that are closest to the query, in increasing order of distance (ties are broken by insertion order).
+
+        Notes:
+        (a) Subtrees are visited in increasing order of the lower bound |d(query, node) - label| of their distances to the query (best-first search), and the search stops once the lower bound exceeds the distance of the current k-th nearest item.
+        """
+        if k <= 0 or not self.items:
+            self._record(0)
+            return []
+        # Max-heap (by negated keys) of the k best (distance, node) pairs found so far
+        best: List[Tuple[float, int]] = []
+        # Min-heap of (lower bound, node) pairs that remain to be visited
+        frontier = [(0.0, 0)]
+        evaluations = 0
+        while frontier:
+            lower_bound, node = heapq.heappop(frontier)
+            radius = -best[0][0] if len(best) == k else None
+            if radius is not None and lower_bound > radius + _TOLERANCE:
+                break
+            children = self.children[node]
+            bound = None
+            if radius is not None:
+                bound = (radius + max(children) if children else radius) + _TOLERANCE
+            distance = self._compute_distance(query, self.items[node], bound)
+            evaluations += 1
+            if len(best) < k:
+                heapq.heappush(best, (-distance, -node))
+            elif (distance, node) < (-best[0][0], -best[0][1]):
+                heapq.heapreplace(best, (-distance, -node))
+            radius = -best[0][0] if len(best) == k else None
+            for label, child in children.items():
+                child_bound = abs(label - distance)
+                if radius is None or child_bound <= radius + _TOLERANCE:
+                    heapq.heappush(frontier, (child_bound, child))
+        self._record(evaluations)
+        results = sorted((-distance, -node) for distance, node in best)
+        return [(self.items[node], distance) for distance, node in results]
@@ -0,0 +1,165 @@
+"""
+    Opt-in memoization of the results of the methods of EditDistAlgs
+        [x] Least-recently-used (LRU) eviction with a bounded number of entries
+        [x] Admission policy on the length of the inputs
+        [x] Hit, miss, and eviction counters
+"""
+
+# Import relevant libraries and dependencies
+import copy
+import functools
+import inspect
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+# Marker for a missing entry.
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    Class for a size-bounded LRU cache of the results of EditDistAlgs (see the cache argument of EditDistAlgs)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_input_length: Optional[int] = None,
+    ) -> None:
+        """
+        Creates an empty cache that holds at most max_entries results (or an unbounded number of them if max_entries is None).
+        Pairs in which either input is longer than max_input_length are neither looked up nor stored (they are counted as bypassed).
+        """
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("The maximum number of entries cannot be negative.")
+        self.max_entries = max_entries
+        self.max_input_length = max_input_length
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def admits(self, str1: Any, str2: Any) -> bool:
+        """
+        Returns True if the pair is short enough to be cached.
+        """
+        if self.max_input_length is None:
+            return True
+        return len(str1) <= self.max_input_length and len(str2) <= self.max_input_length
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the result stored under key (and marks it as the most recently used), or default if there is no such result.
+        """
+        value = self.entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a result under key, evicting the least recently used results if the cache is full.
+        """
+        if self.max_entries == 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all the results (the counters are kept).
+        """
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of the counters of the cache.
+        """
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+        }
+
+
+def _input_key(sequence: Any) -> Hashable:
+    """
+    Returns a hashable key of a string (or list of strings, array('i'), or NumPy array) that determines its contents.
+    """
+    if isinstance(sequence, str):
+        return sequence
+    if isinstance(sequence, array):
+        return ("array", sequence.typecode, sequence.tobytes())
+    # NumPy is not imported here: if it has not been imported yet, no NumPy array can exist.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(sequence, numpy.ndarray):
+        return ("ndarray", sequence.dtype.str, sequence.shape, sequence.tobytes())
+    return tuple(sequence)
+
+
+def cached_method(symmetric: Union[bool, Callable[[Any], bool]] = False) -> Callable:
+    """
+    Decorator for the methods of EditDistAlgs whose result only depends on the weights of the instance, the two inputs, and the other arguments.
+    If the instance has a cache, the results are memoized in it; otherwise, the method is called directly.
+
+    Arguments:
+    (a) symmetric: Whether method(a, b) == method(b, a), in which case (a, b) and (b, a) share a single entry.
+        It can also be a function of the instance (e.g., for metrics that are symmetric only under some weights).
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+        # Default values of the arguments that follow the two inputs
+        defaults = tuple(
+            parameter.default for parameter in list(signature.parameters.values())[3:]
+        )
+
+        @functools.wraps(method)
+        def wrapper(self, str1, str2, *args, **kwargs):
+            cache = self.cache
+            if cache is None:
+                return method(self, str1, str2, *args, **kwargs)
+            if not cache.admits(str1, str2):
+                cache.bypassed += 1
+                return method(self, str1, str2, *args, **kwargs)
+
+            if args or kwargs:
+                bound = signature.bind(self, str1, str2, *args, **kwargs)
+                bound.apply_defaults()
+                options = tuple(bound.arguments.values())[3:]
+            else:
+                options = defaults
+            pair: Tuple[Hashable, ...] = (_input_key(str1), _input_key(str2))
+            key = (method.__name__, self._weights_key()) + pair + options
+            try:
+                if symmetric(self) if callable(symmetric) else symmetric:
+                    key = key[:2] + (frozenset(pair),) + options
+                value = cache.get(key, _MISSING)
+            except TypeError:
+                # Unhashable tokens (or arguments) are not cached.
+                cache.bypassed += 1
+                return method(self, str1, str2, *args, **kwargs)
+            if value is _MISSING:
+                value = method(self, str1, str2, *args, **kwargs)
+                cache.put(key, value)
+            # Results that contain lists are copied, so that callers cannot modify the cached entry.
+            return value if isinstance(value, (int, float)) else copy.deepcopy(value)
+
+        return wrapper
+
+    return decorator
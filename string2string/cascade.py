@@ -0,0 +1,249 @@
+"""
+    Top-k and threshold search over a collection of candidates, with a cascade of lower bounds on the edit distance
+        [x] Length difference
+        [x] Symbol histograms (character or token counts)
+        [x] q-gram counts
+        [x] Bounded dynamic programming (which stops once the distance exceeds the current threshold)
+        [x] Statistics on the number of candidates eliminated by each stage
+"""
+
+# Import relevant libraries and dependencies
+import heapq
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+
+# Metrics (i.e., methods of EditDistAlgs) supported by the cascade.
+METRICS = (
+    "levenshtein_edit_distance",
+    "damerau_levenshtein_edit_distance",
+)
+
+# Stages of the cascade, in the order in which they are applied.
+STAGES = ("length", "histogram", "qgram", "bounded_dp")
+
+# Tolerance of the pruning, so that rounding errors in weighted (floating-point) distances never eliminate a valid candidate.
+_TOLERANCE = 1e-9
+
+
+def qgram_profile(sequence: Union[str, List[str]], q: int) -> Counter:
+    """
+    Returns the multiset of the q-grams (substrings, or tuples of tokens, of length q) of a string (or list of strings).
+    """
+    if isinstance(sequence, str):
+        return Counter(sequence[i : i + q] for i in range(len(sequence) - q + 1))
+    return Counter(tuple(sequence[i : i + q]) for i in range(len(sequence) - q + 1))
+
+
+class _CountTable:
+    """
+    Sparse table of the multisets (e.g., histograms) of a collection: the (item id, count) entries of all the multisets are stored in flat arrays.
+    """
+
+    def __init__(self, multisets: List[Counter]) -> None:
+        self.ids: Dict[Hashable, int] = {}
+        owners = []
+        columns = []
+        counts = []
+        for owner, multiset in enumerate(multisets):
+            for item, count in multiset.items():
+                owners.append(owner)
+                columns.append(self.ids.setdefault(item, len(self.ids)))
+                counts.append(count)
+        self.num_rows = len(multisets)
+        self.owners = np.array(owners, dtype=np.intp)
+        self.columns = np.array(columns, dtype=np.intp)
+        self.counts = np.array(counts, dtype=np.int64)
+
+    def common(self, multiset: Counter) -> np.ndarray:
+        """
+        Returns the size of the intersection of the given multiset with each multiset of the table.
+        """
+        # Items that do not occur in the table are mapped to the extra (last) column.
+        vector = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        for item, count in multiset.items():
+            vector[self.ids.get(item, len(self.ids))] += count
+        shared = np.minimum(self.counts, vector[self.columns])
+        return np.bincount(self.owners, weights=shared, minlength=self.num_rows)
+
+
+class CascadeSearch:
+    """
+    Class for top-k and threshold searches over a fixed collection of strings (or lists of strings)
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[Union[str, List[str]]],
+        metric: str = "levenshtein_edit_distance",
+        algs: Optional[EditDistAlgs] = None,
+        q: int = 2,
+    ) -> None:
+        """
+        Prepares the candidates for searches under the given metric of algs (by default, EditDistAlgs()); the distance of a candidate is metric(query, candidate).
+
+        Notes:
+        (a) The symbol histograms and the q-gram profiles of the candidates are computed once, here, and stored in sparse tables, so that the bounds of all the candidates are computed with a few NumPy operations per query.
+        (b) For the Damerau-Levenshtein distance, only the restricted variant (optimal string alignment, the default of EditDistAlgs) is supported.
+        """
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unknown metric: {metric}. Supported metrics are: {', '.join(METRICS)}."
+            )
+        if q < 1:
+            raise ValueError("The length of the q-grams must be positive.")
+        self.algs = algs if algs is not None else EditDistAlgs()
+        self.metric = metric
+        self.q = q
+        self._distance = getattr(self.algs, metric)
+
+        self.candidates: List[Union[str, List[str]]] = list(candidates)
+        self.lengths = np.array(
+            [len(candidate) for candidate in self.candidates], dtype=np.int64
+        )
+        self.histograms = _CountTable([Counter(c) for c in self.candidates])
+        self.profiles = _CountTable([qgram_profile(c, q) for c in self.candidates])
+
+        # Cumulative statistics over all the queries, and the statistics of the last query
+        self.stats = dict(
+            {"queries": 0, "verified": 0}, **{stage: 0 for stage in STAGES}
+        )
+        self.last_stats = dict({"verified": 0}, **{stage: 0 for stage in STAGES})
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def lower_bounds(self, query: Union[str, List[str]]) -> Dict[str, np.ndarray]:
+        """
+        Returns the lower bounds of the distances between the query and all the candidates, for each of the first three stages of the cascade:
+            - length: Every alignment pairs up a <= min(n, m) symbols (at a cost of at least min(match, substitution, transposition / 2) each), deletes n - a symbols, and inserts m - a symbols.
+              The cost is linear in a, so its minimum is at a = 0 or a = min(n, m).
+            - histogram: Each of the p surplus symbols of the query must be deleted or substituted, and each of the r surplus symbols of the candidate must be inserted or substituted (transpositions do not change the histograms).
+              A substitution fixes at most one of each, so the cost is at least min(p x del + r x ins, s x sub + (p - s) x del + (r - s) x ins), where s = min(p, r).
+            - qgram: An insertion, deletion, or substitution destroys at most q of the q-grams of either input (and an adjacent transposition at most q + 1).
+              The number of operations is therefore at least the number of q-grams of either input that are not shared with the other one, divided by q (or q + 1).
+        """
+        algs = self.algs
+        insert_weight = algs.insert_weight
+        delete_weight = algs.delete_weight
+        substite_weight = algs.substite_weight
+        aligned = min(algs.match_weight, substite_weight)
+        operation = min(insert_weight, delete_weight, substite_weight)
+        span = self.q
+        if self.metric == "damerau_levenshtein_edit_distance":
+            aligned = min(aligned, algs.adjacent_transposition_weight / 2.0)
+            operation = min(operation, algs.adjacent_transposition_weight)
+            span += 1
+
+        n = len(query)
+        m = self.lengths
+        pairs = np.minimum(n, m)
+        length = np.minimum(
+            n * delete_weight + m * insert_weight,
+            pairs * aligned + (n - pairs) * delete_weight + (m - pairs) * insert_weight,
+        )
+
+        common = self.histograms.common(Counter(query))
+        surplus1 = n - common
+        surplus2 = m - common
+        substitutions = np.minimum(surplus1, surplus2)
+        histogram = np.minimum(
+            surplus1 * delete_weight + surplus2 * insert_weight,
+            substitutions * substite_weight
+            + (surplus1 - substitutions) * delete_weight
+            + (surplus2 - substitutions) * insert_weight,
+        )
+
+        common = self.profiles.common(qgram_profile(query, self.q))
+        missing = np.maximum(np.maximum(n, m) - self.q + 1 - common, 0)
+        qgram = np.ceil(missing / span) * operation
+        return {"length": length, "histogram": histogram, "qgram": qgram}
+
+    def _search(
+        self,
+        query: Union[str, List[str]],
+        k: Optional[int],
+        max_distance: Optional[float],
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (candidate, distance) pairs of the k nearest candidates (all of them if k is None) whose distance is at most max_distance (if given).
+
+        Notes:
+        (a) The bounds of all the candidates are computed first (see lower_bounds), and the candidates are verified in increasing order of their largest bound.
+            The threshold is max_distance or the distance of the current k-th best candidate, whichever is smaller, and the search stops once the bound of the next candidate exceeds it.
+        (b) Each candidate that is not verified is counted as eliminated by the first stage whose bound exceeds the final threshold.
+        (c) The candidates are verified with the exact metric, with max_distance set to the threshold (if any), so that it stops as soon as the distance exceeds the threshold.
+        """
+        bounds = self.lower_bounds(query)
+        largest_bounds = np.maximum.reduce([bounds[stage] for stage in STAGES[:-1]])
+        order = np.argsort(largest_bounds, kind="stable").tolist()
+        largest_bounds = largest_bounds.tolist()
+        eliminated = {stage: 0 for stage in STAGES}
+        verified = 0
+        threshold = max_distance
+
+        # Max-heap (by negated keys) of the best (distance, index) pairs found so far
+        best: List[Tuple[float, int]] = []
+        stop = len(order)
+        for position, index in enumerate(order):
+            if threshold is not None:
+                limit = threshold + _TOLERANCE
+                if largest_bounds[index] > limit:
+                    stop = position
+                    break
+                distance = self._distance(
+                    query, self.candidates[index], max_distance=limit
+                )
+                if distance > threshold:
+                    eliminated["bounded_dp"] += 1
+                    continue
+            else:
+                distance = self._distance(query, self.candidates[index])
+            verified += 1
+            if k is None or len(best) < k:
+                heapq.heappush(best, (-distance, -index))
+            elif (distance, index) < (-best[0][0], -best[0][1]):
+                heapq.heapreplace(best, (-distance, -index))
+            if k is not None and len(best) == k:
+                threshold = (
+                    -best[0][0] if threshold is None else min(threshold, -best[0][0])
+                )
+
+        # The remaining candidates are attributed to the first stage that eliminates them.
+        remaining = np.array(order[stop:], dtype=np.intp)
+        for stage in STAGES[:-1] if len(remaining) else ():
+            pruned = bounds[stage][remaining] > threshold + _TOLERANCE
+            eliminated[stage] += int(np.count_nonzero(pruned))
+            remaining = remaining[~pruned]
+
+        self.last_stats = dict({"verified": verified}, **eliminated)
+        self.stats["queries"] += 1
+        for key, value in self.last_stats.items():
+            self.stats[key] += value
+        results = sorted((-distance, -index) for distance, index in best)
+        return [(self.candidates[index], distance) for distance, index in results]
+
+    def top_k(
+        self,
+        query: Union[str, List[str]],
+        k: int = 1,
+        max_distance: Optional[float] = None,
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (candidate, distance) pairs of the k candidates that are closest to the query (and, if max_distance is given, within max_distance of it),
+        in increasing order of distance (ties are broken by the order of the candidates). The eliminations of each stage are recorded in last_stats.
+        """
+        if k <= 0:
+            raise ValueError("The number of results must be positive.")
+        return self._search(query, k, max_distance)
+
+    def within(
+        self, query: Union[str, List[str]], max_distance: float
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (candidate, distance) pairs of all the candidates within max_distance of the query, in increasing order of distance (ties are broken by the order of the candidates).
+        The eliminations of each stage are recorded in last_stats.
+        """
+        return self._search(query, None, max_distance)
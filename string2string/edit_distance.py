@@ -10,9 +10,61 @@
 """
 
 # Import relevant libraries and dependencies
-from typing import List, Union, Tuple
-import numpy as np
-from itertools import product
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Union, Tuple
+from array import array
+from bisect import bisect_left
+import math
+import operator
+import sys
+
+from string2string.bit_parallel import hyyro_lcs_length, hyyro_osa, myers_levenshtein
+from string2string.cache import ResultCache, cached_method
+from string2string.instrumentation import (
+    Instrumentation,
+    instrumented_method,
+    linear_cells,
+    quadratic_cells,
+)
+from string2string.suffix_automaton import SuffixAutomaton
+from string2string.vocabulary import Vocabulary
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy (and the engines that depend on it: wavefront.py and hirschberg.py) are imported lazily, by the code paths that need them,
+# so that importing this module (and computing the simple metrics) does not pay for the import of NumPy.
+
+# The wavefront engine is used for the weighted Levenshtein distance once n x m exceeds this many times n + m (i.e., the average length of an anti-diagonal).
+WAVEFRONT_MIN_CELLS_PER_DIAGONAL = 16
+
+# The Hamming distance is vectorized for inputs of at least this length (below it, NumPy's per-call overhead dominates).
+HAMMING_VECTORIZE_MIN_LENGTH = 128
+
+
+def _is_ndarray(obj: Any) -> bool:
+    """
+    Returns True if obj is a NumPy array. NumPy is not imported for this check: if it has not been imported yet, no array can exist.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def _from_ndarray(obj: "np.ndarray") -> Union[array, List]:
+    """
+    Converts a NumPy array of integer ids to an array('q') of the same ids, and any other NumPy array to a list.
+    """
+    if obj.dtype.kind in "iu":
+        return array("q", obj.tolist())
+    return obj.tolist()
+
+
+def _max_distance_bound(max_distance: Optional[float]) -> Optional[float]:
+    """
+    Returns max_distance, or None if it does not bound the distance (i.e., if it is positive infinity or NaN).
+    """
+    if max_distance is not None and not max_distance < math.inf:
+        return None
+    return max_distance
 
 
 class EditDistAlgs:
@@ -20,6 +72,19 @@ class EditDistAlgs:
     Class for edit distance algorithms
     """
 
+    # The attributes are fixed (no per-instance __dict__), so that they are looked up faster and the instances are smaller.
+    __slots__ = (
+        "insert_weight",
+        "delete_weight",
+        "match_weight",
+        "substite_weight",
+        "adjacent_transposition_weight",
+        "list_of_list_separator",
+        "vocabulary",
+        "cache",
+        "instrumentation",
+    )
+
     def __init__(
         self,
         insert_weight: int = 1.0,
@@ -28,6 +93,9 @@ class EditDistAlgs:
         substite_weight: int = 1.0,
         adjacent_transposition_weight: int = 1.0,
         list_of_list_separator: str = " ## ",
+        vocabulary: Optional[Vocabulary] = None,
+        cache: Optional[ResultCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
         # All the weights should be non-negative.
         assert min(insert_weight, delete_weight, match_weight, substite_weight) >= 0
@@ -40,6 +108,15 @@ class EditDistAlgs:
         self.adjacent_transposition_weight = adjacent_transposition_weight
         self.list_of_list_separator = list_of_list_separator
 
+        # Vocabulary used to map tokens to integer ids (see _prepare_pair); if None, a temporary mapping is built per call.
+        self.vocabulary = vocabulary
+
+        # Opt-in memoization of the results (see cache.py); if None, every call is computed.
+        self.cache = cache
+
+        # Opt-in counters of the calls (see instrumentation.py); if None, the calls are not measured.
+        self.instrumentation = instrumentation
+
     def stringlist_cartesian_product(
         self,
         lst1: Union[List[str], List[List[str]]],
@@ -59,8 +136,125 @@ class EditDistAlgs:
             for s2 in lst2
         ]
 
+    def _prepare_pair(
+        self,
+        str1: Union[str, List[str], array, "np.ndarray"],
+        str2: Union[str, List[str], array, "np.ndarray"],
+        encode_tokens: bool = True,
+        strip_affix: bool = False,
+    ) -> Tuple[Union[str, List, array], Union[str, List, array], int]:
+        """
+        Shared preprocessing stage of the algorithms below. Returns the prepared inputs and the number of symbols removed from each of them.
+            (a) Pre-encoded inputs (NumPy arrays of integer ids) are converted to array('q'), and array('i') inputs are used directly; in both cases, the ids are compared as they are (they are not encoded again).
+                Other NumPy arrays (e.g., of strings) are converted to lists of tokens.
+            (b) If encode_tokens is True and both inputs are lists (or tuples) of tokens, the tokens are mapped to integer ids through the vocabulary, so that each comparison is an integer comparison.
+                If only one of the inputs is pre-encoded and the instance has a vocabulary, the symbols of the other input are mapped to their ids in that vocabulary (without adding new symbols to it).
+            (c) If strip_affix is True, the common prefix and the common suffix of the inputs are removed (this is only valid when matches are free).
+        """
+        if _is_ndarray(str1):
+            str1 = _from_ndarray(str1)
+        if _is_ndarray(str2):
+            str2 = _from_ndarray(str2)
+
+        if (
+            encode_tokens
+            and isinstance(str1, (list, tuple))
+            and isinstance(str2, (list, tuple))
+        ):
+            vocabulary = (
+                self.vocabulary if self.vocabulary is not None else Vocabulary()
+            )
+            try:
+                str1, str2 = vocabulary.encode(str1), vocabulary.encode(str2)
+            except TypeError:
+                # Unhashable tokens are compared as they are.
+                pass
+        elif (
+            encode_tokens
+            and self.vocabulary is not None
+            and isinstance(str1, array) != isinstance(str2, array)
+        ):
+            # One input is pre-encoded (with the shared vocabulary), and the other is made of raw symbols.
+            # Symbols that are not in the vocabulary are mapped to -1, so that they match no id (the vocabulary does not grow).
+            symbol_to_id = self.vocabulary.symbol_to_id
+            try:
+                if isinstance(str1, array):
+                    str2 = array("q", [symbol_to_id.get(symbol, -1) for symbol in str2])
+                else:
+                    str1 = array("q", [symbol_to_id.get(symbol, -1) for symbol in str1])
+            except TypeError:
+                # Unhashable tokens are compared as they are.
+                pass
+
+        num_stripped = 0
+        if strip_affix:
+            n = len(str1)
+            m = len(str2)
+            prefix = 0
+            while prefix < min(n, m) and str1[prefix] == str2[prefix]:
+                prefix += 1
+            suffix = 0
+            while (
+                suffix < min(n, m) - prefix
+                and str1[n - 1 - suffix] == str2[m - 1 - suffix]
+            ):
+                suffix += 1
+            if prefix or suffix:
+                str1 = str1[prefix : n - suffix]
+                str2 = str2[prefix : m - suffix]
+                num_stripped = prefix + suffix
+        return str1, str2, num_stripped
+
+    def _weights_key(self) -> Tuple:
+        """
+        Returns the weights (and other settings) of the instance that affect the results, as part of the keys of the cache.
+        """
+        return (
+            self.insert_weight,
+            self.delete_weight,
+            self.match_weight,
+            self.substite_weight,
+            self.adjacent_transposition_weight,
+            self.list_of_list_separator,
+        )
+
+    def _has_uniform_costs(self) -> bool:
+        """
+        Returns True if insertions, deletions, and substitutions have the same cost and matches are free (e.g., the unit-cost case).
+        """
+        return (
+            self.match_weight == 0
+            and self.insert_weight == self.delete_weight == self.substite_weight
+        )
+
+    def _diagonal_band(
+        self,
+        n: int,
+        m: int,
+        insert_weight: float,
+        delete_weight: float,
+        max_distance: float,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Returns the range of diagonals (j - i) of an (n+1) x (m+1) distance matrix (with n >= m) that a path of cost at most max_distance can visit, or None if no such path exists.
+        """
+        # Every path has to cover the length difference with deletions.
+        slack = max_distance - (n - m) * delete_weight
+        if slack < 0:
+            return None
+        # Leaving the band [m-n, 0] by one diagonal costs one insertion and one deletion.
+        if insert_weight + delete_weight == 0:
+            return -n, m
+        slack = slack / (insert_weight + delete_weight)
+        return m - n - slack, slack
+
+    @cached_method(symmetric=lambda algs: algs.insert_weight == algs.delete_weight)
+    @instrumented_method(quadratic_cells)
     def levenshtein_edit_distance(
-        self, str1: Union[str, List[str]], str2: Union[str, List[str]]
+        self,
+        str1: Union[str, List[str]],
+        str2: Union[str, List[str]],
+        max_distance: Optional[float] = None,
     ) -> float:
         """
         Definition:
@@ -69,44 +263,162 @@ class EditDistAlgs:
         Notes:
         (a) This algorithm computes the Levenshtein edit distance between two strings using dynamic programming.
         (b) It follows the original Wagner-Fischer algorithm (see: Wagner, R.A. and Fischer, M.J., 1974. The string-to-string correction problem. Journal of the ACM (JACM), 21(1), pp.168-173.)
-            (i) The time and space complexities of the algorithm are both quadratic (i.e., O(n x m))).
-            (ii) One can easily improve the space complexity and make it linear though. (Hint: Focus only on the last computed row.)
-            (iii) The time complexity, however, cannot be made strongly subquadratic time unless SETH is false.
+            (i) The time complexity of the algorithm is quadratic (i.e., O(n x m))).
+            (ii) Since only the distance is returned, the implementation keeps two rows of the distance matrix, so its space complexity is O(min(n, m)).
+                 The rows are Python lists, which are faster to index one entry at a time than NumPy arrays.
+            (iii) Under uniform costs (insertion = deletion = substitution, match = 0), the distance is computed with Myers' bit-parallel algorithm instead (see bit_parallel.py).
+                  Otherwise, for larger inputs, the distance matrix is filled one anti-diagonal at a time with vectorized NumPy operations (see wavefront.py).
+            (iv) The time complexity, however, cannot be made strongly subquadratic time unless SETH is false.
                 - See: "Edit Distance Cannot Be Computed in Strongly Subquadratic Time (unless SETH is false)"
                         [by Arturs Backurs (MIT) and Piotr Indyk (MIT), 2017].
                 - Paper link: https://arxiv.org/pdf/1412.0348.pdf
+        (c) If max_distance is given, the function returns float("inf") whenever the distance exceeds max_distance (max_distance = float("inf") is the same as no bound).
+            Only the diagonal band of the distance matrix that a path of cost at most max_distance can visit is filled (Ukkonen's cut-off), and the computation stops as soon as every entry of the current row exceeds max_distance.
+            Under unit costs, this reduces the time complexity to O(k x min(n, m)), where k = max_distance.
         """
 
+        # An infinite bound is no bound, and no distance is negative.
+        max_distance = _max_distance_bound(max_distance)
+        if max_distance is not None and max_distance < 0:
+            return float("inf")
+
+        # Common prefixes and suffixes do not change the distance when matches are free.
+        str1, str2, _ = self._prepare_pair(
+            str1, str2, strip_affix=self.match_weight == 0
+        )
+
+        # Under uniform costs, the bit-parallel engine computes the same distance word-parallel.
+        if self._has_uniform_costs():
+            if max_distance is None:
+                return self.insert_weight * float(myers_levenshtein(str1, str2))
+            if self.insert_weight == 0:
+                return 0.0
+            max_units = int(max_distance // self.insert_weight)
+            units = myers_levenshtein(str1, str2, max_distance=max_units)
+            return (
+                self.insert_weight * float(units)
+                if units <= max_units
+                else float("inf")
+            )
+
         # Lengths of strings str1 and str2, respectively.
         n = len(str1)
         m = len(str2)
 
-        # Initialization of the distance matrix of size (n+1) x (m+1)
-        dist = np.zeros((n + 1, m + 1))
-        for i in range(1, n + 1):
-            dist[i, 0] = self.delete_weight * i
-        for j in range(1, m + 1):
-            dist[0, j] = self.insert_weight * j
+        # Once the anti-diagonals are long enough, the vectorized wavefront engine moves the inner loop out of Python.
+        if max_distance is None and n * m > WAVEFRONT_MIN_CELLS_PER_DIAGONAL * (n + m):
+            from string2string.wavefront import encode_pair, wavefront_levenshtein
+
+            codes1, codes2 = encode_pair(str1, str2)
+            return wavefront_levenshtein(
+                codes1,
+                codes2,
+                insert_weight=self.insert_weight,
+                delete_weight=self.delete_weight,
+                match_weight=self.match_weight,
+                substite_weight=self.substite_weight,
+            )
+
+        # Only the distance is returned, so we keep two rows of the distance matrix (instead of the full (n+1) x (m+1) matrix).
+        # The shorter string is placed along the columns; swapping the strings swaps the roles of insertions and deletions.
+        insert_weight, delete_weight = self.insert_weight, self.delete_weight
+        if m > n:
+            str1, str2 = str2, str1
+            n, m = m, n
+            insert_weight, delete_weight = delete_weight, insert_weight
+
+        # Diagonals (j - i) of the distance matrix that need to be filled.
+        if max_distance is None:
+            lower, upper = -n, m
+        else:
+            band = self._diagonal_band(n, m, insert_weight, delete_weight, max_distance)
+            if band is None:
+                return float("inf")
+            # Entries outside the band are set to infinity.
+            lower, upper = math.ceil(band[0]), math.floor(band[1])
+        prev = [math.inf] * (m + 1)
+        curr = [math.inf] * (m + 1)
+        match_weight = self.match_weight
+        substite_weight = self.substite_weight
+
+        # Initialization of the first row, i.e., dist[0, :]
+        for j in range(0, min(m, upper) + 1):
+            prev[j] = insert_weight * j
 
         # Dynamic programming step (for the unit case where each operation has a unit cost):
         # d[i, j] := min(d[i-1, j-1] + mismatch(i, j), d[i-1, j] + 1, d[i, j-1] + 1),
         # where mismatch(i, j) is 1 if str1[i] != str2[j] and 0 otherwise.
         for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                dist[i, j] = min(
-                    dist[i - 1, j - 1]
-                    + (
-                        self.substite_weight
-                        if str1[i - 1] != str2[j - 1]
-                        else self.match_weight
-                    ),
-                    dist[i, j - 1] + self.insert_weight,
-                    dist[i - 1, j] + self.delete_weight,
+            lo = max(0, i + lower)
+            hi = min(m, i + upper)
+            if lo == 0:
+                curr[0] = delete_weight * i
+            else:
+                curr[lo - 1] = math.inf
+            for j in range(max(lo, 1), hi + 1):
+                curr[j] = min(
+                    prev[j - 1]
+                    + (substite_weight if str1[i - 1] != str2[j - 1] else match_weight),
+                    curr[j - 1] + insert_weight,
+                    prev[j] + delete_weight,
                 )
-        return dist[n, m]
+            if max_distance is not None and min(curr[lo : hi + 1]) > max_distance:
+                return float("inf")
+            prev, curr = curr, prev
+
+        dist = float(prev[m])
+        if max_distance is not None and dist > max_distance:
+            return float("inf")
+        return dist
 
+    @cached_method()
+    @instrumented_method(quadratic_cells)
+    def edit_script(
+        self,
+        str1: Union[str, List[str]],
+        str2: Union[str, List[str]],
+    ) -> Tuple[float, List[Tuple[str, int, int]]]:
+        """
+        Definition:
+        Returns the weighted Levenshtein edit distance between two strings (or lists of strings), together with an optimal edit script that transforms str1 into str2.
+        The edit script is a list of (operation, i, j) triples in left-to-right order, where operation is "match", "substitute", "delete", or "insert":
+            - "match" and "substitute" align str1[i] with str2[j],
+            - "delete" deletes str1[i] (j is the current position in str2),
+            - "insert" inserts str2[j] (i is the current position in str1).
+
+        Notes:
+        (a) The edit script is computed with Hirschberg's divide-and-conquer algorithm (see hirschberg.py), in O(nm) time and O(n + m) space, so it can align inputs that are too long for the full distance matrix.
+        (b) The distance is the total weight of the operations of the script, and it is equal to levenshtein_edit_distance(str1, str2).
+        """
+        from string2string.hirschberg import hirschberg_edit_script
+        from string2string.wavefront import encode_pair
+
+        codes1, codes2 = encode_pair(*self._prepare_pair(str1, str2)[:2])
+        operations = hirschberg_edit_script(
+            codes1,
+            codes2,
+            self.insert_weight,
+            self.delete_weight,
+            self.match_weight,
+            self.substite_weight,
+        )
+        weights = {
+            "match": self.match_weight,
+            "substitute": self.substite_weight,
+            "delete": self.delete_weight,
+            "insert": self.insert_weight,
+        }
+        distance = sum(weights[operation] for operation, _, _ in operations)
+        return float(distance), operations
+
+    @cached_method(symmetric=lambda algs: algs.insert_weight == algs.delete_weight)
+    @instrumented_method(quadratic_cells)
     def damerau_levenshtein_edit_distance(
-        self, str1: Union[str, List[str]], str2: Union[str, List[str]]
+        self,
+        str1: Union[str, List[str]],
+        str2: Union[str, List[str]],
+        max_distance: Optional[float] = None,
+        restricted: bool = True,
     ) -> float:
         """
         Definition:
@@ -115,32 +427,92 @@ class EditDistAlgs:
 
         Notes:
         (a) Damerau–Levenshtein operations := Levenshtein edit distance operations + adjacent transposition.
-        (b) The dynamic programming solution to this problem uses a simple extensension of the Wagner-Fisher algorithm. It therefore admits a quadratic space and time complexity.
+        (b) The dynamic programming solution to this problem uses a simple extensension of the Wagner-Fisher algorithm. It therefore admits a quadratic time complexity.
+        (c) Since only the distance is returned, the implementation keeps three rows of the distance matrix, so its space complexity is O(min(n, m)).
+        (d) If max_distance is given, the function returns float("inf") whenever the distance exceeds max_distance, and only fills the diagonal band of the distance matrix that a path of cost at most max_distance can visit (see levenshtein_edit_distance).
+        (e) By default (restricted = True), this is the "optimal string alignment" distance: no substring is edited more than once, so, e.g., "ca" -> "abc" costs 3 (and not 2).
+            Under uniform costs (all the operations have the same weight, and matches are free), it is computed with Hyyrö's bit-parallel algorithm (see bit_parallel.py).
+        (f) If restricted is False, the function computes the (unrestricted) Damerau–Levenshtein distance, in which the transposed symbols may be separated by insertions and deletions (Lowrance and Wagner, 1975).
+            It is a metric (when insertions and deletions have the same weight), and it requires 2 x (transposition weight) >= insertion weight + deletion weight.
         """
 
+        # An infinite bound is no bound, and no distance is negative.
+        max_distance = _max_distance_bound(max_distance)
+        if max_distance is not None and max_distance < 0:
+            return float("inf")
+
+        # Common prefixes and suffixes do not change the distance when matches are free.
+        str1, str2, _ = self._prepare_pair(
+            str1, str2, strip_affix=self.match_weight == 0
+        )
+
+        if not restricted:
+            dist = self._unrestricted_damerau_levenshtein(str1, str2)
+            if max_distance is not None and dist > max_distance:
+                return float("inf")
+            return dist
+
+        # Under uniform costs, the bit-parallel engine computes the same distance word-parallel.
+        if (
+            self._has_uniform_costs()
+            and self.adjacent_transposition_weight == self.insert_weight
+        ):
+            if max_distance is None:
+                return self.insert_weight * float(hyyro_osa(str1, str2))
+            if self.insert_weight == 0:
+                return 0.0
+            max_units = int(max_distance // self.insert_weight)
+            units = hyyro_osa(str1, str2, max_distance=max_units)
+            return (
+                self.insert_weight * float(units)
+                if units <= max_units
+                else float("inf")
+            )
+
         # Lengths of strings str1 and str2, respectively.
         n = len(str1)
         m = len(str2)
 
-        # Initialization of the distance matrix of size (n+1) x (m+1)
-        dist = np.zeros((n + 1, m + 1))
-        for i in range(1, n + 1):
-            dist[i, 0] = self.delete_weight * i
-        for j in range(1, m + 1):
-            dist[0, j] = self.insert_weight * j
+        # As in the Levenshtein case, we keep only the last three rows of the distance matrix.
+        insert_weight, delete_weight = self.insert_weight, self.delete_weight
+        if m > n:
+            str1, str2 = str2, str1
+            n, m = m, n
+            insert_weight, delete_weight = delete_weight, insert_weight
+
+        # Diagonals (j - i) of the distance matrix that need to be filled.
+        # (An adjacent transposition stays on the same diagonal, so the band is the same as in the Levenshtein case.)
+        if max_distance is None:
+            lower, upper = -n, m
+        else:
+            band = self._diagonal_band(n, m, insert_weight, delete_weight, max_distance)
+            if band is None:
+                return float("inf")
+            lower, upper = math.ceil(band[0]), math.floor(band[1])
+        prev2, prev, curr = ([math.inf] * (m + 1) for _ in range(3))
+        match_weight = self.match_weight
+        substite_weight = self.substite_weight
+        adjacent_transposition_weight = self.adjacent_transposition_weight
+
+        # Initialization of the first row, i.e., dist[0, :]
+        for j in range(0, min(m, upper) + 1):
+            prev[j] = insert_weight * j
+        prev_lo, prev_hi = 0, min(m, upper)
 
         # Dynamic programming solution (similar to the Wagner-Fischer algorithm)
         for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                dist[i, j] = min(
-                    dist[i - 1, j - 1]
-                    + (
-                        self.substite_weight
-                        if str1[i - 1] != str2[j - 1]
-                        else self.match_weight
-                    ),
-                    dist[i, j - 1] + self.insert_weight,
-                    dist[i - 1, j] + self.delete_weight,
+            lo = max(0, i + lower)
+            hi = min(m, i + upper)
+            if lo == 0:
+                curr[0] = delete_weight * i
+            else:
+                curr[lo - 1] = math.inf
+            for j in range(max(lo, 1), hi + 1):
+                curr[j] = min(
+                    prev[j - 1]
+                    + (substite_weight if str1[i - 1] != str2[j - 1] else match_weight),
+                    curr[j - 1] + insert_weight,
+                    prev[j] + delete_weight,
                 )
                 if (
                     i > 1
@@ -148,33 +520,129 @@ class EditDistAlgs:
                     and str1[i - 1] == str2[j - 2]
                     and str1[i - 2] == str2[j - 1]
                 ):
-                    dist[i, j] = min(
-                        dist[i, j],
-                        dist[i - 2, j - 2] + self.adjacent_transposition_weight,
+                    curr[j] = min(
+                        curr[j],
+                        prev2[j - 2] + adjacent_transposition_weight,
                     )
+            # A transposition can still reach the next row from the previous row.
+            if (
+                max_distance is not None
+                and min(curr[lo : hi + 1]) > max_distance
+                and min(prev[prev_lo : prev_hi + 1]) + adjacent_transposition_weight
+                > max_distance
+            ):
+                return float("inf")
+            prev2, prev, curr = prev, curr, prev2
+            prev_lo, prev_hi = lo, hi
+
+        dist = float(prev[m])
+        if max_distance is not None and dist > max_distance:
+            return float("inf")
+        return dist
 
-        return dist[n, m]
+    def _unrestricted_damerau_levenshtein(
+        self,
+        str1: Union[str, List[str], array],
+        str2: Union[str, List[str], array],
+    ) -> float:
+        """
+        Computes the (unrestricted) Damerau–Levenshtein distance with the algorithm of Lowrance and Wagner (1975).
 
+        Notes:
+        (a) For each symbol, the last row i' of str1 with str1[i'-1] equal to that symbol is recorded (the alphabet-indexed last-occurrence table), together with the row d[i'-1, :];
+            within a row, the last column j' with str2[j'-1] == str1[i-1] is tracked. The transposition of str1[i'-1] and str2[j'-1] then costs
+            d[i'-1, j'-1] + (i - i' - 1) x deletion + transposition + (j - j' - 1) x insertion.
+        (b) The time complexity is O(nm), and only the rows of the last occurrences are kept, so the space complexity is O(min(n, s) x m), where s is the size of the alphabet.
+        """
+        n = len(str1)
+        m = len(str2)
+        insert_weight = self.insert_weight
+        delete_weight = self.delete_weight
+        match_weight = self.match_weight
+        substite_weight = self.substite_weight
+        transposition_weight = self.adjacent_transposition_weight
+
+        # Last-occurrence table: symbol -> (i', d[i'-1, :])
+        last_occurrence = {}
+        prev = [insert_weight * j for j in range(m + 1)]
+        for i in range(1, n + 1):
+            symbol1 = str1[i - 1]
+            curr = [prev[0] + delete_weight]
+            left = curr[0]
+            # Last column j' (in this row) such that str2[j'-1] == str1[i-1]
+            last_match_column = 0
+            for j in range(1, m + 1):
+                symbol2 = str2[j - 1]
+                if symbol1 == symbol2:
+                    value = prev[j - 1] + match_weight
+                else:
+                    value = prev[j - 1] + substite_weight
+                if left + insert_weight < value:
+                    value = left + insert_weight
+                if prev[j] + delete_weight < value:
+                    value = prev[j] + delete_weight
+                if last_match_column:
+                    occurrence = last_occurrence.get(symbol2)
+                    if occurrence is not None:
+                        transposition = (
+                            occurrence[1][last_match_column - 1]
+                            + (i - occurrence[0] - 1) * delete_weight
+                            + transposition_weight
+                            + (j - last_match_column - 1) * insert_weight
+                        )
+                        if transposition < value:
+                            value = transposition
+                if symbol1 == symbol2:
+                    last_match_column = j
+                curr.append(value)
+                left = value
+            last_occurrence[symbol1] = (i, prev)
+            prev = curr
+        return float(prev[m])
+
+    @cached_method(symmetric=True)
+    @instrumented_method(linear_cells)
     def hamming_distance(
         self, str1: Union[str, List[str]], str2: Union[str, List[str]]
     ) -> float:
         """
         Definition:
         "Hamming distance" equals  the number of positions at which two equal-length strings differ.In other words, it refers to the minimum number of substitution operations needed to transformer one string into another.
+
+        Notes:
+        (a) For longer inputs, the positions are compared with a single vectorized NumPy operation (on the Unicode code points of strings, or on the integer ids of tokens).
+        (b) To compare a query against many fixed-length codes at once, see HammingIndex in hamming_index.py.
         """
+        str1, str2, _ = self._prepare_pair(str1, str2)
         if len(str1) != len(str2):
             raise ValueError(
                 "The lengths of the two strings (or lists of strings) must be equal."
             )
 
-        dist = 0.0
-        for i in range(len(str1)):
-            # This is a more abstract implementation of the Hamming distance function.
-            # In theory, it is possible for a match to have a cost as well.
-            # For instance, we might want to penalize longer strings.
-            dist += self.match_weight if str1[i] == str2[i] else self.substite_weight
-        return dist
-
+        n = len(str1)
+        if n >= HAMMING_VECTORIZE_MIN_LENGTH and (
+            isinstance(str1, str)
+            and isinstance(str2, str)
+            or isinstance(str1, array)
+            and isinstance(str2, array)
+        ):
+            import numpy as np
+            from string2string.wavefront import encode_pair
+
+            codes1, codes2 = encode_pair(str1, str2)
+            num_mismatches = int(np.count_nonzero(codes1 != codes2))
+        else:
+            num_mismatches = sum(map(operator.ne, str1, str2))
+        # This is a more abstract implementation of the Hamming distance function.
+        # In theory, it is possible for a match to have a cost as well.
+        # For instance, we might want to penalize longer strings.
+        return float(
+            num_mismatches * self.substite_weight
+            + (n - num_mismatches) * self.match_weight
+        )
+
+    @cached_method(symmetric=True)
+    @instrumented_method(linear_cells)
     def jaccard_similarity_coefficient(
         self, str1: Union[str, List[str]], str2: Union[str, List[str]]
     ) -> float:
@@ -182,7 +650,12 @@ class EditDistAlgs:
         Definition:
         "Jaccard similarity coefficient (index)" measures the similarity between two sets of strings (or lists of strings).
         It is equal to the ratio of the intersection over the union of the two sets.
+
+        Notes:
+        (a) To find the near-duplicates of a query in a large corpus without comparing it against every document, see LSHIndex in minhash.py.
+        (b) To compute the coefficients between all the documents of a corpus (or between queries and a corpus) at once, see JaccardCorpus in jaccard.py.
         """
+        str1, str2, _ = self._prepare_pair(str1, str2, encode_tokens=False)
         set1 = set(str1)
         set2 = set(str2)
         # Justification: In case both of them are empty strings.
@@ -190,6 +663,7 @@ class EditDistAlgs:
             return 1.0
         return (len(set1.intersection(set2))) / (float(len(set1.union(set2))))
 
+    @instrumented_method(linear_cells)
     def jaccard_index(
         self, str1: Union[str, List[str]], str2: Union[str, List[str]]
     ) -> float:
@@ -200,6 +674,8 @@ class EditDistAlgs:
         """
         return 1.0 - self.jaccard_similarity_coefficient(str1, str2)
 
+    @cached_method()
+    @instrumented_method(quadratic_cells)
     def longest_common_subsequence(
         self,
         str1: Union[str, List[str]],
@@ -215,11 +691,30 @@ class EditDistAlgs:
         (a) Note that a common subsequence is a sequence that appears in both strings in some increasing order, but it does not  necessarily have to be contigious.
         (b) The following dynamic programming solution has a quadratic (i.e., O(nm)) space and time complexity.
         (c) If the vocabulary is fixed, LCSubseq admits a "Four-Russians speedup," thereby reducing its overall time complexity to subquadratic (O(n^2/log n)).
+        (d) The backtracking step (printBacktrack = True) materializes all the longest common subsequences at once, which can take exponential time and memory on repetitive inputs.
+            See iter_longest_common_subsequences and count_longest_common_subsequences for a lazy (and bounded) alternative.
+        (e) Without backtracking, only the length is computed, with the bit-parallel algorithm of Allison-Dix and Hyyrö (see bit_parallel.py), in O(ceil(m/w) x n) time and O(m) space.
         """
+        # Without backtracking only the length is needed, so the common prefix and suffix are stripped (and counted).
+        str1, str2, num_stripped = self._prepare_pair(
+            str1,
+            str2,
+            encode_tokens=not printBacktrack,
+            strip_affix=not printBacktrack,
+        )
+        if not printBacktrack:
+            try:
+                return float(hyyro_lcs_length(str1, str2) + num_stripped), None
+            except TypeError:
+                # Unhashable tokens have no match vectors; they are compared with the dynamic programming below.
+                pass
+
         # Lengths of strings str1 and str2, respectively.
         n = len(str1)
         m = len(str2)
 
+        import numpy as np
+
         # Initialization of the matrix d of size (n+1) x (m+1)
         d = np.zeros((n + 1, m + 1))
 
@@ -266,8 +761,167 @@ class EditDistAlgs:
                 candidates = [
                     elt.split(self.list_of_list_separator) for elt in candidates
                 ]
-        return d[n, m], candidates
+        return d[n, m] + num_stripped, candidates
+
+    @cached_method()
+    @instrumented_method(quadratic_cells)
+    def one_longest_common_subsequence(
+        self,
+        str1: Union[str, List[str]],
+        str2: Union[str, List[str]],
+    ) -> Tuple[float, Union[str, List[str]]]:
+        """
+        Definition:
+        Returns the length of the longest common subsequence of two strings (or lists of strings), together with one such subsequence (a string for strings, and a list otherwise).
+
+        Notes:
+        (a) A longest common subsequence is given by the matches of an optimal edit script with unit insertion and deletion weights, and substitutions that cost as much as a deletion plus an insertion.
+            The edit script is computed with Hirschberg's algorithm, so only O(n + m) space is needed (unlike longest_common_subsequence with printBacktrack = True).
+        """
+        from string2string.hirschberg import hirschberg_edit_script
+        from string2string.wavefront import encode_pair
+
+        str1, str2, _ = self._prepare_pair(str1, str2, encode_tokens=False)
+        codes1, codes2 = encode_pair(str1, str2)
+        operations = hirschberg_edit_script(codes1, codes2, 1.0, 1.0, 0.0, 2.0)
+        subsequence = [
+            str1[i] for operation, i, _ in operations if operation == "match"
+        ]
+        if isinstance(str1, str):
+            subsequence = "".join(subsequence)
+        return float(len(subsequence)), subsequence
+
+    def _lcs_successors(
+        self, str1: Union[str, List[str]], str2: Union[str, List[str]]
+    ) -> Tuple[List[array], Callable[[int, int], Iterator[Tuple[str, int, int]]]]:
+        """
+        Returns the table L, where L[i][j] is the length of the longest common subsequence of str1[i:] and str2[j:], and a function that lists the successors of the state (i, j).
+        The successors of (i, j) are the triples (c, p+1, q+1), where p >= i and q >= j are the first occurrences of the symbol c in str1[i:] and str2[j:], and L[p+1][q+1] = L[i][j] - 1.
+        """
+        # Lengths of strings str1 and str2, respectively.
+        n = len(str1)
+        m = len(str2)
+
+        # Suffix table: L[i][j] = LCS(str1[i:], str2[j:]).
+        table = [array("i", [0]) * (m + 1) for _ in range(n + 1)]
+        for i in range(n - 1, -1, -1):
+            row, below = table[i], table[i + 1]
+            for j in range(m - 1, -1, -1):
+                if str1[i] == str2[j]:
+                    row[j] = below[j + 1] + 1
+                else:
+                    row[j] = max(below[j], row[j + 1])
+
+        # Positions of each symbol (in increasing order), for the symbols that appear in both inputs.
+        positions1 = {}
+        for i, symbol in enumerate(str1):
+            positions1.setdefault(symbol, []).append(i)
+        positions2 = {}
+        for j, symbol in enumerate(str2):
+            if symbol in positions1:
+                positions2.setdefault(symbol, []).append(j)
+        alphabet = [symbol for symbol in positions1 if symbol in positions2]
+
+        def successors(i: int, j: int) -> Iterator[Tuple[str, int, int]]:
+            length = table[i][j]
+            for symbol in alphabet:
+                occurrences1 = positions1[symbol]
+                occurrences2 = positions2[symbol]
+                k = bisect_left(occurrences1, i)
+                l = bisect_left(occurrences2, j)
+                if k == len(occurrences1) or l == len(occurrences2):
+                    continue
+                p, q = occurrences1[k] + 1, occurrences2[l] + 1
+                if table[p][q] == length - 1:
+                    yield symbol, p, q
+
+        return table, successors
+
+    def iter_longest_common_subsequences(
+        self,
+        str1: Union[str, List[str]],
+        str2: Union[str, List[str]],
+        limit: Optional[int] = None,
+    ) -> Iterator[Union[str, List[str]]]:
+        """
+        Definition:
+        Lazily yields the distinct longest common subsequences of two strings (or lists of strings), one at a time.
+
+        Notes:
+        (a) Every longest common subsequence that starts with the symbol c can be matched against the first occurrences of c in both inputs. Hence, the longest common subsequences are enumerated by following, from each state (i, j), only the successors that start with a distinct symbol and keep the length optimal (see _lcs_successors).
+            Different successors yield different strings, so no deduplication is needed, and no branch ends without producing a result.
+        (b) The enumeration uses an explicit stack (i.e., it is not recursive), so it is not limited by Python's recursion limit.
+        (c) Building the suffix table takes O(nm) time and space; afterwards, each result is produced in O(L x s log n) time, where L is the length of the longest common subsequence and s is the size of the common alphabet.
+        (d) If limit is given, at most limit results are yielded. Strings are yielded for string inputs, and lists otherwise.
+        """
+        str1, str2, _ = self._prepare_pair(str1, str2, encode_tokens=False)
+        as_string = isinstance(str1, str) and isinstance(str2, str)
+        if limit is not None and limit <= 0:
+            return
+        table, successors = self._lcs_successors(str1, str2)
+
+        num_results = 0
+        path = []
+        stack = [successors(0, 0)] if table[0][0] > 0 else []
+        if not stack:
+            yield "" if as_string else []
+            return
+        while stack:
+            successor = next(stack[-1], None)
+            if successor is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+            symbol, i, j = successor
+            path.append(symbol)
+            if table[i][j] > 0:
+                stack.append(successors(i, j))
+                continue
+            yield "".join(path) if as_string else list(path)
+            num_results += 1
+            if limit is not None and num_results >= limit:
+                return
+            path.pop()
+
+    @cached_method(symmetric=True)
+    @instrumented_method(quadratic_cells)
+    def count_longest_common_subsequences(
+        self, str1: Union[str, List[str]], str2: Union[str, List[str]]
+    ) -> int:
+        """
+        Definition:
+        Returns the number of distinct longest common subsequences of two strings (or lists of strings), without enumerating them.
 
+        Notes:
+        (a) The count of a state (i, j) is the sum of the counts of its successors (see iter_longest_common_subsequences), and 1 if L[i][j] = 0.
+        (b) The counts are computed by dynamic programming over the reachable states (with an explicit stack), so the time complexity is O(nm + R x s log n), where R is the number of reachable states.
+        """
+        str1, str2, _ = self._prepare_pair(str1, str2, encode_tokens=False)
+        table, successors = self._lcs_successors(str1, str2)
+
+        counts = {}
+        stack = [(0, 0)]
+        while stack:
+            i, j = stack[-1]
+            if (i, j) in counts:
+                stack.pop()
+                continue
+            if table[i][j] == 0:
+                counts[i, j] = 1
+                stack.pop()
+                continue
+            children = [(p, q) for _, p, q in successors(i, j)]
+            pending = [child for child in children if child not in counts]
+            if pending:
+                stack.extend(pending)
+                continue
+            counts[i, j] = sum(counts[child] for child in children)
+            stack.pop()
+        return counts[0, 0]
+
+    @cached_method()
+    @instrumented_method(linear_cells)
     def longest_common_substring(
         self,
         str1: Union[str, List[str]],
@@ -280,44 +934,58 @@ class EditDistAlgs:
         "Longest common substring" (LCSubstring) of two strings is a substring of maximal length that appears in both of them.
 
         Notes:
-        (a) The following dynamic programming approach has a quadratic time and space complexity.
+        (a) A dynamic programming approach has a quadratic time and space complexity. Instead, the longest common substrings are found with the suffix automaton of the shorter string (see suffix_automaton.py), in O(n + m) time and O(min(n, m)) space.
+        (b) To compare a string (or list of strings) against many others, or to find the longest substring common to k strings, see SuffixAutomaton and multi_longest_common_substring.
         """
-        # Lengths of strings str1 and str2, respectively.
-        n = len(str1)
-        m = len(str2)
+        str1, str2, _ = self._prepare_pair(str1, str2, encode_tokens=False)
+
+        # The automaton is built on the shorter string.
+        if len(str2) < len(str1):
+            str1, str2 = str2, str1
+        max_length, candidates = SuffixAutomaton(str1).longest_common_substring(str2)
+
+        if not printBacktrack:
+            candidates = None
+        elif boolListOfList:
+            candidates = [list(cand) for cand in candidates]
+        else:
+            # Substrings of pre-encoded inputs are returned as lists of ids.
+            candidates = [
+                cand.tolist() if isinstance(cand, array) else cand
+                for cand in candidates
+            ]
+        return max_length, candidates
 
-        # Initialization of the matrix d of size (n+1) x (m+1)
-        # Here d[i,j] denotes the length of the longest common suffixes of substrings str1[:i] and str2[:j].
-        d = np.zeros((n + 1, m + 1)).astype(int)
 
-        max_length = 0
-        max_length_indices = []
-        for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                if str1[i - 1] == str2[j - 1]:
-                    d[i, j] = d[i - 1, j - 1] + 1
-                    if max_length < d[i, j]:
-                        max_length = d[i, j]
-                        max_length_indices = [i]
-                    elif max_length == d[i, j]:
-                        max_length_indices.append(i)
-                else:
-                    d[i, j] = 0
-        candidates = None
-        if printBacktrack:
-            candidates = [str1[(i - max_length) : i] for i in max_length_indices]
-            if boolListOfList:
-                candidates = list(
-                    set(
-                        [
-                            f"{self.list_of_list_separator}".join(cand)
-                            for cand in candidates
-                        ]
-                    )
-                )
-                candidates = [
-                    cand.split(self.list_of_list_separator) for cand in candidates
-                ]
-            else:
-                candidates = list(set(candidates))
-        return max_length, candidates
+# Metrics (i.e., methods of EditDistAlgs) that map a pair of inputs to a number, as supported by cdist and pdist (see pairwise.py) and by AsyncEditDistAlgs (see async_edit_distance.py).
+# (For longest_common_subsequence and longest_common_substring, the number is the length of the longest common subsequence or substring.)
+METRICS = (
+    "levenshtein_edit_distance",
+    "damerau_levenshtein_edit_distance",
+    "hamming_distance",
+    "jaccard_similarity_coefficient",
+    "jaccard_index",
+    "longest_common_subsequence",
+    "longest_common_substring",
+)
+
+
+def _metric_function(algs: EditDistAlgs, metric: str):
+    """
+    Returns the bound method of algs that computes the given metric.
+    """
+    if metric not in METRICS:
+        raise ValueError(
+            f"Unknown metric: {metric}. Supported metrics are: {', '.join(METRICS)}."
+        )
+    return getattr(algs, metric)
+
+
+def _is_symmetric(algs: EditDistAlgs, metric: str) -> bool:
+    """
+    Returns True if metric(a, b) == metric(b, a) for all a, b under the weights of algs.
+    """
+    if metric in ("levenshtein_edit_distance", "damerau_levenshtein_edit_distance"):
+        # Swapping the inputs swaps the roles of insertions and deletions.
+        return algs.insert_weight == algs.delete_weight
+    return True
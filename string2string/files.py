@@ -0,0 +1,296 @@
+"""
+    Streaming (memory-mapped) comparison of large files
+        [x] Levenshtein edit distance in linear space (bit-parallel for unit costs, running-minimum rows otherwise)
+        [x] Hamming distance in constant memory
+        [x] Jaccard similarity coefficient over the sets of lines (or bytes) of two files
+    A file is read either as a sequence of bytes (unit="byte") or as a sequence of lines (unit="line").
+    Lines are compared through their 64-bit BLAKE2b digests, so they are never materialized as Python strings.
+"""
+
+# Import relevant libraries and dependencies
+import mmap
+import os
+from array import array
+from hashlib import blake2b
+from typing import Dict, Iterator, Optional, Tuple
+import numpy as np
+
+from string2string.bit_parallel import myers_scan
+from string2string.edit_distance import EditDistAlgs
+from string2string.hirschberg import next_shifted_row
+
+# Units in which a file can be read.
+UNITS = ("byte", "line")
+
+# Number of bytes (or lines) processed at a time.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Substitution cost vectors are cached per distinct symbol as long as they take at most this many entries in total.
+_MAX_CACHED_ENTRIES = 1 << 22
+
+
+def _check_unit(unit: str) -> None:
+    if unit not in UNITS:
+        raise ValueError(
+            f"Unknown unit: {unit}. Supported units are: {', '.join(UNITS)}."
+        )
+
+
+def map_file(path: str) -> np.ndarray:
+    """
+    Memory-maps a file (read-only) and returns its contents as a NumPy array of bytes (uint8) without copying them.
+    The map is released once the array (and every view of it) is garbage-collected.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be memory-mapped.
+            return np.zeros(0, dtype=np.uint8)
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return np.frombuffer(mapped, dtype=np.uint8)
+
+
+def line_digest(line: bytes) -> int:
+    """
+    Returns the 64-bit BLAKE2b digest of a line (as an unsigned integer).
+    """
+    return int.from_bytes(blake2b(line, digest_size=8).digest(), "little")
+
+
+def iter_line_digests(path: str) -> Iterator[int]:
+    """
+    Yields the digests (see line_digest) of the lines of a file, without their line terminators (b"\\n"), one line at a time.
+    A final line without a terminator is a line as well; an empty file has no lines.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line_digest(line[:-1] if line.endswith(b"\n") else line)
+
+
+def count_lines(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Returns the number of lines of a file (see iter_line_digests).
+    """
+    codes = map_file(path)
+    if len(codes) == 0:
+        return 0
+    num_newlines = sum(
+        int(np.count_nonzero(codes[start : start + chunk_size] == ord("\n")))
+        for start in range(0, len(codes), chunk_size)
+    )
+    return num_newlines + int(codes[-1] != ord("\n"))
+
+
+def _line_digest_array(path: str) -> np.ndarray:
+    """
+    Returns the digests of the lines of a file as a NumPy array (8 bytes per line).
+    """
+    digests = array("Q", iter_line_digests(path))
+    return (
+        np.frombuffer(digests, dtype=np.uint64) if digests else np.zeros(0, np.uint64)
+    )
+
+
+def _iter_chunks(codes: np.ndarray, chunk_size: int) -> Iterator[int]:
+    """
+    Yields the entries of an array as Python integers, converting one chunk at a time.
+    """
+    for start in range(0, len(codes), chunk_size):
+        yield from codes[start : start + chunk_size].tolist()
+
+
+def _byte_counts(codes: np.ndarray, chunk_size: int) -> np.ndarray:
+    """
+    Returns the number of occurrences of each of the 256 byte values in an array of bytes.
+    """
+    counts = np.zeros(256, dtype=np.int64)
+    for start in range(0, len(codes), chunk_size):
+        counts += np.bincount(codes[start : start + chunk_size], minlength=256)
+    return counts
+
+
+def _byte_match_vectors(codes: np.ndarray, chunk_size: int) -> Dict[int, int]:
+    """
+    Returns the match vectors of a sequence of bytes (see pattern_match_vectors in bit_parallel.py), built with NumPy one chunk at a time.
+    """
+    # Chunks of a multiple of 8 bytes pack into whole bytes of the vectors.
+    chunk_size = max(8, chunk_size - chunk_size % 8)
+    peq = {}
+    for symbol in np.flatnonzero(_byte_counts(codes, chunk_size)).tolist():
+        packed = b"".join(
+            np.packbits(
+                codes[start : start + chunk_size] == symbol, bitorder="little"
+            ).tobytes()
+            for start in range(0, len(codes), chunk_size)
+        )
+        peq[symbol] = int.from_bytes(packed, "little")
+    return peq
+
+
+def _weighted_levenshtein(
+    text: Iterator[int],
+    pattern: np.ndarray,
+    insert_weight: float,
+    delete_weight: float,
+    match_weight: float,
+    substite_weight: float,
+) -> float:
+    """
+    Returns the weighted Levenshtein edit distance between a stream of symbols (text) and an array of symbols (pattern), keeping a single row of the distance matrix over the pattern.
+    """
+    m = len(pattern)
+    row = np.zeros(m + 1)
+    costs = {}
+    for symbol in text:
+        cost = costs.get(symbol)
+        if cost is None:
+            cost = np.where(pattern == symbol, match_weight, substite_weight)
+            cost -= insert_weight
+            if (len(costs) + 1) * m <= _MAX_CACHED_ENTRIES:
+                costs[symbol] = cost
+        row = next_shifted_row(row, cost, delete_weight)
+    return float(row[m] + m * insert_weight)
+
+
+def file_levenshtein_edit_distance(
+    path1: str,
+    path2: str,
+    unit: str = "byte",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> float:
+    """
+    Definition:
+    Returns the Levenshtein edit distance between the contents of two files, read as sequences of bytes or lines (see unit), under the weights of algs (by default, EditDistAlgs()).
+
+    Notes:
+    (a) Only the shorter sequence is held in memory (as a memory-mapped array of bytes, or as an array of 8-byte line digests), together with a single row (or column) of the distance matrix; the longer one is streamed.
+    (b) Under unit costs, the bytes are compared with Myers' bit-vector algorithm (see bit_parallel.py), whose column takes m / 8 bytes; otherwise, each row is computed with a handful of NumPy operations (see hirschberg.py) and takes 8m bytes.
+    (c) The time complexity is still O(nm), so this is meant for files of up to a few megabytes (or lines); for near-duplicate detection of larger files, see file_jaccard_similarity_coefficient.
+    """
+    _check_unit(unit)
+    algs = algs if algs is not None else EditDistAlgs()
+    insert_weight = algs.insert_weight
+    delete_weight = algs.delete_weight
+
+    if unit == "line":
+        n = count_lines(path1, chunk_size)
+        m = count_lines(path2, chunk_size)
+        if n < m:
+            # The pattern is the shorter sequence; swapping the inputs swaps the roles of insertions and deletions.
+            path1, path2 = path2, path1
+            insert_weight, delete_weight = delete_weight, insert_weight
+        pattern = _line_digest_array(path2)
+        return _weighted_levenshtein(
+            iter_line_digests(path1),
+            pattern,
+            insert_weight,
+            delete_weight,
+            algs.match_weight,
+            algs.substite_weight,
+        )
+
+    if os.path.getsize(path1) < os.path.getsize(path2):
+        path1, path2 = path2, path1
+        insert_weight, delete_weight = delete_weight, insert_weight
+    text = map_file(path1)
+    pattern = map_file(path2)
+    n = len(text)
+    m = len(pattern)
+    if m == 0:
+        return float(n * delete_weight)
+    if algs._has_uniform_costs():
+        peq = _byte_match_vectors(pattern, chunk_size)
+        distance = myers_scan(peq, m, _iter_chunks(text, chunk_size), n)
+        return float(distance * algs.substite_weight)
+    return _weighted_levenshtein(
+        _iter_chunks(text, chunk_size),
+        pattern,
+        insert_weight,
+        delete_weight,
+        algs.match_weight,
+        algs.substite_weight,
+    )
+
+
+def file_hamming_distance(
+    path1: str,
+    path2: str,
+    unit: str = "byte",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> float:
+    """
+    Definition:
+    Returns the Hamming distance between the contents of two files of the same length, read as sequences of bytes or lines (see unit), under the weights of algs (by default, EditDistAlgs()).
+
+    Notes:
+    (a) The files are compared one chunk of bytes (or one pair of lines) at a time, so the memory usage does not depend on their sizes.
+    (b) A ValueError is raised if the files do not have the same number of bytes (or lines).
+    """
+    _check_unit(unit)
+    algs = algs if algs is not None else EditDistAlgs()
+    num_mismatches = 0
+    if unit == "byte":
+        codes1 = map_file(path1)
+        codes2 = map_file(path2)
+        n = len(codes1)
+        if n != len(codes2):
+            raise ValueError("The two files must have the same number of bytes.")
+        for start in range(0, n, chunk_size):
+            num_mismatches += int(
+                np.count_nonzero(
+                    codes1[start : start + chunk_size]
+                    != codes2[start : start + chunk_size]
+                )
+            )
+    else:
+        n = 0
+        digests2 = iter_line_digests(path2)
+        for digest1 in iter_line_digests(path1):
+            digest2 = next(digests2, None)
+            if digest2 is None:
+                raise ValueError("The two files must have the same number of lines.")
+            n += 1
+            num_mismatches += digest1 != digest2
+        if next(digests2, None) is not None:
+            raise ValueError("The two files must have the same number of lines.")
+    return float(
+        num_mismatches * algs.substite_weight + (n - num_mismatches) * algs.match_weight
+    )
+
+
+def _distinct_symbols(path: str, unit: str, chunk_size: int) -> Tuple[np.ndarray, int]:
+    """
+    Returns the sorted distinct symbols (bytes or line digests) of a file, and its length.
+    """
+    if unit == "line":
+        digests = _line_digest_array(path)
+        return np.unique(digests), len(digests)
+    codes = map_file(path)
+    return np.flatnonzero(_byte_counts(codes, chunk_size)), len(codes)
+
+
+def file_jaccard_similarity_coefficient(
+    path1: str,
+    path2: str,
+    unit: str = "line",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> float:
+    """
+    Definition:
+    Returns the Jaccard similarity coefficient between the sets of lines (or bytes, see unit) of two files, i.e., the ratio of the intersection over the union of the two sets.
+
+    Notes:
+    (a) Each line is represented by its 64-bit digest, so the sets take 8 bytes per line (the probability that two distinct lines collide is negligible, about n^2 / 2^65 for n lines).
+    (b) As in EditDistAlgs.jaccard_similarity_coefficient, two empty files have a coefficient of 1.
+    """
+    _check_unit(unit)
+    set1, n = _distinct_symbols(path1, unit, chunk_size)
+    set2, m = _distinct_symbols(path2, unit, chunk_size)
+    if n == 0 and m == 0:
+        return 1.0
+    intersection = len(np.intersect1d(set1, set2, assume_unique=True))
+    return intersection / float(len(set1) + len(set2) - intersection)
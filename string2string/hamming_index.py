@@ -0,0 +1,165 @@
+"""
+    Batch (1-vs-N) Hamming distance over a corpus of equal-length codes
+        [x] Bit-packed rows for binary alphabets (XOR + popcount)
+        [x] Integer-encoded rows otherwise
+"""
+
+# Import relevant libraries and dependencies
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.vocabulary import Vocabulary
+
+# Number of set bits of each byte value.
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], np.uint8)
+
+# Symbols of binary codes.
+_BINARY_SYMBOLS = ({"0", "1"}, {0, 1})
+
+
+class HammingIndex:
+    """
+    Class for computing the Hamming distances between a query and every code of a corpus in a single vectorized call
+    """
+
+    def __init__(
+        self,
+        codes: Sequence[Union[str, List[str]]],
+        algs: Optional[EditDistAlgs] = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        """
+        Packs a corpus of equal-length codes (strings or lists of tokens) into a 2-D array.
+            - Binary codes (over the symbols "0"/"1" or 0/1) are bit-packed, eight positions per byte.
+            - Other strings are stored as Unicode code points, and other lists of tokens as vocabulary ids.
+        The match and substitution weights of algs (by default, EditDistAlgs()) determine the distances; chunk_size is the number of rows processed per vectorized step.
+        """
+        self.algs = algs if algs is not None else EditDistAlgs()
+        self.chunk_size = chunk_size
+        self.vocabulary = None
+        self.code_length = len(codes[0]) if len(codes) else 0
+        if any(len(code) != self.code_length for code in codes):
+            raise ValueError("All the codes must have the same length.")
+
+        symbols = set()
+        for code in codes:
+            symbols.update(code)
+            if len(symbols) > 2:
+                break
+        self.is_binary = len(codes) > 0 and any(
+            symbols <= binary for binary in _BINARY_SYMBOLS
+        )
+        if self.is_binary:
+            self.rows = np.packbits(self._binary_matrix(codes), axis=1)
+        elif len(codes) and all(isinstance(code, str) for code in codes):
+            self.rows = np.frombuffer(
+                "".join(codes).encode("utf-32-le"), dtype=np.uint32
+            ).reshape(len(codes), self.code_length)
+        else:
+            self.vocabulary = Vocabulary()
+            self.rows = np.array(
+                [self.vocabulary.encode(code) for code in codes], dtype=np.int64
+            ).reshape(len(codes), self.code_length)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _binary_matrix(self, codes: Sequence[Union[str, List[str]]]) -> np.ndarray:
+        """
+        Returns the 0/1 matrix of binary codes (one row per code).
+        """
+        if all(isinstance(code, str) for code in codes):
+            matrix = np.frombuffer("".join(codes).encode("ascii"), dtype=np.uint8) - 48
+        else:
+            matrix = np.array([int(symbol) for code in codes for symbol in code])
+        return matrix.astype(np.uint8).reshape(len(codes), self.code_length)
+
+    def _check_length(self, query: Union[str, List[str]]) -> None:
+        """
+        Raises a ValueError if the query does not have the same length as the codes of the index.
+        """
+        if len(query) != self.code_length:
+            raise ValueError(
+                "The query must have the same length as the codes of the index."
+            )
+
+    def _encode_query(self, query: Union[str, List[str]]) -> np.ndarray:
+        """
+        Encodes the query in the same way as the rows of the index. Symbols that cannot occur in the rows are encoded as -1 (and never match).
+        """
+        if self.vocabulary is not None:
+            symbol_to_id = self.vocabulary.symbol_to_id
+            return np.array(
+                [symbol_to_id.get(symbol, -1) for symbol in query], np.int64
+            )
+        if isinstance(query, str):
+            return np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32).astype(
+                np.int64
+            )
+        return np.array(
+            [
+                ord(symbol) if isinstance(symbol, str) and len(symbol) == 1 else -1
+                for symbol in query
+            ],
+            np.int64,
+        )
+
+    def mismatches(self, query: Union[str, List[str]]) -> np.ndarray:
+        """
+        Returns the number of positions at which the query differs from each code of the index.
+        """
+        self._check_length(query)
+        counts = np.empty(len(self.rows), dtype=np.int64)
+
+        if self.is_binary:
+            # Positions with a non-binary symbol are encoded as 0s in the query, but they never match.
+            invalid = [symbol not in (0, 1, "0", "1") for symbol in query]
+            num_invalid = sum(invalid)
+            packed_query = np.packbits(
+                np.array([symbol in (1, "1") for symbol in query], dtype=np.uint8)
+            )
+            packed_invalid = np.packbits(np.array(invalid, dtype=np.uint8))
+            for start in range(0, len(self.rows), self.chunk_size):
+                chunk = self.rows[start : start + self.chunk_size]
+                chunk_counts = _POPCOUNT_TABLE[chunk ^ packed_query].sum(
+                    axis=1, dtype=np.int64
+                )
+                if num_invalid:
+                    chunk_counts += num_invalid - _POPCOUNT_TABLE[
+                        chunk & packed_invalid
+                    ].sum(axis=1, dtype=np.int64)
+                counts[start : start + len(chunk)] = chunk_counts
+            return counts
+
+        encoded_query = self._encode_query(query)
+        for start in range(0, len(self.rows), self.chunk_size):
+            chunk = self.rows[start : start + self.chunk_size]
+            counts[start : start + len(chunk)] = np.count_nonzero(
+                chunk != encoded_query, axis=1
+            )
+        return counts
+
+    def distances(self, query: Union[str, List[str]]) -> np.ndarray:
+        """
+        Returns the Hamming distance between the query and each code of the index (as hamming_distance of EditDistAlgs would).
+        """
+        num_mismatches = self.mismatches(query)
+        return (
+            num_mismatches * self.algs.substite_weight
+            + (self.code_length - num_mismatches) * self.algs.match_weight
+        ).astype(np.float64)
+
+    def top_k(
+        self, query: Union[str, List[str]], k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indices of the k codes that are closest to the query, and their distances, in increasing order of distance.
+        """
+        dist = self.distances(query)
+        k = min(k, len(dist))
+        if k <= 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        indices = np.argpartition(dist, k - 1)[:k]
+        indices = indices[np.argsort(dist[indices], kind="stable")]
+        return indices, dist[indices]
@@ -0,0 +1,218 @@
+"""
+    Hirschberg's divide-and-conquer algorithm for the optimal edit script (alignment) under the weighted Levenshtein edit distance, in linear space.
+    Every row of the distance matrix is computed with a handful of NumPy operations (a running minimum).
+"""
+
+# Import relevant libraries and dependencies
+from typing import Iterator, List, Tuple
+import numpy as np
+
+# Subproblems with at most this many cells are solved with the full distance matrix (and a traceback).
+BASE_CASE_CELLS = 1 << 16
+
+# Relative tolerance of the traceback (the rows are computed with floating-point running minima).
+_TOLERANCE = 1e-9
+
+
+def _close(value: float, target: float) -> bool:
+    return abs(value - target) <= _TOLERANCE * (1.0 + abs(value))
+
+
+# Substitution cost vectors are precomputed per distinct symbol as long as they take at most this many entries in total.
+_MAX_PRECOMPUTED_ENTRIES = 1 << 22
+
+
+def _shifted_rows(
+    codes1: np.ndarray,
+    codes2: np.ndarray,
+    insert_weight: float,
+    delete_weight: float,
+    match_weight: float,
+    substite_weight: float,
+) -> Iterator[np.ndarray]:
+    """
+    Yields the rows d[i, :] - j * ins (for i = 0, ..., n) of the distance matrix of two integer-encoded sequences.
+
+    Notes:
+    (a) In the shifted coordinates P[i, j] = d[i, j] - j * ins, insertions become free moves along a row, so
+        P[i, j] = min_{j' <= j} T[j'], where T[j'] = min(P[i-1, j'-1] + sub(i, j') - ins, P[i-1, j'] + del).
+        Each row is therefore a running minimum (np.minimum.accumulate), and it takes a handful of vectorized operations.
+    """
+    m = len(codes2)
+    row = np.zeros(m + 1)
+    yield row
+    symbols = np.unique(codes1)
+    costs = {}
+    if len(symbols) * m <= _MAX_PRECOMPUTED_ENTRIES:
+        for symbol in symbols.tolist():
+            costs[symbol] = (
+                np.where(codes2 == symbol, match_weight, substite_weight)
+                - insert_weight
+            )
+    for symbol in codes1.tolist():
+        cost = costs.get(symbol)
+        if cost is None:
+            cost = (
+                np.where(codes2 == symbol, match_weight, substite_weight)
+                - insert_weight
+            )
+        row = next_shifted_row(row, cost, delete_weight)
+        yield row
+
+
+def next_shifted_row(
+    row: np.ndarray, cost: np.ndarray, delete_weight: float
+) -> np.ndarray:
+    """
+    Returns the next shifted row (see _shifted_rows), given the current one and the vector cost[j] = sub(i, j+1) - ins of the next symbol.
+    """
+    next_row = np.empty(len(row))
+    next_row[0] = row[0] + delete_weight
+    np.add(row[:-1], cost, out=next_row[1:])
+    np.minimum(next_row[1:], row[1:] + delete_weight, out=next_row[1:])
+    np.minimum.accumulate(next_row, out=next_row)
+    return next_row
+
+
+def last_row(
+    codes1: np.ndarray,
+    codes2: np.ndarray,
+    insert_weight: float = 1.0,
+    delete_weight: float = 1.0,
+    match_weight: float = 0.0,
+    substite_weight: float = 1.0,
+) -> np.ndarray:
+    """
+    Returns the last row d[n, :] of the (n+1) x (m+1) distance matrix of two integer-encoded sequences, in O(m) space.
+    """
+    codes1 = np.asarray(codes1, dtype=np.intp)
+    codes2 = np.asarray(codes2, dtype=np.intp)
+    for row in _shifted_rows(
+        codes1, codes2, insert_weight, delete_weight, match_weight, substite_weight
+    ):
+        pass
+    return row + np.arange(len(codes2) + 1) * insert_weight
+
+
+def _full_edit_script(
+    codes1: np.ndarray,
+    codes2: np.ndarray,
+    offset1: int,
+    offset2: int,
+    insert_weight: float,
+    delete_weight: float,
+    match_weight: float,
+    substite_weight: float,
+) -> List[Tuple[str, int, int]]:
+    """
+    Returns an optimal edit script of a (small) subproblem with the full distance matrix and a traceback.
+    """
+    n = len(codes1)
+    m = len(codes2)
+    d = np.array(
+        list(
+            _shifted_rows(
+                codes1,
+                codes2,
+                insert_weight,
+                delete_weight,
+                match_weight,
+                substite_weight,
+            )
+        )
+    )
+    d += np.arange(m + 1) * insert_weight
+
+    # Traceback (diagonal moves first, then deletions, then insertions).
+    d = d.tolist()
+    codes1 = codes1.tolist()
+    codes2 = codes2.tolist()
+    operations = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            same = codes1[i - 1] == codes2[j - 1]
+            cost = match_weight if same else substite_weight
+            if _close(d[i][j], d[i - 1][j - 1] + cost):
+                operations.append(
+                    (
+                        "match" if same else "substitute",
+                        offset1 + i - 1,
+                        offset2 + j - 1,
+                    )
+                )
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and _close(d[i][j], d[i - 1][j] + delete_weight):
+            operations.append(("delete", offset1 + i - 1, offset2 + j))
+            i -= 1
+        else:
+            operations.append(("insert", offset1 + i, offset2 + j - 1))
+            j -= 1
+    operations.reverse()
+    return operations
+
+
+def hirschberg_edit_script(
+    codes1: np.ndarray,
+    codes2: np.ndarray,
+    insert_weight: float = 1.0,
+    delete_weight: float = 1.0,
+    match_weight: float = 0.0,
+    substite_weight: float = 1.0,
+) -> List[Tuple[str, int, int]]:
+    """
+    Definition:
+    Returns an optimal edit script that transforms codes1 into codes2 under the weighted Levenshtein edit distance, as a list of (operation, i, j) triples in left-to-right order:
+        - ("match", i, j) and ("substitute", i, j) align codes1[i] with codes2[j],
+        - ("delete", i, j) deletes codes1[i] (j is the current position in codes2),
+        - ("insert", i, j) inserts codes2[j] (i is the current position in codes1).
+
+    Notes:
+    (a) Hirschberg (1975): the middle row of codes1 is aligned with the column k that minimizes the sum of the forward distance d[n/2, k] and the distance between the reversed remainders,
+        and the two halves are solved independently. Only O(n + m) memory is needed for the rows.
+    (b) The time complexity is O(nm) (about twice the cost of computing the distance alone).
+    (c) Subproblems with at most BASE_CASE_CELLS cells are solved with their full distance matrix.
+    (d) The rows run over the longer sequence (the other one is iterated over in Python), so the inputs are swapped if codes1 is the longer one.
+    """
+    codes1 = np.asarray(codes1, dtype=np.intp)
+    codes2 = np.asarray(codes2, dtype=np.intp)
+    if len(codes1) > len(codes2):
+        # Swapping the inputs swaps the roles of insertions and deletions.
+        operations = hirschberg_edit_script(
+            codes2, codes1, delete_weight, insert_weight, match_weight, substite_weight
+        )
+        swapped = {"delete": "insert", "insert": "delete"}
+        return [
+            (swapped.get(operation, operation), j, i) for operation, i, j in operations
+        ]
+    weights = (insert_weight, delete_weight, match_weight, substite_weight)
+    operations = []
+
+    # Subproblems (start1, stop1, start2, stop2), solved in left-to-right order.
+    stack = [(0, len(codes1), 0, len(codes2))]
+    while stack:
+        start1, stop1, start2, stop2 = stack.pop()
+        n = stop1 - start1
+        m = stop2 - start2
+        if n <= 1 or (n + 1) * (m + 1) <= BASE_CASE_CELLS:
+            operations.extend(
+                _full_edit_script(
+                    codes1[start1:stop1],
+                    codes2[start2:stop2],
+                    start1,
+                    start2,
+                    *weights,
+                )
+            )
+            continue
+        middle = start1 + n // 2
+        forward = last_row(codes1[start1:middle], codes2[start2:stop2], *weights)
+        backward = last_row(
+            codes1[middle:stop1][::-1], codes2[start2:stop2][::-1], *weights
+        )[::-1]
+        split = start2 + int(np.argmin(forward + backward))
+        stack.append((middle, stop1, split, stop2))
+        stack.append((start1, middle, start2, split))
+    return operations
@@ -0,0 +1,177 @@
+"""
+    Incremental edit distances for a query that grows (or shrinks) one symbol at a time, e.g., in type-ahead search
+        [x] Appending a symbol to the query in O(m) time per candidate (one new row of each distance matrix)
+        [x] Removing the last symbol (backspace) in O(1) time per candidate
+        [x] Levenshtein and (restricted) Damerau-Levenshtein edit distances
+        [x] Distances to whole candidates and to their best-matching prefixes
+"""
+
+# Import relevant libraries and dependencies
+import heapq
+from typing import Iterable, List, Optional, Tuple, Union
+
+from string2string.edit_distance import EditDistAlgs
+
+# Metrics (i.e., methods of EditDistAlgs) supported by the sessions.
+METRICS = (
+    "levenshtein_edit_distance",
+    "damerau_levenshtein_edit_distance",
+)
+
+
+class IncrementalSession:
+    """
+    Class for the edit distances between a query that is edited at its end and a fixed collection of candidates (strings, or lists of strings)
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[Union[str, List[str]]],
+        metric: str = "levenshtein_edit_distance",
+        algs: Optional[EditDistAlgs] = None,
+    ) -> None:
+        """
+        Starts a session with an empty query; the distance of a candidate is metric(query, candidate) under the weights of algs (by default, EditDistAlgs()).
+
+        Notes:
+        (a) For each candidate, the session keeps the rows dist[0, :], ..., dist[n, :] of the distance matrix of the query (of length n) and the candidate, i.e., one row per symbol of the query.
+            Appending a symbol computes one more row from the last one (and, for the Damerau-Levenshtein distance, the one before it); removing a symbol discards the last row.
+        (b) For the Damerau-Levenshtein distance, only the restricted variant (optimal string alignment, the default of EditDistAlgs) is supported.
+        """
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unknown metric: {metric}. Supported metrics are: {', '.join(METRICS)}."
+            )
+        self.algs = algs if algs is not None else EditDistAlgs()
+        self.metric = metric
+        self.candidates: List[Union[str, List[str]]] = list(candidates)
+        self.symbols: List = []
+        # rows[c][i] is the row dist[i, :] of the candidate c.
+        insert_weight = self.algs.insert_weight
+        self.rows: List[List[List[float]]] = [
+            [[float(insert_weight * j) for j in range(len(candidate) + 1)]]
+            for candidate in self.candidates
+        ]
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    @property
+    def query(self) -> Union[str, List]:
+        """
+        Returns the current query (a string if all its symbols are single characters, and a list of symbols otherwise).
+        """
+        if all(isinstance(symbol, str) and len(symbol) == 1 for symbol in self.symbols):
+            return "".join(self.symbols)
+        return list(self.symbols)
+
+    def append(self, symbol) -> None:
+        """
+        Appends a symbol (a character, or a token) to the query, in O(m) time per candidate of length m.
+        """
+        algs = self.algs
+        insert_weight = algs.insert_weight
+        delete_weight = algs.delete_weight
+        match_weight = algs.match_weight
+        substite_weight = algs.substite_weight
+        adjacent_transposition_weight = algs.adjacent_transposition_weight
+        # The previous symbol of the query, for the adjacent transpositions
+        has_previous = (
+            self.metric == "damerau_levenshtein_edit_distance" and len(self.symbols) > 0
+        )
+        previous = self.symbols[-1] if has_previous else None
+        i = len(self.symbols) + 1
+
+        for candidate, rows in zip(self.candidates, self.rows):
+            prev = rows[-1]
+            curr = [float(delete_weight * i)]
+            for j in range(1, len(candidate) + 1):
+                value = min(
+                    prev[j - 1]
+                    + (match_weight if symbol == candidate[j - 1] else substite_weight),
+                    curr[j - 1] + insert_weight,
+                    prev[j] + delete_weight,
+                )
+                if (
+                    has_previous
+                    and j > 1
+                    and symbol == candidate[j - 2]
+                    and previous == candidate[j - 1]
+                ):
+                    value = min(value, rows[-2][j - 2] + adjacent_transposition_weight)
+                curr.append(value)
+            rows.append(curr)
+        self.symbols.append(symbol)
+
+    def extend(self, symbols: Iterable) -> None:
+        """
+        Appends the symbols to the query, one at a time.
+        """
+        for symbol in symbols:
+            self.append(symbol)
+
+    def backspace(self, count: int = 1) -> None:
+        """
+        Removes the last count symbols of the query (all of them if there are fewer), in O(count) time per candidate.
+        """
+        if count < 0:
+            raise ValueError("The number of symbols to remove cannot be negative.")
+        count = min(count, len(self.symbols))
+        if count == 0:
+            return
+        del self.symbols[-count:]
+        for rows in self.rows:
+            del rows[-count:]
+
+    def set_query(self, query: Union[str, List[str]]) -> None:
+        """
+        Replaces the query: the symbols after the common prefix of the current and the new query are removed, and the remaining symbols of the new query are appended.
+        """
+        prefix = 0
+        while (
+            prefix < min(len(self.symbols), len(query))
+            and self.symbols[prefix] == query[prefix]
+        ):
+            prefix += 1
+        self.backspace(len(self.symbols) - prefix)
+        self.extend(query[prefix:])
+
+    def distances(self) -> List[float]:
+        """
+        Returns the distance between the current query and each candidate.
+        """
+        return [rows[-1][-1] for rows in self.rows]
+
+    def prefix_distances(self) -> List[float]:
+        """
+        Returns, for each candidate, the smallest distance between the current query and a prefix of the candidate (e.g., "kitt" is within 0 of "kitten").
+        """
+        return [min(rows[-1]) for rows in self.rows]
+
+    def top_k(
+        self, k: int = 1, prefix: bool = False
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (candidate, distance) pairs of the k candidates that are closest to the current query, in increasing order of distance (ties are broken by the order of the candidates).
+        If prefix is True, the distances are the prefix distances (see prefix_distances).
+        """
+        if k <= 0:
+            raise ValueError("The number of results must be positive.")
+        distances = self.prefix_distances() if prefix else self.distances()
+        best = heapq.nsmallest(k, range(len(distances)), key=distances.__getitem__)
+        return [(self.candidates[index], distances[index]) for index in best]
+
+    def within(
+        self, max_distance: float, prefix: bool = False
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Returns the (candidate, distance) pairs of all the candidates within max_distance of the current query, in increasing order of distance (ties are broken by the order of the candidates).
+        If prefix is True, the distances are the prefix distances (see prefix_distances).
+        """
+        distances = self.prefix_distances() if prefix else self.distances()
+        matches = sorted(
+            (distance, index)
+            for index, distance in enumerate(distances)
+            if distance <= max_distance
+        )
+        return [(self.candidates[index], distance) for distance, index in matches]
@@ -0,0 +1,174 @@
+"""
+    Opt-in instrumentation of the methods of EditDistAlgs
+        [x] Per-method call counts, wall time, and number of cells of the dynamic programming matrices
+        [x] Histograms of the input lengths (in power-of-two buckets)
+        [x] Bytes allocated per call (with tracemalloc; off by default, since tracing slows down every allocation)
+        [x] Callback hook that receives one event per call (e.g., to forward them to a metrics system)
+"""
+
+# Import relevant libraries and dependencies
+import copy
+import functools
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+
+def quadratic_cells(n: int, m: int) -> int:
+    """
+    Returns the number of cells of the (n+1) x (m+1) dynamic programming matrix of two inputs of lengths n and m.
+    """
+    return (n + 1) * (m + 1)
+
+
+def linear_cells(n: int, m: int) -> int:
+    """
+    Returns the number of symbols scanned by a linear-time method on two inputs of lengths n and m.
+    """
+    return n + m
+
+
+def length_bucket(length: int) -> int:
+    """
+    Returns the histogram bucket of an input length: the smallest power of two that is at least the length (0 for empty inputs).
+    """
+    if length <= 0:
+        return 0
+    return 1 << (length - 1).bit_length()
+
+
+class Instrumentation:
+    """
+    Class for the counters of the instrumented methods of EditDistAlgs (see the instrumentation argument of EditDistAlgs)
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        trace_memory: bool = False,
+    ) -> None:
+        """
+        Creates empty counters.
+
+        Arguments:
+        (a) callback: If given, it is called after every instrumented call with an event, i.e., a dictionary with the keys
+            method, len1, len2, cells, seconds, and bytes_allocated (the peak of the memory traced during the call, or None if trace_memory is False).
+            Exceptions raised by the callback propagate to the caller.
+        (b) trace_memory: Whether to measure the memory allocated by each call with tracemalloc.
+            Only the outermost instrumented call is measured when calls are nested (e.g., jaccard_index calls jaccard_similarity_coefficient), and nothing is measured if tracemalloc is already tracing.
+        """
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.methods: Dict[str, Dict[str, Any]] = {}
+        # Depth of the instrumented calls in progress
+        self._depth = 0
+
+    def _method_stats(self, method: str) -> Dict[str, Any]:
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = {
+                "calls": 0,
+                "cells": 0,
+                "seconds": 0.0,
+                "max_seconds": 0.0,
+                "slowest_lengths": None,
+                "bytes_allocated": 0,
+                "max_bytes_allocated": 0,
+                "length_histogram": {},
+            }
+            self.methods[method] = stats
+        return stats
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """
+        Adds an event (see the callback argument) to the counters and passes it on to the callback.
+        """
+        stats = self._method_stats(event["method"])
+        stats["calls"] += 1
+        stats["cells"] += event["cells"]
+        stats["seconds"] += event["seconds"]
+        if event["seconds"] >= stats["max_seconds"]:
+            stats["max_seconds"] = event["seconds"]
+            stats["slowest_lengths"] = (event["len1"], event["len2"])
+        if event["bytes_allocated"] is not None:
+            stats["bytes_allocated"] += event["bytes_allocated"]
+            stats["max_bytes_allocated"] = max(
+                stats["max_bytes_allocated"], event["bytes_allocated"]
+            )
+        bucket = length_bucket(max(event["len1"], event["len2"]))
+        histogram = stats["length_histogram"]
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        if self.callback is not None:
+            self.callback(event)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a snapshot of the counters, per method:
+            - calls, cells, and seconds: The number of calls, and the total number of cells and wall time of these calls,
+            - max_seconds and slowest_lengths: The wall time and the input lengths of the slowest call,
+            - bytes_allocated and max_bytes_allocated: The total and the maximum memory traced during a call (0 unless trace_memory is True),
+            - length_histogram: The number of calls per bucket of the length of the longer input (see length_bucket).
+        """
+        return copy.deepcopy(self.methods)
+
+    def reset(self) -> None:
+        """
+        Resets all the counters.
+        """
+        self.methods.clear()
+
+
+def instrumented_method(cells: Callable[[int, int], int] = quadratic_cells) -> Callable:
+    """
+    Decorator for the methods of EditDistAlgs whose cost depends on the lengths of their two inputs.
+    If the instance has an Instrumentation, each call is measured and recorded in it; otherwise, the method is called directly.
+
+    Arguments:
+    (a) cells: The number of cells that the method computes as a function of the lengths of the inputs (quadratic_cells or linear_cells).
+        For the banded and bit-parallel engines, this is the size of the full matrix, i.e., an upper bound on the work.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, str1, str2, *args, **kwargs):
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                return method(self, str1, str2, *args, **kwargs)
+
+            trace = (
+                instrumentation.trace_memory
+                and instrumentation._depth == 0
+                and not tracemalloc.is_tracing()
+            )
+            if trace:
+                tracemalloc.start()
+            instrumentation._depth += 1
+            start = time.perf_counter()
+            try:
+                value = method(self, str1, str2, *args, **kwargs)
+                seconds = time.perf_counter() - start
+                bytes_allocated = tracemalloc.get_traced_memory()[1] if trace else None
+            finally:
+                instrumentation._depth -= 1
+                if trace:
+                    tracemalloc.stop()
+
+            n = len(str1)
+            m = len(str2)
+            instrumentation.record(
+                {
+                    "method": name,
+                    "len1": n,
+                    "len2": m,
+                    "cells": cells(n, m),
+                    "seconds": seconds,
+                    "bytes_allocated": bytes_allocated,
+                }
+            )
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,239 @@
+"""
+    Corpus-level Jaccard similarity coefficients over sets of shingles
+        [x] Encoding of each document, once, into the sorted integer ids of its shingles (characters, tokens, or k-grams), stored in a compressed sparse row (CSR) layout
+        [x] One-vs-all similarities of a query
+        [x] All-pairs similarity matrices (within the corpus, or between queries and the corpus), with vectorized sparse products
+        [x] Sparse output of the pairs above a threshold (pairs with a coefficient of 0 are never stored)
+"""
+
+# Import relevant libraries and dependencies
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from string2string.minhash import shingles
+
+# Maximum number of entries (intersection counts, and postings of the shingles being scanned) held in memory at a time.
+_BLOCK_CELLS = 1 << 22
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """
+    Returns the concatenation of the ranges [starts[i], stops[i]) as a single array.
+    """
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.intp)
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(total, dtype=np.intp) + np.repeat(starts - offsets, lengths)
+
+
+class JaccardCorpus:
+    """
+    Class for the Jaccard similarity coefficients between the documents of a fixed corpus (and between queries and the corpus)
+    """
+
+    def __init__(
+        self,
+        documents: Sequence[Union[str, List[str]]],
+        shingle_size: int = 1,
+    ) -> None:
+        """
+        Encodes each document (a string, or a list of strings) as the set of its shingles (see shingles in minhash.py).
+        With shingle_size = 1, the sets are the sets of characters (or tokens) that EditDistAlgs.jaccard_similarity_coefficient compares.
+
+        Notes:
+        (a) The shingles are mapped to integer ids, and the ids of the document i are stored, sorted, in indices[indptr[i] : indptr[i + 1]] (CSR layout).
+        (b) The transposed (CSC) layout, i.e., the sorted ids of the documents that contain each shingle, is stored as well; the similarities are computed by scanning the documents of the shingles of a query,
+            so their cost is proportional to the number of (shingle, document) pairs they share, rather than to the size of the corpus times the size of the vocabulary.
+        """
+        if shingle_size < 1:
+            raise ValueError("The shingle size must be a positive integer.")
+        self.shingle_size = shingle_size
+        self.ids: Dict[Hashable, int] = {}
+        self.indptr, self.indices = self._encode(documents, add=True)
+        self.sizes = np.diff(self.indptr)
+        num_documents = len(self.sizes)
+
+        # CSC layout: the documents of the shingle c are doc_indices[colptr[c] : colptr[c + 1]], in increasing order.
+        owners = np.repeat(np.arange(num_documents, dtype=np.intp), self.sizes)
+        order = np.argsort(self.indices, kind="stable")
+        self.doc_indices = owners[order]
+        self.colptr = np.zeros(len(self.ids) + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(self.indices, minlength=len(self.ids)), out=self.colptr[1:]
+        )
+        # Sorted keys (shingle x num_documents + document) of the CSC entries, to find the documents after a given one within a column
+        self._keys = self.indices[order].astype(np.int64) * max(num_documents, 1)
+        self._keys += self.doc_indices
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def _encode(
+        self, documents: Sequence[Union[str, List[str]]], add: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the CSR layout (indptr, indices) of the sorted shingle ids of the documents.
+        If add is False, the shingles that do not occur in the corpus get the id -1: they count towards the sizes of the sets, but they are not shared with any document.
+        """
+        indptr = np.zeros(len(documents) + 1, dtype=np.intp)
+        indices: List[int] = []
+        for index, document in enumerate(documents):
+            if add:
+                row = [
+                    self.ids.setdefault(shingle, len(self.ids))
+                    for shingle in shingles(document, self.shingle_size)
+                ]
+            else:
+                row = [
+                    self.ids.get(shingle, -1)
+                    for shingle in shingles(document, self.shingle_size)
+                ]
+            row.sort()
+            indices.extend(row)
+            indptr[index + 1] = len(indices)
+        return indptr, np.array(indices, dtype=np.intp)
+
+    def _intersections(
+        self, indptr: np.ndarray, indices: np.ndarray, first_row: Optional[int]
+    ) -> np.ndarray:
+        """
+        Returns the (number of rows) x (number of documents) matrix of the sizes of the intersections between the rows of a CSR layout and the documents.
+        If first_row is given, the rows are the documents first_row, first_row + 1, ..., and only the entries above the diagonal are computed (the others are 0).
+        """
+        num_rows = len(indptr) - 1
+        num_documents = len(self)
+        owners = np.repeat(np.arange(num_rows, dtype=np.intp), np.diff(indptr))
+        columns = indices[indptr[0] : indptr[-1]]
+        if first_row is None:
+            # Shingles that do not occur in the corpus (id -1) have no documents.
+            known = columns >= 0
+            owners = owners[known]
+            columns = columns[known]
+            starts = self.colptr[columns]
+        else:
+            # The documents of each shingle are sorted, so the ones after the row start at the first key greater than (shingle, row).
+            keys = columns.astype(np.int64) * num_documents + owners + first_row
+            starts = np.searchsorted(self._keys, keys, "right")
+        stops = self.colptr[columns + 1]
+        counts = stops - starts
+        result = np.zeros(num_rows * num_documents, dtype=np.intp)
+        # The postings are scanned about _BLOCK_CELLS at a time (a single row can have more).
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        first = 0
+        while first < len(counts):
+            last = int(np.searchsorted(bounds, bounds[first] + _BLOCK_CELLS, "right"))
+            last = max(last - 1, first + 1)
+            cells = np.repeat(owners[first:last] * num_documents, counts[first:last])
+            cells += self.doc_indices[_ranges(starts[first:last], stops[first:last])]
+            result += np.bincount(cells, minlength=num_rows * num_documents)
+            first = last
+        return result.reshape(num_rows, num_documents)
+
+    def _similarity_blocks(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        upper_triangle: bool,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yields the similarities between the rows of a CSR layout and the documents, as (first row, block of similarities) pairs, a few rows at a time.
+        If upper_triangle is True, the rows are the documents themselves, and only the entries above the diagonal are meaningful.
+        """
+        num_documents = len(self)
+        sizes = np.diff(indptr)
+        # A row costs one entry per document (in the block of similarities), one per shingle, and one per document of each of its shingles (the postings that are scanned).
+        # Shingles that do not occur in the corpus (id -1) have no documents.
+        posting_lengths = np.append(np.diff(self.colptr), 0)
+        costs = np.concatenate(([0], np.cumsum(posting_lengths[indices] + 1)))[indptr]
+        costs += num_documents * np.arange(len(indptr))
+        start = 0
+        while start < len(sizes):
+            stop = int(np.searchsorted(costs, costs[start] + _BLOCK_CELLS, "right"))
+            stop = max(stop - 1, start + 1)
+            intersections = self._intersections(
+                indptr[start : stop + 1], indices, start if upper_triangle else None
+            )
+            unions = sizes[start:stop, None] + self.sizes[None, :] - intersections
+            with np.errstate(invalid="ignore"):
+                similarities = intersections / unions
+            # As in EditDistAlgs.jaccard_similarity_coefficient, two empty sets have a coefficient of 1.
+            similarities[unions == 0] = 1.0
+            yield start, similarities
+            start = stop
+
+    def similarities(self, query: Union[str, List[str]]) -> np.ndarray:
+        """
+        Returns the vector of the Jaccard similarity coefficients between the query and each document of the corpus.
+        """
+        return self.cdist([query])[0]
+
+    def cdist(self, queries: Sequence[Union[str, List[str]]]) -> np.ndarray:
+        """
+        Returns the (number of queries) x (number of documents) matrix of the Jaccard similarity coefficients between the queries and the documents.
+        """
+        indptr, indices = self._encode(queries)
+        result = np.zeros((len(queries), len(self)))
+        for start, similarities in self._similarity_blocks(indptr, indices, False):
+            result[start : start + len(similarities)] = similarities
+        return result
+
+    def pdist(self) -> np.ndarray:
+        """
+        Returns the (number of documents) x (number of documents) matrix of the Jaccard similarity coefficients between the documents.
+        Only the entries above the diagonal are computed; the matrix is symmetric, and its diagonal is 1.
+        """
+        result = np.zeros((len(self), len(self)))
+        for start, similarities in self._similarity_blocks(
+            self.indptr, self.indices, True
+        ):
+            result[start : start + len(similarities)] = np.triu(similarities, start + 1)
+        result += result.T
+        np.fill_diagonal(result, 1.0)
+        return result
+
+    def similar_pairs(
+        self,
+        threshold: float,
+        queries: Optional[Sequence[Union[str, List[str]]]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Definition:
+        Returns the pairs whose Jaccard similarity coefficient is at least threshold, in a sparse (coordinate) format: the arrays rows, columns, and similarities, sorted by row and then by column.
+        Without queries, the pairs are the pairs (i, j) of documents with i < j; otherwise, they are the (query, document) pairs.
+
+        Notes:
+        (a) The threshold must be in (0, 1], so that the pairs with a coefficient of 0 (i.e., the non-empty sets without a common shingle) are never stored.
+            As in EditDistAlgs.jaccard_similarity_coefficient, two empty sets have a coefficient of 1, so the pairs of empty documents are returned for any threshold.
+        (b) The rows are processed a block at a time, and the blocks are sized by the number of documents and by the postings of their shingles (see _BLOCK_CELLS),
+            so the memory usage is bounded by the size of a block (or of a single row of similarities, if it is larger) and the number of pairs returned.
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("The threshold must be in (0, 1].")
+        upper_triangle = queries is None
+        if upper_triangle:
+            indptr, indices = self.indptr, self.indices
+        else:
+            indptr, indices = self._encode(queries)
+
+        rows: List[np.ndarray] = []
+        columns: List[np.ndarray] = []
+        values: List[np.ndarray] = []
+        for start, similarities in self._similarity_blocks(
+            indptr, indices, upper_triangle
+        ):
+            selected = similarities >= threshold
+            if upper_triangle:
+                selected = np.triu(selected, start + 1)
+            block_rows, block_columns = np.nonzero(selected)
+            rows.append(block_rows + start)
+            columns.append(block_columns)
+            values.append(similarities[block_rows, block_columns])
+        if not rows:
+            return (
+                np.zeros(0, dtype=np.intp),
+                np.zeros(0, dtype=np.intp),
+                np.zeros(0),
+            )
+        return np.concatenate(rows), np.concatenate(columns), np.concatenate(values)
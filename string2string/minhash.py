@@ -0,0 +1,344 @@
+"""
+    MinHash signatures and a banded locality-sensitive hashing (LSH) index for near-duplicate search
+        [x] Shingling of strings (or lists of strings) into sets of k-grams
+        [x] Vectorized MinHash signatures (estimates of the Jaccard similarity coefficient)
+        [x] Banded LSH index with incremental insertion and query-by-threshold
+"""
+
+# Import relevant libraries and dependencies
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+import zlib
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+
+# Shift of the multiply-shift hash functions (the upper 32 bits of a 64-bit product are kept).
+_SHIFT = np.uint64(32)
+
+# Signature value of the empty set.
+_MAX_HASH = np.uint64((1 << 64) - 1)
+
+# Number of (permutation, shingle) products computed per vectorized step.
+_BLOCK_SIZE = 1 << 20
+
+
+def shingles(
+    sequence: Union[str, List[str]], shingle_size: int = 1
+) -> Set[Union[str, Tuple[str, ...]]]:
+    """
+    Returns the set of all the contiguous k-grams (shingles) of a string (or list of strings), where k is shingle_size.
+    Shingles of strings are strings, and shingles of lists of strings are tuples; for shingle_size = 1, this is the set of characters (or tokens) that jaccard_similarity_coefficient compares.
+    Sequences shorter than shingle_size have a single shingle (themselves), unless they are empty.
+    """
+    if shingle_size < 1:
+        raise ValueError("The shingle size must be a positive integer.")
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
+    if shingle_size == 1:
+        return set(sequence)
+    if len(sequence) == 0:
+        return set()
+    make = (lambda part: part) if isinstance(sequence, str) else tuple
+    return {
+        make(sequence[start : start + shingle_size])
+        for start in range(max(1, len(sequence) - shingle_size + 1))
+    }
+
+
+def hash_shingle(shingle: Hashable) -> int:
+    """
+    Returns a 32-bit hash of a shingle. Unlike hash(), the value does not depend on the Python process (PYTHONHASHSEED), so signatures can be stored and compared across runs.
+    """
+    if isinstance(shingle, tuple):
+        shingle = "\x1f".join(map(str, shingle))
+    elif not isinstance(shingle, str):
+        shingle = repr(shingle)
+    return zlib.crc32(shingle.encode("utf-8"))
+
+
+class MinHasher:
+    """
+    Class for computing MinHash signatures of strings (or lists of strings)
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        shingle_size: int = 1,
+        seed: int = 0,
+    ) -> None:
+        """
+        Draws num_perm multiply-shift hash functions h(x) = ((a * x + b) mod 2^64) div 2^32, which play the role of random permutations of the (hashed) shingles.
+        Two signatures are only comparable if they are produced by MinHashers with the same num_perm and seed.
+        """
+        if num_perm < 1:
+            raise ValueError("The number of permutations must be a positive integer.")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        # The multipliers are odd; the arithmetic wraps around modulo 2^64.
+        self.a = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) << 1
+        self.a |= np.uint64(1)
+        self.b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) << 1
+
+    def shingles(self, sequence: Union[str, List[str]]) -> Set:
+        """
+        Returns the set of shingles of a string (or list of strings).
+        """
+        return shingles(sequence, self.shingle_size)
+
+    def signature(self, sequence: Union[str, List[str]]) -> np.ndarray:
+        """
+        Returns the MinHash signature (a vector of num_perm unsigned 64-bit integers) of a string (or list of strings).
+        """
+        return self.signatures([sequence])[0]
+
+    def signatures(self, sequences: Sequence[Union[str, List[str]]]) -> np.ndarray:
+        """
+        Returns the matrix of the MinHash signatures of the sequences (one row per sequence).
+
+        Notes:
+        (a) The shingles of all the sequences are hashed into a single array, and all the hash functions are applied to it at once;
+            the minimum over the shingles of each sequence is then taken with np.minimum.reduceat.
+        (b) The signature of an empty sequence is the all-(2^64 - 1) vector.
+        """
+        hashed = []
+        counts = np.zeros(len(sequences), dtype=np.int64)
+        for index, sequence in enumerate(sequences):
+            values = [hash_shingle(shingle) for shingle in self.shingles(sequence)]
+            counts[index] = len(values)
+            hashed.extend(values)
+        hashed = np.array(hashed, dtype=np.uint64)
+
+        result = np.full((len(sequences), self.num_perm), _MAX_HASH, dtype=np.uint64)
+        nonempty = np.flatnonzero(counts)
+        if len(nonempty) == 0:
+            return result
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        # Process whole sequences in blocks of roughly _BLOCK_SIZE products.
+        block_shingles = max(1, _BLOCK_SIZE // self.num_perm)
+        a = self.a[:, None]
+        b = self.b[:, None]
+        start = 0
+        while start < len(nonempty):
+            stop = start + 1
+            while (
+                stop < len(nonempty)
+                and offsets[nonempty[stop] + 1] - offsets[nonempty[start]]
+                <= block_shingles
+            ):
+                stop += 1
+            rows = nonempty[start:stop]
+            first = offsets[rows[0]]
+            values = (a * hashed[first : offsets[rows[-1] + 1]] + b) >> _SHIFT
+            result[rows] = np.minimum.reduceat(values, offsets[rows] - first, axis=1).T
+            start = stop
+        return result
+
+    @staticmethod
+    def estimate_jaccard(signature1: np.ndarray, signature2: np.ndarray) -> float:
+        """
+        Returns the fraction of the positions at which the two signatures agree, which is an unbiased estimate of the Jaccard similarity coefficient of the underlying sets.
+        """
+        return float(np.mean(signature1 == signature2))
+
+
+def optimal_bands(
+    threshold: float,
+    num_perm: int,
+    false_positive_weight: float = 0.5,
+    false_negative_weight: float = 0.5,
+) -> Tuple[int, int]:
+    """
+    Returns the number of bands b and of rows per band r (with b * r <= num_perm) that minimize the weighted sum of the false positive and false negative probabilities at the given threshold.
+
+    Notes:
+    (a) Two sets with Jaccard similarity s share at least one band with probability P(s) = 1 - (1 - s^r)^b.
+        The false positive (resp. false negative) probability is the integral of P(s) over [0, threshold] (resp. of 1 - P(s) over [threshold, 1]).
+    """
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError("The threshold must be between 0 and 1.")
+    grid = np.linspace(0.0, 1.0, 1001)
+    step = grid[1] - grid[0]
+    below = grid <= threshold
+    best, best_error = (1, num_perm), np.inf
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            probability = 1.0 - (1.0 - grid**rows) ** bands
+            error = (
+                false_positive_weight * probability[below].sum()
+                + false_negative_weight * (1.0 - probability[~below]).sum()
+            ) * step
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class LSHIndex:
+    """
+    Class for a banded LSH index over MinHash signatures, for finding the near-duplicates of a query in sublinear time
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        num_perm: int = 128,
+        shingle_size: int = 1,
+        bands: Optional[int] = None,
+        rows: Optional[int] = None,
+        seed: int = 0,
+        verify: bool = False,
+        algs: Optional[EditDistAlgs] = None,
+    ) -> None:
+        """
+        Creates an empty index.
+            - threshold: The default Jaccard similarity threshold of the queries.
+            - bands, rows: The banding of the signatures; if they are not given, they are chosen by optimal_bands for the threshold.
+            - verify: If True, the candidates of a query are verified (and ranked) with the exact Jaccard similarity coefficient, instead of the estimate of their signatures.
+              The inserted sequences are then kept in the index.
+            - algs: The EditDistAlgs instance whose jaccard_similarity_coefficient is used for the verification (by default, EditDistAlgs()).
+        """
+        if bands is None or rows is None:
+            bands, rows = optimal_bands(threshold, num_perm)
+        if bands * rows > num_perm:
+            raise ValueError(
+                "The number of bands times the number of rows cannot exceed the number of permutations."
+            )
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.verify = verify
+        self.algs = algs if algs is not None else EditDistAlgs()
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        # One hash table per band, from the bytes of the band to the keys of the sequences
+        self.buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self.signatures: Dict[Hashable, np.ndarray] = {}
+        self.sequences: Dict[Hashable, Union[str, List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.signatures
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """
+        Returns the bucket keys of the bands of a signature.
+        """
+        rows = self.rows
+        return [
+            signature[band * rows : (band + 1) * rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: Hashable, sequence: Union[str, List[str]]) -> None:
+        """
+        Inserts a string (or list of strings) under a (new) key.
+        """
+        self.update([(key, sequence)])
+
+    def update(self, items: Iterable[Tuple[Hashable, Union[str, List[str]]]]) -> None:
+        """
+        Inserts (key, sequence) pairs; the signatures of all the sequences are computed in a single vectorized call.
+        """
+        items = list(items)
+        keys = [key for key, _ in items]
+        if len(set(keys)) != len(keys) or any(key in self.signatures for key in keys):
+            raise ValueError("The keys of the index must be unique.")
+        signatures = self.hasher.signatures([sequence for _, sequence in items])
+        for (key, sequence), signature in zip(items, signatures):
+            self.signatures[key] = signature
+            if self.verify:
+                self.sequences[key] = sequence
+            for table, band_key in zip(self.buckets, self._band_keys(signature)):
+                table.setdefault(band_key, []).append(key)
+
+    def candidates(self, sequence: Union[str, List[str]]) -> Set[Hashable]:
+        """
+        Returns the keys of the sequences that share at least one band with the query (without any filtering).
+        """
+        return self._candidates(self.hasher.signature(sequence))
+
+    def _candidates(self, signature: np.ndarray) -> Set[Hashable]:
+        found = set()
+        for table, band_key in zip(self.buckets, self._band_keys(signature)):
+            found.update(table.get(band_key, ()))
+        return found
+
+    def _similarity(
+        self,
+        sequence: Union[str, List[str]],
+        signature: np.ndarray,
+        key: Hashable,
+        verify: bool,
+    ) -> float:
+        if verify:
+            return self.algs.jaccard_similarity_coefficient(
+                list(self.hasher.shingles(sequence)),
+                list(self.hasher.shingles(self.sequences[key])),
+            )
+        return self.hasher.estimate_jaccard(signature, self.signatures[key])
+
+    def query(
+        self,
+        sequence: Union[str, List[str]],
+        threshold: Optional[float] = None,
+        verify: Optional[bool] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Returns the (key, similarity) pairs of the inserted sequences whose Jaccard similarity with the query is at least threshold (by default, the threshold of the index), in decreasing order of similarity.
+        The similarity is exact if verify is True (by default, the verify option of the index), and estimated from the signatures otherwise.
+        Like any LSH scheme, the index may miss some of the sequences above the threshold.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        verify = self.verify if verify is None else verify
+        if verify and not self.verify:
+            raise ValueError(
+                "The index does not keep the sequences; create it with verify=True."
+            )
+        signature = self.hasher.signature(sequence)
+        results = []
+        for key in self._candidates(signature):
+            similarity = self._similarity(sequence, signature, key, verify)
+            if similarity >= threshold:
+                results.append((key, similarity))
+        results.sort(key=lambda result: -result[1])
+        return results
+
+    def near_duplicate_pairs(
+        self,
+        threshold: Optional[float] = None,
+    ) -> List[Tuple[Hashable, Hashable, float]]:
+        """
+        Returns the (key1, key2, similarity) triples of all the pairs of inserted sequences that share a band and whose similarity is at least threshold.
+        The similarities are exact if the index was created with verify=True, and estimated otherwise.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        seen = set()
+        results = []
+        order = {key: index for index, key in enumerate(self.signatures)}
+        for table in self.buckets:
+            for keys in table.values():
+                for i, first in enumerate(keys):
+                    for second in keys[i + 1 :]:
+                        if order[first] < order[second]:
+                            key1, key2 = first, second
+                        else:
+                            key1, key2 = second, first
+                        pair = (key1, key2)
+                        if pair in seen:
+                            continue
+                        seen.add(pair)
+                        if self.verify:
+                            similarity = self._similarity(
+                                self.sequences[key1], None, key2, True
+                            )
+                        else:
+                            similarity = self.hasher.estimate_jaccard(
+                                self.signatures[key1], self.signatures[key2]
+                            )
+                        if similarity >= threshold:
+                            results.append((key1, key2, similarity))
+        return results
@@ -0,0 +1,239 @@
+"""
+    Pairwise (batched) evaluation of the metrics in edit_distance.py
+        [x] cdist: all pairs between two collections
+        [x] pdist: all pairs within one collection
+"""
+
+# Import relevant libraries and dependencies
+from collections import deque
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from string2string.edit_distance import (
+    METRICS,
+    EditDistAlgs,
+    _is_symmetric,
+    _metric_function,
+)
+
+# Default number of rows (and columns) of a block of the result matrix.
+DEFAULT_CHUNK_SIZE = 256
+
+
+def _compute_block(
+    algs: EditDistAlgs,
+    metric: str,
+    rows: Sequence[Union[str, List[str]]],
+    cols: Sequence[Union[str, List[str]]],
+    upper_triangle: bool,
+    metric_kwargs: dict,
+) -> np.ndarray:
+    """
+    Computes a block of the result matrix. If upper_triangle is True, rows and cols are the same items and only the entries on or above the diagonal are computed.
+    """
+    function = _metric_function(algs, metric)
+    block = np.zeros((len(rows), len(cols)))
+    for i, row in enumerate(rows):
+        for j in range(i if upper_triangle else 0, len(cols)):
+            value = function(row, cols[j], **metric_kwargs)
+            if isinstance(value, tuple):
+                value = value[0]
+            block[i, j] = value
+    if upper_triangle:
+        lower = np.tril_indices(len(rows), -1)
+        block[lower] = block.T[lower]
+    return block
+
+
+def _iter_blocks(
+    tasks: Iterator[Tuple[slice, slice, tuple]],
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """
+    Runs the block tasks (serially, or on an executor) and yields the blocks in order.
+    At most two blocks per worker are in flight at any time, which bounds the memory held by pending results.
+    """
+    if executor is None and (max_workers is None or max_workers <= 1):
+        for row_slice, col_slice, args in tasks:
+            yield row_slice, col_slice, _compute_block(*args)
+        return
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    try:
+        in_flight = deque()
+        for row_slice, col_slice, args in tasks:
+            in_flight.append(
+                (row_slice, col_slice, executor.submit(_compute_block, *args))
+            )
+            if len(in_flight) >= max_in_flight:
+                row_slice, col_slice, future = in_flight.popleft()
+                yield row_slice, col_slice, future.result()
+        while in_flight:
+            row_slice, col_slice, future = in_flight.popleft()
+            yield row_slice, col_slice, future.result()
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+
+def iter_cdist_blocks(
+    queries: Sequence[Union[str, List[str]]],
+    targets: Sequence[Union[str, List[str]]],
+    metric: str = "levenshtein_edit_distance",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **metric_kwargs: Any,
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """
+    Definition:
+    Yields the result matrix of cdist block by block, as (row_slice, col_slice, block) triples, where block = D[row_slice, col_slice].
+
+    Notes:
+    (a) Only the blocks that are currently being computed are held in memory, so the full matrix never has to be materialized.
+    (b) See cdist for the description of the arguments.
+    """
+    algs = algs if algs is not None else EditDistAlgs()
+    _metric_function(algs, metric)
+
+    def tasks():
+        for row_start in range(0, len(queries), chunk_size):
+            row_slice = slice(row_start, min(row_start + chunk_size, len(queries)))
+            for col_start in range(0, len(targets), chunk_size):
+                col_slice = slice(col_start, min(col_start + chunk_size, len(targets)))
+                args = (
+                    algs,
+                    metric,
+                    queries[row_slice],
+                    targets[col_slice],
+                    False,
+                    metric_kwargs,
+                )
+                yield row_slice, col_slice, args
+
+    return _iter_blocks(tasks(), max_workers, executor)
+
+
+def iter_pdist_blocks(
+    items: Sequence[Union[str, List[str]]],
+    metric: str = "levenshtein_edit_distance",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **metric_kwargs: Any,
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """
+    Definition:
+    Yields the result matrix of pdist block by block, as (row_slice, col_slice, block) triples, where block = D[row_slice, col_slice].
+
+    Notes:
+    (a) If the metric is symmetric (under the weights of algs), only the blocks on or above the block diagonal are computed and yielded; the remaining blocks are their transposes.
+        Within a diagonal block, only the upper triangle is computed.
+    (b) See cdist for the description of the arguments.
+    """
+    algs = algs if algs is not None else EditDistAlgs()
+    _metric_function(algs, metric)
+    symmetric = _is_symmetric(algs, metric)
+
+    def tasks():
+        for row_start in range(0, len(items), chunk_size):
+            row_slice = slice(row_start, min(row_start + chunk_size, len(items)))
+            first_col = row_start if symmetric else 0
+            for col_start in range(first_col, len(items), chunk_size):
+                col_slice = slice(col_start, min(col_start + chunk_size, len(items)))
+                upper_triangle = symmetric and col_start == row_start
+                args = (
+                    algs,
+                    metric,
+                    items[row_slice],
+                    items[col_slice],
+                    upper_triangle,
+                    metric_kwargs,
+                )
+                yield row_slice, col_slice, args
+
+    return _iter_blocks(tasks(), max_workers, executor)
+
+
+def cdist(
+    queries: Sequence[Union[str, List[str]]],
+    targets: Sequence[Union[str, List[str]]],
+    metric: str = "levenshtein_edit_distance",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    out: Optional[np.ndarray] = None,
+    **metric_kwargs: Any,
+) -> np.ndarray:
+    """
+    Definition:
+    Computes the matrix D of size len(queries) x len(targets), where D[i, j] = metric(queries[i], targets[j]).
+
+    Arguments:
+    (a) metric: The name of a method of EditDistAlgs (see METRICS in edit_distance.py). For longest_common_subsequence and longest_common_substring, the length is stored.
+    (b) algs: The EditDistAlgs instance (i.e., the weights) to use. Defaults to EditDistAlgs().
+    (c) chunk_size: The number of rows (and columns) of each block of work.
+    (d) max_workers: If greater than one, the blocks are computed on a ProcessPoolExecutor with this many worker processes.
+    (e) executor: An executor to use instead (it is not shut down afterwards).
+    (f) out: An optional output array (e.g., a np.memmap, so that the result is written to disk block by block).
+    (g) metric_kwargs: Additional keyword arguments passed to the metric (e.g., max_distance).
+    """
+    if out is None:
+        out = np.zeros((len(queries), len(targets)))
+    for row_slice, col_slice, block in iter_cdist_blocks(
+        queries,
+        targets,
+        metric=metric,
+        algs=algs,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        **metric_kwargs,
+    ):
+        out[row_slice, col_slice] = block
+    return out
+
+
+def pdist(
+    items: Sequence[Union[str, List[str]]],
+    metric: str = "levenshtein_edit_distance",
+    algs: Optional[EditDistAlgs] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    out: Optional[np.ndarray] = None,
+    **metric_kwargs: Any,
+) -> np.ndarray:
+    """
+    Definition:
+    Computes the matrix D of size len(items) x len(items), where D[i, j] = metric(items[i], items[j]).
+
+    Notes:
+    (a) If the metric is symmetric, each unordered pair is computed once and mirrored.
+    (b) See cdist for the description of the arguments.
+    """
+    if out is None:
+        out = np.zeros((len(items), len(items)))
+    symmetric = _is_symmetric(algs if algs is not None else EditDistAlgs(), metric)
+    for row_slice, col_slice, block in iter_pdist_blocks(
+        items,
+        metric=metric,
+        algs=algs,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        **metric_kwargs,
+    ):
+        out[row_slice, col_slice] = block
+        if symmetric and row_slice != col_slice:
+            out[col_slice, row_slice] = block.T
+    return out
@@ -0,0 +1,349 @@
+"""
+    Multi-core dynamic programming for a single (very long) pair of strings
+        [x] Tiling of the (n+1) x (m+1) matrix into blocks, computed one anti-diagonal of blocks at a time (the blocks of an anti-diagonal are independent)
+        [x] Block boundaries (and the encoded inputs) in multiprocessing.shared_memory, so that only O(n + m) entries of the matrix are ever stored
+        [x] Levenshtein edit distance, length of the longest common subsequence, and length of the longest common substring
+"""
+
+# Import relevant libraries and dependencies
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.wavefront import encode_pair
+
+# Recurrences supported by the engine.
+KINDS = ("levenshtein", "lcs", "substring")
+
+# Smallest side of a block: each row of a block takes a few NumPy operations, whose overhead must be amortized over the width of the block.
+MIN_TILE_SIZE = 1024
+
+# By default, the blocks are sized so that the longest anti-diagonal has about this many blocks per worker.
+TILES_PER_WORKER = 2
+
+
+class _SharedArrays:
+    """
+    One-dimensional arrays in shared memory blocks, which the workers attach to by name (see _attach).
+    """
+
+    def __init__(self) -> None:
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.specs: Dict[str, Tuple[str, int, str]] = {}
+
+    def create(self, name: str, values: np.ndarray) -> None:
+        """
+        Copies an array into a new shared memory block.
+        """
+        # Shared memory blocks cannot be empty.
+        block = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+        self.blocks.append(block)
+        self.specs[name] = (block.name, len(values), values.dtype.str)
+        np.ndarray(len(values), dtype=values.dtype, buffer=block.buf)[:] = values
+
+    def read(self, name: str) -> np.ndarray:
+        """
+        Returns a copy of a shared array.
+        """
+        block_name, size, dtype = self.specs[name]
+        block = self.blocks[list(self.specs).index(name)]
+        return np.ndarray(size, dtype=np.dtype(dtype), buffer=block.buf).copy()
+
+    def release(self) -> None:
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+def _attach(
+    specs: Dict[str, Tuple[str, int, str]]
+) -> Tuple[List[shared_memory.SharedMemory], Dict[str, np.ndarray]]:
+    """
+    Attaches to the shared arrays described by specs (see _SharedArrays), and returns the blocks and the arrays.
+    """
+    blocks = []
+    arrays = {}
+    for name, (block_name, size, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(size, dtype=np.dtype(dtype), buffer=block.buf)
+    return blocks, arrays
+
+
+def _fill_tile(
+    kind: str,
+    arrays: Dict[str, np.ndarray],
+    rows: Tuple[int, int],
+    cols: Tuple[int, int],
+    top: Tuple[int, int],
+    left: Tuple[int, int],
+    weights: Tuple[float, float, float, float],
+) -> float:
+    """
+    Computes a block of the matrix (see _compute_tile) on the attached shared arrays.
+    """
+    codes1 = arrays["codes1"][rows[0] : rows[1]]
+    codes2 = arrays["codes2"][cols[0] : cols[1]]
+    horizontal = arrays["horizontal"][top[0] : top[1]]
+    vertical = arrays["vertical"][left[0] : left[1]]
+    insert_weight, delete_weight, match_weight, substite_weight = weights
+
+    # Two row buffers are swapped; the vectors of each symbol of str1 are computed once per block.
+    row = horizontal.copy()
+    next_row = np.empty(len(row))
+    right = np.empty(len(vertical))
+    right[0] = row[-1]
+    vectors: Dict[int, np.ndarray] = {}
+    largest = 0.0
+    if kind == "levenshtein":
+        # Shifted rows (see hirschberg.py): row[j] - j x insert_weight, so that the insertions become a running minimum.
+        shift = np.arange(len(row)) * insert_weight
+        row -= shift
+        for i, symbol in enumerate(codes1.tolist(), 1):
+            cost = vectors.get(symbol)
+            if cost is None:
+                cost = np.where(codes2 == symbol, match_weight, substite_weight)
+                cost -= insert_weight
+                vectors[symbol] = cost
+            next_row[0] = vertical[i]
+            np.add(row[:-1], cost, out=next_row[1:])
+            np.minimum(next_row[1:], row[1:] + delete_weight, out=next_row[1:])
+            np.minimum.accumulate(next_row, out=next_row)
+            row, next_row = next_row, row
+            right[i] = row[-1] + shift[-1]
+        row += shift
+    else:
+        for i, symbol in enumerate(codes1.tolist(), 1):
+            matches = vectors.get(symbol)
+            if matches is None:
+                matches = (codes2 == symbol).astype(np.float64)
+                vectors[symbol] = matches
+            next_row[0] = vertical[i]
+            if kind == "lcs":
+                np.add(row[:-1], matches, out=next_row[1:])
+                np.maximum(next_row[1:], row[1:], out=next_row[1:])
+                np.maximum.accumulate(next_row, out=next_row)
+            else:
+                np.add(row[:-1], 1.0, out=next_row[1:])
+                np.multiply(next_row[1:], matches, out=next_row[1:])
+                largest = max(largest, float(next_row.max()))
+            row, next_row = next_row, row
+            right[i] = row[-1]
+    horizontal[:] = row
+    vertical[:] = right
+    return largest
+
+
+def _compute_tile(
+    kind: str,
+    specs: Dict[str, Tuple[str, int, str]],
+    rows: Tuple[int, int],
+    cols: Tuple[int, int],
+    top: Tuple[int, int],
+    left: Tuple[int, int],
+    weights: Tuple[float, float, float, float],
+) -> float:
+    """
+    Computes a block of the matrix, i.e., the entries [rows[0], rows[1]] x [cols[0], cols[1]] (boundaries included).
+
+    Notes:
+    (a) The top boundary (the entries of the row rows[0]) is read from horizontal[top[0] : top[1]], and the left boundary (the entries of the column cols[0]) from vertical[left[0] : left[1]].
+    (b) The bottom row of the block overwrites its top boundary, and the right column of the block overwrites its left boundary.
+        These slices belong to the column of blocks and to the row of blocks of this block, respectively, so no other block of the same anti-diagonal reads or writes them.
+    (c) Returns the largest entry of the block for "substring" (the length of the longest common substring that ends in the block), and 0 otherwise.
+    """
+    blocks, arrays = _attach(specs)
+    try:
+        return _fill_tile(kind, arrays, rows, cols, top, left, weights)
+    finally:
+        # The views must be released before the blocks are closed.
+        arrays.clear()
+        for block in blocks:
+            block.close()
+
+
+def _block_bounds(length: int, tile_size: int) -> List[int]:
+    """
+    Returns the boundaries 0 = b_0 < b_1 < ... < b_k = length of the blocks of a dimension (a single block [0, 0] if length is 0).
+    """
+    return list(range(0, length, tile_size)) + [length] if length else [0, 0]
+
+
+def _run(
+    kind: str,
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    weights: Tuple[float, float, float, float],
+    tile_size: Optional[int],
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> Tuple[float, float]:
+    """
+    Runs the tiled dynamic programming of the given kind, and returns the last entry of the matrix and the largest entry (for "substring").
+    """
+    if kind not in KINDS:
+        raise ValueError(
+            f"Unknown kind: {kind}. Supported kinds are: {', '.join(KINDS)}."
+        )
+    codes1, codes2 = encode_pair(str1, str2)
+    n = len(codes1)
+    m = len(codes2)
+    num_workers = max_workers or os.cpu_count() or 1
+    if tile_size is None:
+        tile_size = max(
+            MIN_TILE_SIZE, math.ceil(max(n, m) / (TILES_PER_WORKER * num_workers))
+        )
+    if tile_size < 1:
+        raise ValueError("The tile size must be positive.")
+    row_bounds = _block_bounds(n, tile_size)
+    col_bounds = _block_bounds(m, tile_size)
+    num_row_blocks = len(row_bounds) - 1
+    num_col_blocks = len(col_bounds) - 1
+    insert_weight, delete_weight = weights[0], weights[1]
+
+    shared = _SharedArrays()
+    try:
+        shared.create("codes1", codes1)
+        shared.create("codes2", codes2)
+        # The boundary of each column of blocks (and of each row of blocks) has its own slice, including the shared corner entry.
+        horizontal = []
+        top = []
+        for c in range(num_col_blocks):
+            columns = np.arange(col_bounds[c], col_bounds[c + 1] + 1, dtype=np.float64)
+            horizontal.append(
+                columns * insert_weight
+                if kind == "levenshtein"
+                else np.zeros_like(columns)
+            )
+            top.append((col_bounds[c] + c, col_bounds[c + 1] + c + 1))
+        vertical = []
+        left = []
+        for r in range(num_row_blocks):
+            rows = np.arange(row_bounds[r], row_bounds[r + 1] + 1, dtype=np.float64)
+            vertical.append(
+                rows * delete_weight if kind == "levenshtein" else np.zeros_like(rows)
+            )
+            left.append((row_bounds[r] + r, row_bounds[r + 1] + r + 1))
+        shared.create("horizontal", np.concatenate(horizontal))
+        shared.create("vertical", np.concatenate(vertical))
+
+        def tasks(diagonal: int):
+            for r in range(
+                max(0, diagonal - num_col_blocks + 1),
+                min(num_row_blocks, diagonal + 1),
+            ):
+                c = diagonal - r
+                yield (
+                    kind,
+                    shared.specs,
+                    (row_bounds[r], row_bounds[r + 1]),
+                    (col_bounds[c], col_bounds[c + 1]),
+                    top[c],
+                    left[r],
+                    weights,
+                )
+
+        largest = 0.0
+        diagonals = range(num_row_blocks + num_col_blocks - 1)
+        if executor is None and num_workers <= 1:
+            for diagonal in diagonals:
+                for args in tasks(diagonal):
+                    largest = max(largest, _compute_tile(*args))
+        else:
+            owns_executor = executor is None
+            if owns_executor:
+                executor = ProcessPoolExecutor(max_workers=num_workers)
+            try:
+                for diagonal in diagonals:
+                    # The blocks of the next anti-diagonal depend on the blocks of this one.
+                    futures = [
+                        executor.submit(_compute_tile, *args)
+                        for args in tasks(diagonal)
+                    ]
+                    for future in futures:
+                        largest = max(largest, future.result())
+            finally:
+                if owns_executor:
+                    executor.shutdown()
+
+        corner = float(shared.read("horizontal")[-1])
+        return corner, largest
+    finally:
+        shared.release()
+
+
+def parallel_levenshtein_edit_distance(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    algs: Optional[EditDistAlgs] = None,
+    tile_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> float:
+    """
+    Definition:
+    Returns the Levenshtein edit distance between two strings (or lists of strings) under the weights of algs (by default, EditDistAlgs()), computed on several cores.
+
+    Notes:
+    (a) The matrix is split into tile_size x tile_size blocks, and the blocks of each anti-diagonal are computed concurrently by max_workers processes (by default, one per core) or by the given executor.
+        Each block is computed one row at a time, with a running minimum over NumPy arrays (as in hirschberg.py).
+    (b) Only the boundaries of the blocks (n + m entries, plus one per block row and column) and the encoded inputs are stored, in shared memory; each worker attaches to them by name.
+    (c) By default, the blocks are sized so that the longest anti-diagonal has TILES_PER_WORKER blocks per worker (but no side is shorter than MIN_TILE_SIZE).
+        The first and last anti-diagonals have fewer blocks than workers, so the speedup approaches the number of workers only when there are many anti-diagonals, i.e., for very long inputs.
+    (d) For inputs of up to a few thousand symbols, EditDistAlgs.levenshtein_edit_distance is faster (the workers are started, and the blocks are scheduled, in O(n/tile_size + m/tile_size) rounds).
+        Under uniform costs, its bit-parallel engine (see bit_parallel.py) computes w cells per word operation, so it can be faster than this engine on a few cores.
+    """
+    algs = algs if algs is not None else EditDistAlgs()
+    weights = (
+        float(algs.insert_weight),
+        float(algs.delete_weight),
+        float(algs.match_weight),
+        float(algs.substite_weight),
+    )
+    corner, _ = _run(
+        "levenshtein", str1, str2, weights, tile_size, max_workers, executor
+    )
+    return corner
+
+
+def parallel_longest_common_subsequence_length(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    tile_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> float:
+    """
+    Definition:
+    Returns the length of the longest common subsequence of two strings (or lists of strings), computed on several cores (see parallel_levenshtein_edit_distance for the arguments).
+    """
+    corner, _ = _run(
+        "lcs", str1, str2, (0.0, 0.0, 0.0, 0.0), tile_size, max_workers, executor
+    )
+    return corner
+
+
+def parallel_longest_common_substring_length(
+    str1: Union[str, List[str]],
+    str2: Union[str, List[str]],
+    tile_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> float:
+    """
+    Definition:
+    Returns the length of the longest common substring of two strings (or lists of strings), computed on several cores (see parallel_levenshtein_edit_distance for the arguments).
+
+    Notes:
+    (a) Each entry of the matrix is the length of the longest common suffix of two prefixes, and each block returns its largest entry.
+    (b) This takes O(nm / p) time on p cores, whereas EditDistAlgs.longest_common_substring takes O(n + m) time on a single core (with a suffix automaton), so the latter is preferable unless the inputs are short and the cores are many.
+    """
+    _, largest = _run(
+        "substring", str1, str2, (0.0, 0.0, 0.0, 0.0), tile_size, max_workers, executor
+    )
+    return largest
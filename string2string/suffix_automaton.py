@@ -0,0 +1,180 @@
+"""
+    Suffix automaton (DAWG) of a string (or a list of strings)
+        [x] Longest common substring of two strings in O(n + m) time
+        [x] Longest common substring of k strings
+"""
+
+# Import relevant libraries and dependencies
+from typing import List, Sequence, Tuple, Union
+
+
+class SuffixAutomaton:
+    """
+    Class for the suffix automaton of a string (or a list of strings)
+    """
+
+    def __init__(self, text: Union[str, List[str]]) -> None:
+        """
+        Builds the suffix automaton of text online (Blumer et al., 1985), in O(n) time (for a fixed alphabet).
+
+        Each state represents a set of substrings of text that share the same set of end positions:
+            - length[v]: the length of the longest substring represented by the state v,
+            - link[v]: the suffix link of v (the state of the longest suffix that is represented by another state),
+            - transitions[v]: the outgoing transitions of v (a dictionary from symbols to states),
+            - end_position[v]: an end position (in text) of the substrings represented by v.
+        """
+        self.text = text
+        length = [0]
+        link = [-1]
+        transitions = [{}]
+        end_position = [-1]
+
+        last = 0
+        for position, symbol in enumerate(text):
+            current = len(length)
+            length.append(length[last] + 1)
+            link.append(-1)
+            transitions.append({})
+            end_position.append(position)
+            p = last
+            while p != -1 and symbol not in transitions[p]:
+                transitions[p][symbol] = current
+                p = link[p]
+            if p == -1:
+                link[current] = 0
+            else:
+                q = transitions[p][symbol]
+                if length[p] + 1 == length[q]:
+                    link[current] = q
+                else:
+                    # Split the state q by cloning it.
+                    clone = len(length)
+                    length.append(length[p] + 1)
+                    link.append(link[q])
+                    transitions.append(dict(transitions[q]))
+                    end_position.append(end_position[q])
+                    while p != -1 and transitions[p].get(symbol) == q:
+                        transitions[p][symbol] = clone
+                        p = link[p]
+                    link[q] = clone
+                    link[current] = clone
+            last = current
+
+        self.length = length
+        self.link = link
+        self.transitions = transitions
+        self.end_position = end_position
+
+        # States in decreasing order of length (counting sort), so that each state comes before its suffix link.
+        buckets = [[] for _ in range(len(text) + 1)]
+        for state, state_length in enumerate(length):
+            buckets[state_length].append(state)
+        self._states_by_length = [
+            state for bucket in reversed(buckets) for state in bucket
+        ]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of states of the automaton (at most 2n - 1 for n >= 2).
+        """
+        return len(self.length)
+
+    def __contains__(self, substring: Union[str, List[str]]) -> bool:
+        """
+        Returns True if substring is a substring of the text.
+        """
+        state = 0
+        for symbol in substring:
+            state = self.transitions[state].get(symbol)
+            if state is None:
+                return False
+        return True
+
+    def matching_lengths(self, other: Union[str, List[str]]) -> List[int]:
+        """
+        Returns, for each state v, the length of the longest substring of other that is represented by v or by a state whose suffix link path contains v (capped at length[v]).
+        """
+        length = self.length
+        link = self.link
+        transitions = self.transitions
+        matched = [0] * len(length)
+
+        # Walk the automaton along other, following suffix links on mismatches.
+        state = 0
+        current_length = 0
+        for symbol in other:
+            while state and symbol not in transitions[state]:
+                state = link[state]
+                current_length = length[state]
+            next_state = transitions[state].get(symbol)
+            if next_state is None:
+                state = 0
+                current_length = 0
+                continue
+            state = next_state
+            current_length += 1
+            if current_length > matched[state]:
+                matched[state] = current_length
+
+        # If a state is matched, all the substrings of its suffix link are matched as well.
+        for state in self._states_by_length:
+            parent = link[state]
+            if matched[state] and parent > 0 and matched[parent] < length[parent]:
+                matched[parent] = length[parent]
+        return matched
+
+    def longest_common_substring(
+        self, *others: Union[str, List[str]]
+    ) -> Tuple[int, List[Union[str, List[str]]]]:
+        """
+        Definition:
+        Returns the length of the longest substring that is common to the text and all the other strings (or lists of strings), together with the list of all such distinct substrings.
+
+        Notes:
+        (a) For each state, the length of the longest common substring that it represents is the minimum of its matching lengths (see matching_lengths) over all the other strings.
+        (b) Once the automaton is built, each query takes O(m) time, where m is the length of the other string; the automaton can be reused for any number of queries.
+        """
+        if not others:
+            raise ValueError(
+                "At least one other string (or list of strings) is needed."
+            )
+        common = list(self.length)
+        for other in others:
+            common = [
+                min(value, matched)
+                for value, matched in zip(common, self.matching_lengths(other))
+            ]
+
+        max_length = max(common)
+        candidates = []
+        if max_length > 0:
+            seen = set()
+            for state, value in enumerate(common):
+                if value != max_length:
+                    continue
+                end = self.end_position[state] + 1
+                candidate = self.text[end - max_length : end]
+                key = candidate if isinstance(candidate, str) else tuple(candidate)
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append(candidate)
+        return max_length, candidates
+
+
+def multi_longest_common_substring(
+    sequences: Sequence[Union[str, List[str]]]
+) -> Tuple[int, List[Union[str, List[str]]]]:
+    """
+    Definition:
+    Returns the length of the longest substring that is common to all the given strings (or lists of strings), together with the list of all such distinct substrings.
+
+    Notes:
+    (a) The suffix automaton is built on the shortest sequence, and the others are matched against it. The time complexity is O(n_1 + ... + n_k).
+    """
+    if len(sequences) == 0:
+        raise ValueError("At least one string (or list of strings) is needed.")
+    if len(sequences) == 1:
+        return len(sequences[0]), [sequences[0]] if len(sequences[0]) else []
+    shortest = min(range(len(sequences)), key=lambda index: len(sequences[index]))
+    others = [sequence for index, sequence in enumerate(sequences) if index != shortest]
+    return SuffixAutomaton(sequences[shortest]).longest_common_substring(*others)
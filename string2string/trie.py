@@ -0,0 +1,152 @@
+"""
+    Trie (prefix tree) dictionary with fuzzy search under the weighted (Damerau-)Levenshtein edit distance
+        [x] Incremental insertion of strings (or lists of strings)
+        [x] All the words within a given distance of a query, with one row of the distance matrix per trie node
+"""
+
+# Import relevant libraries and dependencies
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from string2string.edit_distance import EditDistAlgs
+
+
+class Trie:
+    """
+    Class for a trie of strings (or lists of strings) that supports fuzzy search
+    """
+
+    def __init__(
+        self,
+        words: Iterable[Union[str, List[str]]] = (),
+        algs: Optional[EditDistAlgs] = None,
+    ) -> None:
+        """
+        Builds a trie over words. The weights of the edit operations of the fuzzy search are those of algs (by default, EditDistAlgs()).
+        """
+        self.algs = algs if algs is not None else EditDistAlgs()
+        # Nodes are stored in parallel lists: the children of each node (a dictionary from symbols to nodes), and the word that ends at each node (or None).
+        self.children: List[Dict[Hashable, int]] = [{}]
+        self.words: List[Optional[Union[str, List[str]]]] = [None]
+        self.num_words = 0
+        # Statistics of the last search
+        self.last_stats = {"visited_nodes": 0, "pruned_subtrees": 0}
+        self.update(words)
+
+    def __len__(self) -> int:
+        return self.num_words
+
+    def __contains__(self, word: Union[str, List[str]]) -> bool:
+        node = self._find(word)
+        return node is not None and self.words[node] is not None
+
+    def _find(self, word: Union[str, List[str]]) -> Optional[int]:
+        """
+        Returns the node of a word (or of a prefix of the words), or None if there is no such node.
+        """
+        node = 0
+        for symbol in word:
+            node = self.children[node].get(symbol)
+            if node is None:
+                return None
+        return node
+
+    def add(self, word: Union[str, List[str]]) -> bool:
+        """
+        Inserts a word into the trie. Returns False if the trie already contains the word.
+        """
+        node = 0
+        for symbol in word:
+            child = self.children[node].get(symbol)
+            if child is None:
+                child = len(self.children)
+                self.children[node][symbol] = child
+                self.children.append({})
+                self.words.append(None)
+            node = child
+        if self.words[node] is not None:
+            return False
+        self.words[node] = word
+        self.num_words += 1
+        return True
+
+    def update(self, words: Iterable[Union[str, List[str]]]) -> int:
+        """
+        Inserts the words into the trie. Returns the number of inserted words.
+        """
+        return sum(self.add(word) for word in words)
+
+    def search(
+        self,
+        query: Union[str, List[str]],
+        max_distance: float,
+        transpositions: bool = False,
+    ) -> List[Tuple[Union[str, List[str]], float]]:
+        """
+        Definition:
+        Returns the (word, distance) pairs of all the words of the trie whose edit distance from the query is at most max_distance, in increasing order of distance (ties are listed in depth-first order of the trie).
+        The distance is levenshtein_edit_distance(query, word) of algs, or damerau_levenshtein_edit_distance(query, word) if transpositions is True.
+
+        Notes:
+        (a) The trie is walked depth-first, and each node computes the row of the distance matrix (over the prefixes of the query) for the prefix of the words that it represents, from the row of its parent.
+            All the words that share a prefix therefore share the rows of that prefix; the search implicitly simulates a Levenshtein automaton of the query on the trie.
+        (b) Entries never decrease along a path of the distance matrix, so the subtree of a node is pruned once the minimum of its row exceeds max_distance
+            (with transpositions, the minimum of the row of its parent plus the transposition weight must exceed max_distance as well).
+        (c) Each visited node costs O(n) time, where n is the length of the query.
+        """
+        insert_weight = self.algs.insert_weight
+        delete_weight = self.algs.delete_weight
+        match_weight = self.algs.match_weight
+        substite_weight = self.algs.substite_weight
+        transposition_weight = self.algs.adjacent_transposition_weight
+        n = len(query)
+
+        # First row (the empty prefix): deleting the prefixes of the query.
+        root_row = [delete_weight * j for j in range(n + 1)]
+        results = []
+        visited = 1
+        pruned = 0
+        if self.words[0] is not None and root_row[n] <= max_distance:
+            results.append((self.words[0], float(root_row[n])))
+
+        # Each entry of the stack holds a node, its symbol, the row of its parent, and the row and symbol of its grandparent (for transpositions).
+        stack = [
+            (child, symbol, root_row, None, None)
+            for symbol, child in reversed(list(self.children[0].items()))
+        ]
+        while stack:
+            node, symbol, parent_row, grandparent_row, parent_symbol = stack.pop()
+            visited += 1
+            row = [parent_row[0] + insert_weight]
+            for j in range(1, n + 1):
+                value = parent_row[j - 1] + (
+                    match_weight if query[j - 1] == symbol else substite_weight
+                )
+                if parent_row[j] + insert_weight < value:
+                    value = parent_row[j] + insert_weight
+                if row[j - 1] + delete_weight < value:
+                    value = row[j - 1] + delete_weight
+                if (
+                    transpositions
+                    and grandparent_row is not None
+                    and j > 1
+                    and query[j - 1] == parent_symbol
+                    and query[j - 2] == symbol
+                    and grandparent_row[j - 2] + transposition_weight < value
+                ):
+                    value = grandparent_row[j - 2] + transposition_weight
+                row.append(value)
+
+            if self.words[node] is not None and row[n] <= max_distance:
+                results.append((self.words[node], float(row[n])))
+            if min(row) > max_distance and (
+                not transpositions
+                or min(parent_row) + transposition_weight > max_distance
+            ):
+                pruned += 1
+                continue
+            for child_symbol, child in reversed(list(self.children[node].items())):
+                stack.append((child, child_symbol, row, parent_row, symbol))
+
+        self.last_stats = {"visited_nodes": visited, "pruned_subtrees": pruned}
+        results.sort(key=lambda result: result[1])
+        return results
@@ -0,0 +1,55 @@
+"""
+    Vocabulary (symbol interning) for integer-encoded inputs.
+    Characters or tokens are mapped to dense integer ids (0, 1, 2, ...), so that comparing two symbols is a single integer comparison.
+"""
+
+# Import relevant libraries and dependencies
+from array import array
+from typing import Dict, Hashable, Iterable, List, Union
+
+
+class Vocabulary:
+    """
+    Class for a reusable mapping from symbols (characters or tokens) to dense integer ids
+    """
+
+    def __init__(self, symbols: Iterable[Hashable] = ()) -> None:
+        # Mapping from symbols to ids, and its inverse
+        self.symbol_to_id: Dict[Hashable, int] = {}
+        self.id_to_symbol: List[Hashable] = []
+        for symbol in symbols:
+            self.add(symbol)
+
+    def __len__(self) -> int:
+        return len(self.id_to_symbol)
+
+    def __contains__(self, symbol: Hashable) -> bool:
+        return symbol in self.symbol_to_id
+
+    def add(self, symbol: Hashable) -> int:
+        """
+        Adds a symbol to the vocabulary (if it is not already there) and returns its id.
+        """
+        symbol_id = self.symbol_to_id.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.id_to_symbol)
+            self.symbol_to_id[symbol] = symbol_id
+            self.id_to_symbol.append(symbol)
+        return symbol_id
+
+    def encode(self, sequence: Union[str, List[str]], grow: bool = True) -> array:
+        """
+        Encodes a string (character by character) or a list of tokens as an array('i') of ids.
+        If grow is False, a KeyError is raised for symbols that are not in the vocabulary.
+        """
+        if grow:
+            add = self.add
+            return array("i", [add(symbol) for symbol in sequence])
+        symbol_to_id = self.symbol_to_id
+        return array("i", [symbol_to_id[symbol] for symbol in sequence])
+
+    def decode(self, ids: Iterable[int]) -> List[Hashable]:
+        """
+        Maps a sequence of ids back to the list of their symbols.
+        """
+        return [self.id_to_symbol[symbol_id] for symbol_id in ids]
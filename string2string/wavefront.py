@@ -0,0 +1,124 @@
+"""
+    Vectorized (anti-diagonal wavefront) engine for the weighted Levenshtein edit distance.
+    Every anti-diagonal of the distance matrix is computed with a handful of NumPy operations.
+"""
+
+# Import relevant libraries and dependencies
+from array import array
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from string2string.vocabulary import Vocabulary
+
+
+def encode_pair(
+    str1: Union[str, List[str], array, np.ndarray],
+    str2: Union[str, List[str], array, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes two strings (or lists of strings) as integer arrays such that two symbols are equal iff their codes are equal.
+    Inputs that are already integer-encoded (e.g., by a Vocabulary) are used as they are.
+    """
+    if isinstance(str1, str) and isinstance(str2, str):
+        # Unicode code points.
+        return (
+            np.frombuffer(str1.encode("utf-32-le"), dtype=np.uint32).astype(np.intp),
+            np.frombuffer(str2.encode("utf-32-le"), dtype=np.uint32).astype(np.intp),
+        )
+    if isinstance(str1, (array, np.ndarray)) and isinstance(str2, (array, np.ndarray)):
+        return np.asarray(str1, dtype=np.intp), np.asarray(str2, dtype=np.intp)
+    vocabulary = Vocabulary()
+    return (
+        np.asarray(vocabulary.encode(str1), dtype=np.intp),
+        np.asarray(vocabulary.encode(str2), dtype=np.intp),
+    )
+
+
+def wavefront_levenshtein(
+    codes1: np.ndarray,
+    codes2: np.ndarray,
+    insert_weight: float = 1.0,
+    delete_weight: float = 1.0,
+    match_weight: float = 0.0,
+    substite_weight: float = 1.0,
+    substitution_costs: Optional[np.ndarray] = None,
+    insert_costs: Optional[np.ndarray] = None,
+    delete_costs: Optional[np.ndarray] = None,
+) -> float:
+    """
+    Definition:
+    Computes the weighted Levenshtein edit distance between two integer-encoded sequences, one anti-diagonal of the distance matrix at a time.
+
+    Arguments:
+    (a) codes1, codes2: The encoded sequences (non-negative integers indexing the cost tables below).
+    (b) substitution_costs: Optional matrix where substitution_costs[a, b] is the cost of replacing symbol a (of codes1) with symbol b (of codes2); its diagonal holds the match costs.
+        If it is not given, the cost is match_weight if a == b and substite_weight otherwise.
+    (c) insert_costs, delete_costs: Optional vectors of per-symbol insertion (of a symbol of codes2) and deletion (of a symbol of codes1) costs.
+        If they are not given, insert_weight and delete_weight are used.
+
+    Notes:
+    (a) All the entries d[i, j] with i + j = t only depend on the anti-diagonals t-1 and t-2, so each anti-diagonal is computed as a single vectorized operation.
+    (b) The time complexity is O(nm), with O(n + m) NumPy calls. Only three anti-diagonals are kept, so the space complexity is O(n + m).
+    """
+    codes1 = np.asarray(codes1, dtype=np.intp)
+    codes2 = np.asarray(codes2, dtype=np.intp)
+    n = len(codes1)
+    m = len(codes2)
+
+    # Per-position insertion and deletion costs.
+    if insert_costs is not None:
+        insert_vector = np.asarray(insert_costs, dtype=np.float64)[codes2]
+    else:
+        insert_vector = np.full(m, insert_weight, dtype=np.float64)
+    if delete_costs is not None:
+        delete_vector = np.asarray(delete_costs, dtype=np.float64)[codes1]
+    else:
+        delete_vector = np.full(n, delete_weight, dtype=np.float64)
+    if substitution_costs is not None:
+        substitution_costs = np.asarray(substitution_costs, dtype=np.float64)
+
+    # First column (d[i, 0]) and first row (d[0, j]) of the distance matrix.
+    first_column = np.concatenate(([0.0], np.cumsum(delete_vector)))
+    first_row = np.concatenate(([0.0], np.cumsum(insert_vector)))
+    if n == 0:
+        return float(first_row[m])
+    if m == 0:
+        return float(first_column[n])
+
+    # The anti-diagonals are indexed by the row i (with j = t - i).
+    prev2 = np.full(n + 1, np.inf)
+    prev1 = np.full(n + 1, np.inf)
+    curr = np.full(n + 1, np.inf)
+    prev2[0] = 0.0
+    prev1[0] = first_row[1]
+    prev1[1] = first_column[1]
+
+    for t in range(2, n + m + 1):
+        # Interior entries of the anti-diagonal: lo <= i <= hi.
+        lo = max(1, t - m)
+        hi = min(n, t - 1)
+        if lo <= hi:
+            # str1[i-1] for i = lo, ..., hi and str2[j-1] for j = t-lo, ..., t-hi.
+            symbols1 = codes1[lo - 1 : hi]
+            symbols2 = codes2[t - hi - 1 : t - lo][::-1]
+            if substitution_costs is not None:
+                diagonal_costs = substitution_costs[symbols1, symbols2]
+            else:
+                diagonal_costs = np.where(
+                    symbols1 == symbols2, match_weight, substite_weight
+                )
+            out = curr[lo : hi + 1]
+            # d[i, j] = min(d[i-1, j-1] + sub(i, j), d[i, j-1] + ins(j), d[i-1, j] + del(i))
+            np.minimum(
+                prev2[lo - 1 : hi] + diagonal_costs,
+                prev1[lo : hi + 1] + insert_vector[t - hi - 1 : t - lo][::-1],
+                out=out,
+            )
+            np.minimum(out, prev1[lo - 1 : hi] + delete_vector[lo - 1 : hi], out=out)
+        if t <= m:
+            curr[0] = first_row[t]
+        if t <= n:
+            curr[t] = first_column[t]
+        prev2, prev1, curr = prev1, curr, prev2
+
+    return float(prev1[n])
@@ -0,0 +1,136 @@
+"""
+    Unit test cases for async_edit_distance.py
+"""
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from string2string.async_edit_distance import AsyncEditDistAlgs
+from string2string.cache import ResultCache
+from string2string.edit_distance import EditDistAlgs
+from string2string.instrumentation import Instrumentation
+
+
+class AsyncEditDistAlgsTestCase(TestCase):
+    def test_compute(self):
+        async def main():
+            async_algs = AsyncEditDistAlgs()
+            # Example 1
+            self.assertEqual(
+                await async_algs.levenshtein_edit_distance("kitten", "sitting"), 3.0
+            )
+            self.assertEqual(
+                await async_algs.compute(
+                    "longest_common_subsequence", "abcd", "xcxaaabydy"
+                ),
+                (3.0, None),
+            )
+            # Example 2: Errors are raised in the caller.
+            with self.assertRaises(ValueError):
+                await async_algs.hamming_distance("abc", "ab")
+            with self.assertRaises(ValueError):
+                await async_algs.compute("soundex", "abc", "ab")
+            with self.assertRaises(AttributeError):
+                async_algs.soundex
+
+        asyncio.run(main())
+
+    def test_batching_and_deduplication(self):
+        async def main():
+            async_algs = AsyncEditDistAlgs(
+                EditDistAlgs(substite_weight=2.0), batch_window=0.01, max_batch_size=4
+            )
+            pairs = [("kitten", "sitting"), ("book", "back"), ("kitten", "sitting")]
+            pairs += [("a" * i, "b") for i in range(6)]
+            results = await asyncio.gather(
+                *(async_algs.levenshtein_edit_distance(*pair) for pair in pairs)
+            )
+            algs = EditDistAlgs(substite_weight=2.0)
+            self.assertEqual(
+                results, [algs.levenshtein_edit_distance(*pair) for pair in pairs]
+            )
+            # Example 1: The duplicate pair is computed once, and the 8 distinct pairs are computed in two batches.
+            self.assertEqual(
+                async_algs.stats,
+                {"requests": 9, "deduplicated": 1, "batches": 2, "computed": 8},
+            )
+            self.assertEqual(async_algs.pending, 0)
+
+        asyncio.run(main())
+
+    def test_back_pressure(self):
+        async def main():
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                async_algs = AsyncEditDistAlgs(
+                    executor=executor, batch_window=0.001, max_pending=2
+                )
+                observed = []
+
+                async def request(index):
+                    value = await async_algs.levenshtein_edit_distance(
+                        "a" * index, "b" * 10
+                    )
+                    observed.append(async_algs.pending)
+                    return value
+
+                results = await asyncio.gather(*(request(i) for i in range(10)))
+                self.assertEqual(results, [float(max(i, 10)) for i in range(10)])
+                self.assertLessEqual(max(observed), 2)
+
+        asyncio.run(main())
+
+    def test_overlapping_batches(self):
+        async def main():
+            cache = ResultCache(max_entries=8)
+            guard = threading.Lock()
+            running = [0]
+            overlaps = []
+
+            def callback(event):
+                # Batches that share algs must never run at the same time.
+                with guard:
+                    running[0] += 1
+                    overlaps.append(running[0] > 1)
+                time.sleep(0.001)
+                with guard:
+                    running[0] -= 1
+
+            instrumentation = Instrumentation(callback=callback)
+            algs = EditDistAlgs(
+                substite_weight=2.0, cache=cache, instrumentation=instrumentation
+            )
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                async_algs = AsyncEditDistAlgs(
+                    algs, executor=executor, batch_window=0.0005, max_batch_size=3
+                )
+                pairs = [("ab" * (i % 13), "ba" * (i % 7)) for i in range(120)]
+                results = await asyncio.gather(
+                    *(
+                        async_algs.levenshtein_edit_distance(str1, str2)
+                        for str1, str2 in pairs
+                    )
+                )
+            # Example 1: The results and the counters are consistent.
+            expected = [
+                EditDistAlgs(substite_weight=2.0).levenshtein_edit_distance(str1, str2)
+                for str1, str2 in pairs
+            ]
+            self.assertEqual(results, expected)
+            self.assertGreater(async_algs.stats["batches"], 1)
+            self.assertLessEqual(len(cache), 8)
+            self.assertEqual(cache.hits + cache.misses, async_algs.stats["computed"])
+            self.assertEqual(
+                instrumentation.stats()["levenshtein_edit_distance"]["calls"],
+                cache.misses,
+            )
+            self.assertEqual(len(overlaps), cache.misses)
+            self.assertFalse(any(overlaps))
+
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+    Unit test cases for the benchmark suite (benchmarks/)
+"""
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from benchmarks.__main__ import main
+from benchmarks.import_time import check_import_budget, measure_import
+from benchmarks.runner import METHODS, compare_results, run_case, run_suite
+from benchmarks.workloads import generate_pair, generate_workloads
+
+
+class BenchmarksTestCase(TestCase):
+    def test_workloads(self):
+        # Example 1: Workloads are reproducible.
+        self.assertEqual(
+            generate_pair("random", "char", 100), generate_pair("random", "char", 100)
+        )
+        self.assertNotEqual(
+            generate_pair("random", "char", 100, seed=0),
+            generate_pair("random", "char", 100, seed=1),
+        )
+        # Example 2: Kinds and units
+        workload = generate_pair("near_identical", "token", 1000)
+        self.assertIsInstance(workload.str1, list)
+        self.assertNotEqual(workload.str1, workload.str2)
+        self.assertLessEqual(abs(len(workload.str1) - len(workload.str2)), 10)
+        workload = generate_pair("repetitive", "char", 12)
+        self.assertEqual(workload.str1[:3], workload.str1[3:6])
+        self.assertEqual(len(list(generate_workloads(lengths=(10, 20)))), 12)
+        with self.assertRaises(ValueError):
+            generate_pair("sorted", "char", 10)
+
+    def test_run_suite(self):
+        workloads = list(generate_workloads(kinds=("random",), lengths=(10,)))
+        results = run_suite(
+            workloads,
+            methods=("levenshtein_edit_distance", "hamming_distance"),
+            repeat=1,
+        )
+        # Example 1: One result per workload, method, and cost model
+        self.assertEqual(len(results["results"]), 8)
+        for result in results["results"]:
+            self.assertEqual(result["status"], "ok")
+            self.assertGreater(result["cells_per_second"], 0)
+            self.assertGreaterEqual(result["peak_bytes"], 0)
+        self.assertIn("python", results["metadata"])
+        # Example 2: Cases above max_cells are skipped.
+        result = run_case("levenshtein_edit_distance", workloads[0], max_cells=10)
+        self.assertEqual(result["status"], "skipped")
+        # Example 3: Exponential methods have their own limit (whatever max_cells is).
+        methods = [method for method in METHODS if "subsequence" in method]
+        for method in methods:
+            result = run_case(method, workloads[0], repeat=1)
+            self.assertEqual(result["status"], "ok")
+        workload = generate_pair("random", "char", 100)
+        result = run_case(
+            "longest_common_subsequence[backtrack]", workload, max_cells=None
+        )
+        self.assertEqual(result["status"], "skipped")
+        with self.assertRaises(ValueError):
+            run_suite(workloads, methods=("soundex",))
+
+    def test_compare(self):
+        case = {
+            "method": "levenshtein_edit_distance",
+            "costs": "unit",
+            "kind": "random",
+            "unit": "char",
+            "length": 1000,
+            "status": "ok",
+        }
+        baseline = {"results": [dict(case, seconds=0.010, peak_bytes=1000)]}
+        faster = {"results": [dict(case, seconds=0.009, peak_bytes=1050)]}
+        slower = {"results": [dict(case, seconds=0.012, peak_bytes=1000)]}
+        # Example 1
+        self.assertEqual(compare_results(baseline, faster, threshold=0.1), [])
+        regressions = compare_results(baseline, slower, threshold=0.1)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["metric"], "seconds")
+        self.assertAlmostEqual(regressions[0]["ratio"], 1.2)
+        # Example 2: Timings below min_seconds are ignored.
+        self.assertEqual(compare_results(baseline, slower, min_seconds=0.1), [])
+        # Example 3: Command-line interface
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, results in (("baseline", baseline), ("slower", slower)):
+                paths.append(os.path.join(directory, f"{name}.json"))
+                with open(paths[-1], "w", encoding="utf-8") as file:
+                    json.dump(results, file)
+            with open(os.devnull, "w") as devnull:
+                with redirect_stdout(devnull):
+                    self.assertEqual(main(["compare", paths[0], paths[0]]), 0)
+                    self.assertEqual(main(["compare", paths[0], paths[1]]), 1)
+
+    def test_import_time(self):
+        # Example 1: Importing edit_distance.py does not import NumPy.
+        result = measure_import("string2string.edit_distance")
+        self.assertEqual(result["heavy_modules"], [])
+        self.assertGreater(result["seconds"], 0)
+        # The pure-Python modules built on it do not import NumPy either.
+        for module in ["string2string.bk_tree", "string2string.async_edit_distance"]:
+            self.assertEqual(measure_import(module)["heavy_modules"], [])
+        # Example 2: Modules that need NumPy are reported.
+        result = measure_import("string2string.wavefront")
+        self.assertEqual(result["heavy_modules"], ["numpy"])
+        # Example 3: Budget
+        result = check_import_budget(budget=10.0, repeat=1)
+        self.assertTrue(result["within_budget"])
+        result = check_import_budget(budget=0.0, repeat=1)
+        self.assertFalse(result["within_budget"])
+        with self.assertRaises(ValueError):
+            check_import_budget(repeat=0)
+        # Example 4: Command-line interface
+        with open(os.devnull, "w") as devnull:
+            with redirect_stdout(devnull):
+                self.assertEqual(
+                    main(["import-time", "--budget", "0", "--repeat", "1"]), 1
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
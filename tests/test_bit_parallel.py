@@ -0,0 +1,99 @@
+"""
+    Unit test cases for bit_parallel.py
+"""
+import random
+import unittest
+from unittest import TestCase
+
+from string2string.bit_parallel import (
+    hyyro_lcs_length,
+    hyyro_osa,
+    myers_levenshtein,
+    pattern_match_vectors,
+)
+from string2string.edit_distance import EditDistAlgs
+
+
+class BitParallelTestCase(TestCase):
+    def test_pattern_match_vectors(self):
+        # Example 1
+        peq = pattern_match_vectors("abca")
+        self.assertEqual(peq, {"a": 0b1001, "b": 0b0010, "c": 0b0100})
+        # Example 2
+        peq = pattern_match_vectors(["kurt", "godel", "kurt"])
+        self.assertEqual(peq, {"kurt": 0b101, "godel": 0b010})
+        # Example 3
+        self.assertEqual(pattern_match_vectors(""), {})
+
+    def test_myers_levenshtein(self):
+        # Example 1
+        self.assertEqual(myers_levenshtein("", ""), 0)
+        # Example 2
+        self.assertEqual(myers_levenshtein("kitten", "sitting"), 3)
+        # Example 3
+        self.assertEqual(myers_levenshtein("", "abcdef"), 6)
+        # Example 4
+        self.assertEqual(myers_levenshtein("algorithm", "al-Khwarizmi"), 8)
+        # Example 5
+        self.assertEqual(myers_levenshtein(["kurt", "godel"], ["godel", "kurt"]), 2)
+        # Example 6: Patterns longer than a machine word.
+        self.assertEqual(myers_levenshtein("ab" * 100, "ba" * 100), 2)
+        self.assertEqual(myers_levenshtein("a" * 130, "b" * 70), 130)
+
+    def test_myers_levenshtein_max_distance(self):
+        # Example 1
+        self.assertEqual(myers_levenshtein("kitten", "sitting", max_distance=3), 3)
+        # Example 2
+        self.assertEqual(myers_levenshtein("kitten", "sitting", max_distance=2), 3)
+        # Example 3
+        self.assertEqual(myers_levenshtein("a" * 100, "b" * 100, max_distance=5), 6)
+        # Example 4
+        self.assertEqual(myers_levenshtein("abcdef", "", max_distance=1), 2)
+
+    def test_agrees_with_dynamic_programming(self):
+        algs_dp = EditDistAlgs(substite_weight=1.0 + 1e-9)
+        rng = random.Random(0)
+        for _ in range(200):
+            str1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            str2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            expected = round(algs_dp.levenshtein_edit_distance(str1, str2))
+            self.assertEqual(myers_levenshtein(str1, str2), expected)
+
+    def test_hyyro_osa(self):
+        # Example 1
+        self.assertEqual(hyyro_osa("", ""), 0)
+        self.assertEqual(hyyro_osa("ca", "abc"), 3)
+        # Example 2
+        self.assertEqual(hyyro_osa("abxymn", "bayxnm"), 3)
+        self.assertEqual(hyyro_osa("abxymn", "bayxnm", max_distance=2), 3)
+        # Example 3: Patterns longer than a machine word.
+        self.assertEqual(hyyro_osa("ab" * 100, "ba" * 100), 2)
+
+    def test_hyyro_osa_agrees_with_dynamic_programming(self):
+        algs_dp = EditDistAlgs(substite_weight=1.0 + 1e-9)
+        rng = random.Random(0)
+        for _ in range(200):
+            str1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            str2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            expected = round(algs_dp.damerau_levenshtein_edit_distance(str1, str2))
+            self.assertEqual(hyyro_osa(str1, str2), expected)
+
+    def test_hyyro_lcs_length(self):
+        # Example 1
+        self.assertEqual(hyyro_lcs_length("aabbccdd", "dcdcbaba"), 2)
+        self.assertEqual(hyyro_lcs_length("abcd", "xcxaaabydy"), 3)
+        self.assertEqual(hyyro_lcs_length("", "abc"), 0)
+        # Example 2: Lists of strings
+        self.assertEqual(hyyro_lcs_length(["a", "bb", "c"], ["x", "a", "c", "bb"]), 2)
+        # Example 3: Agreement with the dynamic programming
+        algs = EditDistAlgs()
+        rng = random.Random(0)
+        for _ in range(200):
+            str1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            str2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 70)))
+            expected, _ = algs.one_longest_common_subsequence(str1, str2)
+            self.assertEqual(hyyro_lcs_length(str1, str2), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+    Unit test cases for bk_tree.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.bk_tree import BKTree
+from string2string.edit_distance import EditDistAlgs
+
+
+class BKTreeTestCase(TestCase):
+    def test_range_query(self):
+        words = ["book", "books", "cake", "boo", "cape", "cart", "boon", "book"]
+        tree = BKTree(words)
+        # Example 1: Duplicates are not inserted.
+        self.assertEqual(len(tree), 7)
+        self.assertIn("cake", tree)
+        self.assertNotIn("cak", tree)
+        # Example 2
+        self.assertEqual(
+            tree.range_query("bool", 1), [("book", 1.0), ("boo", 1.0), ("boon", 1.0)]
+        )
+        self.assertEqual(tree.range_query("xyz", 1), [])
+        # Example 3
+        self.assertEqual(
+            tree.last_stats["distance_evaluations"] + tree.last_stats["pruned"], 7
+        )
+        self.assertEqual(tree.stats["queries"], 4)
+        # Example 4: Incremental insertion.
+        self.assertTrue(tree.add("bool"))
+        self.assertEqual(tree.range_query("bool", 0), [("bool", 0.0)])
+
+    def test_nearest(self):
+        words = ["kitten", "sitting", "mitten", "fitting", "written", "bitten"]
+        tree = BKTree(words)
+        # Example 1: Ties are broken by insertion order.
+        self.assertEqual(
+            tree.nearest("sitten", 3),
+            [("kitten", 1.0), ("mitten", 1.0), ("bitten", 1.0)],
+        )
+        # Example 2
+        self.assertEqual(tree.nearest("fitting"), [("fitting", 0.0)])
+        self.assertEqual(len(tree.nearest("fitting", 100)), 6)
+        self.assertEqual(tree.nearest("fitting", 0), [])
+
+    def test_metrics(self):
+        # Example 1: Hamming distance
+        tree = BKTree(["0000", "0011", "1111", "0101"], metric="hamming_distance")
+        self.assertEqual(tree.nearest("0001", 2), [("0000", 1.0), ("0011", 1.0)])
+        # Example 2: Weighted Levenshtein distance over lists of tokens
+        algs = EditDistAlgs(insert_weight=2.0, delete_weight=2.0, substite_weight=3.0)
+        tree = BKTree([["kurt", "godel"], ["kurt"], ["escher"]], algs=algs)
+        self.assertEqual(
+            tree.range_query(["kurt", "escher"], 3.0),
+            [(["kurt"], 2.0), (["escher"], 2.0), (["kurt", "godel"], 3.0)],
+        )
+        # Example 3: Jaccard index (distinct strings with the same set are kept)
+        tree = BKTree(["abc", "cba", "abd"], metric="jaccard_index")
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.range_query("bca", 0), [("abc", 0.0), ("cba", 0.0)])
+        # Example 4: Damerau-Levenshtein distance (unrestricted, since the restricted variant is not a metric)
+        tree = BKTree(["ca", "ac", "abc"], metric="damerau_levenshtein_edit_distance")
+        self.assertEqual(
+            tree.range_query("ca", 2), [("ca", 0.0), ("ac", 1.0), ("abc", 2.0)]
+        )
+        # Example 5
+        with self.assertRaises(ValueError):
+            BKTree(metric="longest_common_subsequence")
+        with self.assertRaises(ValueError):
+            BKTree(algs=EditDistAlgs(insert_weight=2.0))
+        with self.assertRaises(ValueError):
+            BKTree(
+                metric="damerau_levenshtein_edit_distance",
+                algs=EditDistAlgs(delete_weight=2.0),
+            )
+        with self.assertRaises(ValueError):
+            BKTree(
+                metric="damerau_levenshtein_edit_distance",
+                algs=EditDistAlgs(adjacent_transposition_weight=0.5),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+    Unit test cases for cache.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.cache import ResultCache
+from string2string.edit_distance import EditDistAlgs
+
+
+class ResultCacheTestCase(TestCase):
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # Example 1: "a" becomes the most recently used entry.
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        # Example 2
+        self.assertEqual(
+            cache.stats(),
+            {"entries": 2, "hits": 2, "misses": 1, "evictions": 1, "bypassed": 0},
+        )
+
+    def test_cached_methods(self):
+        cache = ResultCache(max_entries=16, max_input_length=10)
+        algs = EditDistAlgs(cache=cache)
+        # Example 1
+        self.assertEqual(algs.levenshtein_edit_distance("kitten", "sitting"), 3.0)
+        self.assertEqual(algs.levenshtein_edit_distance("kitten", "sitting"), 3.0)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Example 2: Symmetric metrics share a single entry.
+        self.assertEqual(algs.levenshtein_edit_distance("sitting", "kitten"), 3.0)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        # Example 3: Other arguments are part of the key.
+        dist = algs.levenshtein_edit_distance("kitten", "sitting", max_distance=1)
+        self.assertEqual(dist, float("inf"))
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        # Example 4: Admission policy
+        self.assertEqual(algs.hamming_distance("a" * 20, "b" * 20), 20.0)
+        self.assertEqual(cache.bypassed, 1)
+        # Example 5: Cached results cannot be modified by the caller.
+        length, candidates = algs.longest_common_subsequence(
+            "abcd", "acbd", printBacktrack=True
+        )
+        candidates.append("xyz")
+        length, candidates = algs.longest_common_subsequence(
+            "abcd", "acbd", printBacktrack=True
+        )
+        self.assertCountEqual(candidates, ["abd", "acd"])
+        # Example 6: Lists of tokens
+        self.assertEqual(
+            algs.jaccard_similarity_coefficient(["a", "b"], ["b", "c"]), 1.0 / 3.0
+        )
+        self.assertEqual(
+            algs.jaccard_similarity_coefficient(["b", "c"], ["a", "b"]), 1.0 / 3.0
+        )
+        self.assertEqual(cache.hits, 4)
+        # Example 7: Unhashable tokens are not cached.
+        self.assertEqual(algs.hamming_distance([[1], [2]], [[1], [3]]), 1.0)
+        self.assertEqual(cache.bypassed, 2)
+
+    def test_weights_and_symmetry(self):
+        cache = ResultCache()
+        # Example 1: Instances with different weights never share entries.
+        algs_unit = EditDistAlgs(cache=cache)
+        algs_weighted = EditDistAlgs(insert_weight=2.0, cache=cache)
+        self.assertEqual(algs_unit.levenshtein_edit_distance("ab", "abc"), 1.0)
+        self.assertEqual(algs_weighted.levenshtein_edit_distance("ab", "abc"), 2.0)
+        # Example 2: The weighted distance is not symmetric.
+        self.assertEqual(algs_weighted.levenshtein_edit_distance("abc", "ab"), 1.0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(len(cache), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+    Unit test cases for cascade.py
+"""
+import random
+import unittest
+from unittest import TestCase
+
+from string2string.cascade import CascadeSearch
+from string2string.edit_distance import EditDistAlgs
+
+
+class CascadeSearchTestCase(TestCase):
+    def test_top_k(self):
+        words = ["book", "books", "cake", "boo", "cape", "cart", "boon", "bool"]
+        search = CascadeSearch(words)
+        # Example 1: Ties are broken by the order of the candidates.
+        self.assertEqual(
+            search.top_k("book", 3), [("book", 0.0), ("books", 1.0), ("boo", 1.0)]
+        )
+        self.assertEqual(search.top_k("cakes", 1), [("cake", 1.0)])
+        self.assertEqual(search.top_k("xyz", 2, max_distance=2), [])
+        # Example 2: Every candidate is either verified or eliminated by one stage.
+        self.assertEqual(sum(search.last_stats.values()), len(words))
+        self.assertEqual(search.stats["queries"], 3)
+        with self.assertRaises(ValueError):
+            search.top_k("book", 0)
+        with self.assertRaises(ValueError):
+            CascadeSearch(words, metric="jaccard_index")
+
+    def test_within(self):
+        words = ["kitten", "sitting", "mitten", "kitchen", "smitten", "bitter", "k"]
+        search = CascadeSearch(words)
+        # Example 1
+        self.assertEqual(search.within("kitten", 1), [("kitten", 0.0), ("mitten", 1.0)])
+        self.assertEqual(search.last_stats["verified"], 2)
+        self.assertEqual(search.last_stats["length"], 1)
+        # Example 2: Transpositions
+        search = CascadeSearch(words, metric="damerau_levenshtein_edit_distance")
+        self.assertEqual(search.within("iktten", 1), [("kitten", 1.0)])
+
+    def test_agrees_with_exhaustive_search(self):
+        rng = random.Random(0)
+        words = [
+            "".join(rng.choice("abcde") for _ in range(rng.randint(0, 12)))
+            for _ in range(300)
+        ]
+        for algs in (
+            EditDistAlgs(),
+            EditDistAlgs(insert_weight=2.0, delete_weight=1.0, substite_weight=1.5),
+        ):
+            for metric in (
+                "levenshtein_edit_distance",
+                "damerau_levenshtein_edit_distance",
+            ):
+                search = CascadeSearch(words, metric=metric, algs=algs)
+                function = getattr(algs, metric)
+                for query in words[:10]:
+                    expected = sorted(
+                        (function(query, word), index)
+                        for index, word in enumerate(words)
+                    )
+                    self.assertEqual(
+                        search.top_k(query, 5),
+                        [(words[index], dist) for dist, index in expected[:5]],
+                    )
+                    self.assertEqual(
+                        search.within(query, 2.0),
+                        [(words[index], dist) for dist, index in expected if dist <= 2],
+                    )
+                self.assertGreater(search.stats["histogram"], 0)
+        # Example 2: Lists of tokens
+        search = CascadeSearch([["kurt", "godel"], ["kurt", "escher", "bach"]])
+        self.assertEqual(
+            search.top_k(["kurt", "bach"], 1, max_distance=1),
+            [(["kurt", "godel"], 1.0)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,10 @@ from dis import dis
 import unittest
 from unittest import TestCase
 
+import numpy as np
+
 from string2string.edit_distance import EditDistAlgs
+from string2string.vocabulary import Vocabulary
 
 
 class EditDistanceTestCase(TestCase):
@@ -75,6 +78,97 @@ class EditDistanceTestCase(TestCase):
         dist = algs_weighted.levenshtein_edit_distance("ttss", "stst")
         self.assertEqual(dist, 2.0)
 
+        ## Case 2b: insertion = deletion = substitution = 2., match = 0. (bit-parallel engine)
+        algs_uniform = EditDistAlgs(
+            insert_weight=2.0, delete_weight=2.0, match_weight=0.0, substite_weight=2.0
+        )
+        # Example 1
+        dist = algs_uniform.levenshtein_edit_distance("kitten", "sitting")
+        self.assertEqual(dist, 6.0)
+        # Example 2
+        dist = algs_uniform.levenshtein_edit_distance(["kurt", "godel"], [])
+        self.assertEqual(dist, 4.0)
+
+    def test_levenshtein_edit_distance_linear_space(self):
+        ## Case 3: Two (or three) rows of the distance matrix are kept.
+        # Example 1
+        algs_fractional = EditDistAlgs(insert_weight=0.5)
+        dist = algs_fractional.levenshtein_edit_distance("ab", "abcd")
+        self.assertEqual(dist, 1.0)
+        # Example 2: Asymmetric weights (the shorter string is placed along the columns internally).
+        algs_asymmetric = EditDistAlgs(insert_weight=1.0, delete_weight=3.0)
+        dist = algs_asymmetric.levenshtein_edit_distance("abcd", "ab")
+        self.assertEqual(dist, 6.0)
+        dist = algs_asymmetric.levenshtein_edit_distance("ab", "abcd")
+        self.assertEqual(dist, 2.0)
+        dist = algs_asymmetric.damerau_levenshtein_edit_distance("badc", "ab")
+        self.assertEqual(dist, 7.0)
+        dist = algs_asymmetric.damerau_levenshtein_edit_distance("ab", "badc")
+        self.assertEqual(dist, 3.0)
+        # Example 3: Long rows
+        algs_weighted = EditDistAlgs(substite_weight=2.0)
+        str1 = "ab" * 2500
+        str2 = "ab" * 2499 + "b"
+        dist = algs_weighted.levenshtein_edit_distance(str1, str2, max_distance=10)
+        self.assertEqual(dist, 1.0)
+        dist = algs_weighted.damerau_levenshtein_edit_distance(
+            str1, str2, max_distance=10
+        )
+        self.assertEqual(dist, 1.0)
+        dist = algs_weighted.levenshtein_edit_distance(str1, str2, max_distance=0.5)
+        self.assertEqual(dist, float("inf"))
+        # Example 4: The attributes are fixed (__slots__).
+        with self.assertRaises(AttributeError):
+            algs_weighted.insertion_weight = 2.0
+
+    def test_levenshtein_edit_distance_max_distance(self):
+        algs_unit = EditDistAlgs()
+        algs_weighted = EditDistAlgs(
+            insert_weight=2.0, delete_weight=2.0, match_weight=0.0, substite_weight=1.0
+        )
+        # Example 1
+        dist = algs_unit.levenshtein_edit_distance("kitten", "sitting", max_distance=3)
+        self.assertEqual(dist, 3.0)
+        # Example 2
+        dist = algs_unit.levenshtein_edit_distance("kitten", "sitting", max_distance=2)
+        self.assertEqual(dist, float("inf"))
+        # Example 3: The length difference alone exceeds the bound.
+        dist = algs_unit.levenshtein_edit_distance("aaaaa", "a", max_distance=3)
+        self.assertEqual(dist, float("inf"))
+        # Example 4
+        dist = algs_weighted.levenshtein_edit_distance("ttss", "stst", max_distance=2)
+        self.assertEqual(dist, 2.0)
+        # Example 5
+        dist = algs_weighted.levenshtein_edit_distance("ttss", "stst", max_distance=1.5)
+        self.assertEqual(dist, float("inf"))
+        # Example 6
+        dist = algs_weighted.levenshtein_edit_distance("aa", "", max_distance=3)
+        self.assertEqual(dist, float("inf"))
+        # Example 7
+        dist = algs_weighted.levenshtein_edit_distance(
+            ["kurt", "godel", "kurt"], ["godel", "kurt"], max_distance=2
+        )
+        self.assertEqual(dist, 2.0)
+        # Example 8
+        dist = algs_weighted.levenshtein_edit_distance(
+            "a" * 50 + "b" * 50, "b" * 50 + "a" * 50, max_distance=10
+        )
+        self.assertEqual(dist, float("inf"))
+        # Example 9: An infinite bound is the same as no bound (uniform and weighted costs).
+        for algs in [algs_unit, algs_weighted]:
+            for method in [
+                algs.levenshtein_edit_distance,
+                algs.damerau_levenshtein_edit_distance,
+            ]:
+                self.assertEqual(
+                    method("kitten", "sitting", max_distance=float("inf")),
+                    method("kitten", "sitting"),
+                )
+                self.assertEqual(
+                    method("kitten", "sitting", max_distance=-float("inf")),
+                    float("inf"),
+                )
+
     def test_damerau_levenshtein_edit_distance_unit_operations(self):
         ## Case 1: Costs of insertion, deletion, substitution, and transposition are all 1.
         algs_unit = EditDistAlgs()
@@ -124,6 +218,143 @@ class EditDistanceTestCase(TestCase):
         dist = algs_unit.damerau_levenshtein_edit_distance("microaoft", "microsoft")
         self.assertEqual(dist, 1.0)
 
+    def test_damerau_levenshtein_edit_distance_unrestricted(self):
+        algs_unit = EditDistAlgs()
+        # Example 1: "ca" -> "ac" -> "abc"
+        dist = algs_unit.damerau_levenshtein_edit_distance("ca", "abc")
+        self.assertEqual(dist, 3.0)
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "ca", "abc", restricted=False
+        )
+        self.assertEqual(dist, 2.0)
+        # Example 2
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "abxymn", "bayxnm", restricted=False
+        )
+        self.assertEqual(dist, 3.0)
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "abxymn", "bayxnm", max_distance=2, restricted=False
+        )
+        self.assertEqual(dist, float("inf"))
+        # Example 3
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            ["kurt", "godel", "escher"], ["escher", "kurt"], restricted=False
+        )
+        self.assertEqual(dist, 2.0)
+        # Example 4: Weighted operations
+        algs_weighted = EditDistAlgs(
+            insert_weight=2.0,
+            delete_weight=2.0,
+            substite_weight=5.0,
+            adjacent_transposition_weight=3.0,
+        )
+        dist = algs_weighted.damerau_levenshtein_edit_distance(
+            "ca", "abc", restricted=False
+        )
+        self.assertEqual(dist, 5.0)
+
+    def test_damerau_levenshtein_edit_distance_max_distance(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "abxymn", "bayxnm", max_distance=3
+        )
+        self.assertEqual(dist, 3.0)
+        # Example 2
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "abxymn", "bayxnm", max_distance=2
+        )
+        self.assertEqual(dist, float("inf"))
+        # Example 3
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            "wikiepdia", "wikipedia", max_distance=1
+        )
+        self.assertEqual(dist, 1.0)
+        # Example 4
+        dist = algs_unit.damerau_levenshtein_edit_distance("ab", "ba", max_distance=0)
+        self.assertEqual(dist, float("inf"))
+        # Example 5
+        dist = algs_unit.damerau_levenshtein_edit_distance("", "", max_distance=0)
+        self.assertEqual(dist, 0.0)
+
+    def test_prepare_pair(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        str1, str2, num_stripped = algs_unit._prepare_pair(
+            "kitten", "sitting", strip_affix=True
+        )
+        self.assertEqual((str1, str2, num_stripped), ("kitten", "sitting", 0))
+        # Example 2
+        str1, str2, num_stripped = algs_unit._prepare_pair(
+            "monty-python", "monty-pythons", strip_affix=True
+        )
+        self.assertEqual((str1, str2, num_stripped), ("", "s", 12))
+        # Example 3
+        str1, str2, num_stripped = algs_unit._prepare_pair(
+            "abcxyz", "abyz", strip_affix=True
+        )
+        self.assertEqual((str1, str2, num_stripped), ("cx", "", 4))
+        # Example 4: Tokens are mapped to integer ids.
+        str1, str2, _ = algs_unit._prepare_pair(["kurt", "godel"], ["godel", "escher"])
+        self.assertEqual(list(str1), [0, 1])
+        self.assertEqual(list(str2), [1, 2])
+
+    def test_pre_encoded_inputs(self):
+        vocabulary = Vocabulary()
+        algs_unit = EditDistAlgs(vocabulary=vocabulary)
+        # Example 1
+        dist = algs_unit.levenshtein_edit_distance(["kurt", "godel"], ["godel", "kurt"])
+        self.assertEqual(dist, 2.0)
+        self.assertEqual(len(vocabulary), 2)
+        # Example 2
+        str1 = vocabulary.encode(["kurt", "godel", "kurt"])
+        str2 = vocabulary.encode(["godel", "kurt"])
+        dist = algs_unit.levenshtein_edit_distance(str1, str2)
+        self.assertEqual(dist, 1.0)
+        dist = algs_unit.damerau_levenshtein_edit_distance(
+            np.array(str1), np.array(str2)
+        )
+        self.assertEqual(dist, 1.0)
+        # Example 3
+        dist, _ = algs_unit.longest_common_subsequence(np.array(str1), np.array(str2))
+        self.assertEqual(dist, 2.0)
+        # Example 4
+        sim_coeff = algs_unit.jaccard_similarity_coefficient(
+            np.array(str1), np.array(str2)
+        )
+        self.assertEqual(sim_coeff, 1.0)
+        # Example 5: Pre-encoded inputs are not added to the vocabulary.
+        vocabulary = Vocabulary()
+        algs_unit = EditDistAlgs(vocabulary=vocabulary)
+        ids1 = np.array(vocabulary.encode(["kurt", "godel"]))
+        ids2 = np.array(vocabulary.encode(["godel", "escher"]))
+        for _ in range(2):
+            dist = algs_unit.levenshtein_edit_distance(ids1, ids2)
+            self.assertEqual(dist, 2.0)
+            dist = algs_unit.damerau_levenshtein_edit_distance(ids1, ids2)
+            self.assertEqual(dist, 2.0)
+            dist, _ = algs_unit.longest_common_subsequence(ids1, ids2)
+            self.assertEqual(dist, 1.0)
+            dist = algs_unit.hamming_distance(ids1, ids2)
+            self.assertEqual(dist, 2.0)
+        self.assertEqual(len(vocabulary), 3)
+        self.assertEqual(vocabulary.id_to_symbol, ["kurt", "godel", "escher"])
+        # Example 6: Pre-encoded ids against raw tokens (encoded with the vocabulary of the instance)
+        ids = vocabulary.encode(["kurt", "godel"])
+        for encoded in [ids, np.array(ids)]:
+            dist = algs_unit.levenshtein_edit_distance(encoded, ["kurt", "godel"])
+            self.assertEqual(dist, 0.0)
+            dist = algs_unit.damerau_levenshtein_edit_distance(
+                ["godel", "kurt", "turing"], encoded
+            )
+            self.assertEqual(dist, 2.0)
+        self.assertEqual(len(vocabulary), 3)
+        # Example 7: The longest common substrings of pre-encoded inputs are lists of ids.
+        length, candidates = algs_unit.longest_common_substring(
+            ids1, ids2, printBacktrack=True
+        )
+        self.assertEqual((length, candidates), (1, [[1]]))
+
     def test_hamming_edit_distance(self):
         algs_unit = EditDistAlgs()
         # Example 1
@@ -159,6 +390,22 @@ class EditDistanceTestCase(TestCase):
         )
         self.assertEqual(dist, 0.0)
 
+    def test_hamming_edit_distance_vectorized(self):
+        algs_unit = EditDistAlgs()
+        algs_weighted = EditDistAlgs(match_weight=0.5, substite_weight=2.0)
+        # Example 1
+        dist = algs_unit.hamming_distance("ab" * 100, "ba" * 100)
+        self.assertEqual(dist, 200.0)
+        # Example 2
+        dist = algs_unit.hamming_distance("ab" * 100, "ab" * 99 + "aa")
+        self.assertEqual(dist, 1.0)
+        # Example 3
+        dist = algs_weighted.hamming_distance("ab" * 100, "ab" * 99 + "aa")
+        self.assertEqual(dist, 199 * 0.5 + 2.0)
+        # Example 4
+        dist = algs_unit.hamming_distance(["kurt", "godel"] * 100, ["kurt"] * 200)
+        self.assertEqual(dist, 100.0)
+
     def test_longest_common_subsequence(self):
         algs_unit = EditDistAlgs()
         # Example 1
@@ -233,6 +480,124 @@ class EditDistanceTestCase(TestCase):
         self.assertEqual(
             candidates, [["t", "b", "y", "dd", "xyz"], ["a", "b", "y", "dd", "xyz"]]
         )
+        # Example 11: Length only
+        self.assertEqual(
+            algs_unit.longest_common_subsequence("abcd", "xcxaaabydy"), (3.0, None)
+        )
+        self.assertEqual(
+            algs_unit.longest_common_subsequence(
+                ["a", "t", "b", "c", "y", "dd", "xyz"],
+                ["x", "c", "x", "t", "a", "a", "a", "b", "y", "dd", "y", "xyz"],
+            ),
+            (5.0, None),
+        )
+        self.assertEqual(
+            algs_unit.longest_common_subsequence([["a"], ["b"]], [["b"]]), (1.0, None)
+        )
+
+    def test_iter_longest_common_subsequences(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        candidates = list(algs_unit.iter_longest_common_subsequences("ab", "ba"))
+        self.assertEqual(candidates, ["a", "b"])
+        # Example 2
+        candidates = list(algs_unit.iter_longest_common_subsequences("ab", "cd"))
+        self.assertEqual(candidates, [""])
+        # Example 3
+        candidates = list(
+            algs_unit.iter_longest_common_subsequences("aabbccdd", "dcdcbaba")
+        )
+        self.assertCountEqual(candidates, ["dd", "cc", "bb", "aa", "cd", "ab"])
+        # Example 4
+        candidates = list(
+            algs_unit.iter_longest_common_subsequences(
+                ["a", "t", "b", "c", "y", "dd", "xyz"],
+                ["x", "c", "x", "t", "a", "a", "a", "b", "y", "dd", "y", "xyz"],
+            )
+        )
+        self.assertEqual(
+            candidates, [["a", "b", "y", "dd", "xyz"], ["t", "b", "y", "dd", "xyz"]]
+        )
+        # Example 5
+        candidates = list(
+            algs_unit.iter_longest_common_subsequences("aabbccdd", "dcdcbaba", limit=2)
+        )
+        self.assertEqual(len(candidates), 2)
+        # Example 6: Long and repetitive inputs (beyond the recursion limit).
+        candidates = algs_unit.iter_longest_common_subsequences(
+            "ab" * 600, "ba" * 600, limit=1
+        )
+        self.assertEqual(len(next(candidates)), 1199)
+
+    def test_count_longest_common_subsequences(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        self.assertEqual(algs_unit.count_longest_common_subsequences("aa", "aa"), 1)
+        # Example 2
+        self.assertEqual(
+            algs_unit.count_longest_common_subsequences("aabbccdd", "dcdcbaba"), 6
+        )
+        # Example 3
+        self.assertEqual(algs_unit.count_longest_common_subsequences("", "abc"), 1)
+        # Example 4
+        self.assertEqual(
+            algs_unit.count_longest_common_subsequences("ab" * 10, "ba" * 10), 2
+        )
+        # Example 5
+        self.assertEqual(
+            algs_unit.count_longest_common_subsequences("abx" * 4, "bax" * 4), 70
+        )
+        # Example 6: 184756 (i.e., 20 choose 10) distinct longest common subsequences.
+        self.assertEqual(
+            algs_unit.count_longest_common_subsequences("abx" * 10, "bax" * 10),
+            184756,
+        )
+
+    def test_one_longest_common_subsequence(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        length, subsequence = algs_unit.one_longest_common_subsequence("abcd", "acbd")
+        self.assertEqual(length, 3.0)
+        self.assertIn(subsequence, ["abd", "acd"])
+        # Example 2
+        length, subsequence = algs_unit.one_longest_common_subsequence(
+            ["kurt", "godel", "escher"], ["godel", "escher", "bach"]
+        )
+        self.assertEqual((length, subsequence), (2.0, ["godel", "escher"]))
+        # Example 3
+        self.assertEqual(algs_unit.one_longest_common_subsequence("abc", ""), (0.0, ""))
+
+    def test_edit_script(self):
+        algs_unit = EditDistAlgs()
+        # Example 1
+        dist, script = algs_unit.edit_script("kitten", "sitting")
+        self.assertEqual(dist, 3.0)
+        self.assertEqual(
+            script,
+            [
+                ("substitute", 0, 0),
+                ("match", 1, 1),
+                ("match", 2, 2),
+                ("match", 3, 3),
+                ("substitute", 4, 4),
+                ("match", 5, 5),
+                ("insert", 6, 6),
+            ],
+        )
+        # Example 2
+        dist, script = algs_unit.edit_script(["kurt", "godel"], ["godel"])
+        self.assertEqual((dist, script), (1.0, [("delete", 0, 0), ("match", 1, 0)]))
+        # Example 3: Weighted edit distance
+        algs_weighted = EditDistAlgs(
+            insert_weight=2.0, delete_weight=2.0, substite_weight=3.0
+        )
+        for str1, str2 in [("ttss", "stst"), ("abcdef" * 20, "bcdefa" * 20)]:
+            dist, script = algs_weighted.edit_script(str1, str2)
+            self.assertEqual(dist, algs_weighted.levenshtein_edit_distance(str1, str2))
+            self.assertEqual(
+                "".join(str2[j] for operation, _, j in script if operation != "delete"),
+                str2,
+            )
 
     def test_longest_common_subsequence(self):
         algs_unit = EditDistAlgs()
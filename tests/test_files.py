@@ -0,0 +1,90 @@
+"""
+    Unit test cases for files.py
+"""
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.files import (
+    count_lines,
+    file_hamming_distance,
+    file_jaccard_similarity_coefficient,
+    file_levenshtein_edit_distance,
+)
+
+
+class FilesTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def test_levenshtein_edit_distance(self):
+        kitten = self.write("kitten", b"kitten")
+        sitting = self.write("sitting", b"sitting")
+        empty = self.write("empty", b"")
+        # Example 1: Bytes
+        self.assertEqual(file_levenshtein_edit_distance(kitten, sitting), 3.0)
+        self.assertEqual(file_levenshtein_edit_distance(sitting, empty), 7.0)
+        self.assertEqual(file_levenshtein_edit_distance(empty, empty), 0.0)
+        # Example 2: Weighted costs (and chunks smaller than the files)
+        algs = EditDistAlgs(insert_weight=2.0, delete_weight=1.0, substite_weight=1.5)
+        self.assertEqual(
+            file_levenshtein_edit_distance(kitten, sitting, algs=algs, chunk_size=2),
+            algs.levenshtein_edit_distance("kitten", "sitting"),
+        )
+        self.assertEqual(
+            file_levenshtein_edit_distance(sitting, kitten, algs=algs, chunk_size=2),
+            algs.levenshtein_edit_distance("sitting", "kitten"),
+        )
+        # Example 3: Lines
+        text1 = self.write("text1", b"kurt\ngodel\nescher\nbach\n")
+        text2 = self.write("text2", b"kurt\nescher\nbach\nbach")
+        self.assertEqual(count_lines(text1), 4)
+        self.assertEqual(count_lines(text2), 4)
+        self.assertEqual(file_levenshtein_edit_distance(text1, text2, unit="line"), 2.0)
+        with self.assertRaises(ValueError):
+            file_levenshtein_edit_distance(text1, text2, unit="word")
+
+    def test_hamming_distance(self):
+        karolin = self.write("karolin", b"karolin")
+        kathrin = self.write("kathrin", b"kathrin")
+        # Example 1
+        self.assertEqual(file_hamming_distance(karolin, kathrin, chunk_size=3), 3.0)
+        self.assertEqual(file_hamming_distance(karolin, karolin), 0.0)
+        # Example 2: Lines
+        text1 = self.write("text1", b"a\nb\nc\n")
+        text2 = self.write("text2", b"a\nx\nc")
+        self.assertEqual(file_hamming_distance(text1, text2, unit="line"), 1.0)
+        # Example 3: Files of different lengths
+        with self.assertRaises(ValueError):
+            file_hamming_distance(karolin, text1)
+        with self.assertRaises(ValueError):
+            file_hamming_distance(karolin, text1, unit="line")
+
+    def test_jaccard_similarity_coefficient(self):
+        text1 = self.write("text1", b"a\nb\nc\nc\n")
+        text2 = self.write("text2", b"b\nc\nd")
+        empty = self.write("empty", b"")
+        # Example 1: Sets of lines
+        self.assertEqual(file_jaccard_similarity_coefficient(text1, text2), 0.5)
+        self.assertEqual(file_jaccard_similarity_coefficient(text1, empty), 0.0)
+        self.assertEqual(file_jaccard_similarity_coefficient(empty, empty), 1.0)
+        # Example 2: Sets of bytes
+        self.assertEqual(
+            file_jaccard_similarity_coefficient(text1, text2, unit="byte"),
+            EditDistAlgs().jaccard_similarity_coefficient("a\nb\nc\nc\n", "b\nc\nd"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+    Unit test cases for hamming_index.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.hamming_index import HammingIndex
+
+
+class HammingIndexTestCase(TestCase):
+    def test_binary_codes(self):
+        codes = ["0000000000", "1111111111", "0101010101", "0000011111"]
+        index = HammingIndex(codes)
+        # Example 1
+        self.assertTrue(index.is_binary)
+        self.assertEqual(index.rows.shape, (4, 2))
+        # Example 2
+        dist = index.distances("0000000001")
+        self.assertEqual(dist.tolist(), [1.0, 9.0, 4.0, 4.0])
+        # Example 3: Non-binary symbols never match.
+        dist = index.distances("x000000001")
+        self.assertEqual(dist.tolist(), [2.0, 9.0, 5.0, 5.0])
+        # Example 4
+        indices, dist = index.top_k("0000011110", 2)
+        self.assertEqual(indices.tolist(), [3, 0])
+        self.assertEqual(dist.tolist(), [1.0, 4.0])
+        # Example 5: Lists of 0/1 integers are bit-packed as well.
+        index = HammingIndex([[0, 1, 1], [1, 1, 1]], chunk_size=1)
+        self.assertTrue(index.is_binary)
+        self.assertEqual(index.distances([0, 0, 1]).tolist(), [1.0, 2.0])
+
+    def test_general_codes(self):
+        codes = ["ACGT", "ACGA", "TTTT", "GCGT"]
+        index = HammingIndex(codes, chunk_size=3)
+        # Example 1
+        self.assertFalse(index.is_binary)
+        self.assertEqual(index.distances("ACGT").tolist(), [0.0, 1.0, 3.0, 1.0])
+        self.assertEqual(
+            index.distances(["A", "C", "G", "T"]).tolist(), [0.0, 1.0, 3.0, 1.0]
+        )
+        # Example 2
+        indices, dist = index.top_k("TCGT", 10)
+        self.assertEqual(indices.tolist(), [0, 3, 1, 2])
+        self.assertEqual(dist.tolist(), [1.0, 1.0, 2.0, 2.0])
+        # Example 3: Lists of tokens.
+        index = HammingIndex([["kurt", "godel"], ["godel", "kurt"]])
+        self.assertEqual(index.distances(["kurt", "escher"]).tolist(), [1.0, 2.0])
+        # Example 4: The weights of EditDistAlgs are used.
+        algs_weighted = EditDistAlgs(match_weight=0.5, substite_weight=2.0)
+        index = HammingIndex(codes, algs=algs_weighted)
+        self.assertEqual(index.distances("ACGA").tolist(), [3.5, 2.0, 8.0, 5.0])
+        # Example 5
+        with self.assertRaises(ValueError):
+            index.distances("ACG")
+        with self.assertRaises(ValueError):
+            HammingIndex(["ACGT", "ACG"])
+
+
+if __name__ == "__main__":
+    unittest.main()
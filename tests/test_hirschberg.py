@@ -0,0 +1,62 @@
+"""
+    Unit test cases for hirschberg.py
+"""
+import random
+import unittest
+from unittest import TestCase
+
+import string2string.hirschberg as hirschberg
+from string2string.edit_distance import EditDistAlgs
+from string2string.hirschberg import hirschberg_edit_script, last_row
+from string2string.wavefront import encode_pair
+
+
+class HirschbergTestCase(TestCase):
+    def test_last_row(self):
+        codes1, codes2 = encode_pair("kitten", "sitting")
+        # Example 1
+        self.assertEqual(last_row(codes1, codes2).tolist(), [6, 6, 5, 4, 3, 3, 2, 3])
+        # Example 2
+        self.assertEqual(last_row(codes1[:0], codes2, 2.0).tolist()[-1], 14.0)
+
+    def test_agrees_with_dynamic_programming(self):
+        rng = random.Random(0)
+        base_case_cells = hirschberg.BASE_CASE_CELLS
+        # Tiny base cases exercise the divide-and-conquer steps.
+        hirschberg.BASE_CASE_CELLS = 4
+        try:
+            for _ in range(50):
+                weights = dict(
+                    insert_weight=rng.choice([1.0, 2.0, 0.5]),
+                    delete_weight=rng.choice([1.0, 3.0]),
+                    match_weight=rng.choice([0.0, 0.5]),
+                    substite_weight=rng.choice([1.5, 0.7]),
+                )
+                algs = EditDistAlgs(**weights)
+                str1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+                str2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+                codes1, codes2 = encode_pair(str1, str2)
+                script = hirschberg_edit_script(codes1, codes2, **weights)
+                costs = {
+                    "insert": weights["insert_weight"],
+                    "delete": weights["delete_weight"],
+                    "match": weights["match_weight"],
+                    "substitute": weights["substite_weight"],
+                }
+                self.assertAlmostEqual(
+                    sum(costs[operation] for operation, _, _ in script),
+                    algs.levenshtein_edit_distance(str1, str2, max_distance=1000.0),
+                )
+                # The script consumes both inputs from left to right.
+                i = j = 0
+                for operation, position1, position2 in script:
+                    self.assertEqual((position1, position2), (i, j))
+                    i += operation != "insert"
+                    j += operation != "delete"
+                self.assertEqual((i, j), (len(str1), len(str2)))
+        finally:
+            hirschberg.BASE_CASE_CELLS = base_case_cells
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+    Unit test cases for incremental.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.incremental import IncrementalSession
+
+
+class IncrementalSessionTestCase(TestCase):
+    def test_levenshtein(self):
+        candidates = ["kitten", "sitting", "mitten", "", "kit"]
+        algs = EditDistAlgs(substite_weight=2.0)
+        session = IncrementalSession(candidates, algs=algs)
+        # Example 1: Appending symbols one at a time
+        for symbol in "sittn":
+            session.append(symbol)
+            expected = [
+                algs.levenshtein_edit_distance(session.query, candidate)
+                for candidate in candidates
+            ]
+            self.assertEqual(session.distances(), expected)
+        self.assertEqual(session.query, "sittn")
+        # Example 2: Backspace
+        session.backspace(2)
+        self.assertEqual(session.query, "sit")
+        self.assertEqual(session.distances(), [5.0, 4.0, 5.0, 3.0, 2.0])
+        session.backspace(10)
+        self.assertEqual(session.query, "")
+        self.assertEqual(session.distances(), [6.0, 7.0, 6.0, 0.0, 3.0])
+        with self.assertRaises(ValueError):
+            session.backspace(-1)
+        # Example 3: Replacing the query
+        session.set_query("mitt")
+        self.assertEqual(session.distances()[2], 2.0)
+        session.set_query("kitt")
+        self.assertEqual(session.distances()[0], 2.0)
+        # Example 4: Prefix distances
+        self.assertEqual(session.prefix_distances(), [0.0, 2.0, 2.0, 4.0, 1.0])
+        self.assertEqual(session.top_k(2, prefix=True), [("kitten", 0.0), ("kit", 1.0)])
+        self.assertEqual(session.within(2.0), [("kit", 1.0), ("kitten", 2.0)])
+        with self.assertRaises(ValueError):
+            session.top_k(0)
+
+    def test_damerau_levenshtein(self):
+        candidates = ["abcd", "bacd", "ca", ["the", "cat"]]
+        algs = EditDistAlgs()
+        session = IncrementalSession(candidates, "damerau_levenshtein_edit_distance")
+        # Example 1
+        session.extend("bacd")
+        self.assertEqual(session.distances(), [1.0, 0.0, 3.0, 4.0])
+        # Example 2: Removing a symbol restores the previous distances.
+        session.backspace()
+        session.append("x")
+        expected = [
+            algs.damerau_levenshtein_edit_distance("bacx", candidate)
+            for candidate in candidates
+        ]
+        self.assertEqual(session.distances(), expected)
+        # Example 3: Tokens
+        session.set_query(["cat", "the"])
+        self.assertEqual(session.distances()[3], 1.0)
+        self.assertEqual(session.query, ["cat", "the"])
+        # Example 4
+        with self.assertRaises(ValueError):
+            IncrementalSession(candidates, "hamming_distance")
+
+
+if __name__ == "__main__":
+    unittest.main()
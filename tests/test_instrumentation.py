@@ -0,0 +1,71 @@
+"""
+    Unit test cases for instrumentation.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.cache import ResultCache
+from string2string.edit_distance import EditDistAlgs
+from string2string.instrumentation import Instrumentation, length_bucket
+
+
+class InstrumentationTestCase(TestCase):
+    def test_length_bucket(self):
+        self.assertEqual(
+            [length_bucket(length) for length in (0, 1, 2, 3, 4, 5, 1000)],
+            [0, 1, 2, 4, 4, 8, 1024],
+        )
+
+    def test_instrumented_methods(self):
+        events = []
+        instrumentation = Instrumentation(callback=events.append)
+        algs = EditDistAlgs(instrumentation=instrumentation)
+        # Example 1
+        self.assertEqual(algs.levenshtein_edit_distance("kitten", "sitting"), 3.0)
+        algs.levenshtein_edit_distance("a" * 100, "b" * 3)
+        algs.hamming_distance("karolin", "kathrin")
+        stats = instrumentation.stats()
+        self.assertEqual(stats["levenshtein_edit_distance"]["calls"], 2)
+        self.assertEqual(stats["levenshtein_edit_distance"]["cells"], 7 * 8 + 101 * 4)
+        self.assertEqual(
+            stats["levenshtein_edit_distance"]["length_histogram"], {8: 1, 128: 1}
+        )
+        self.assertEqual(stats["hamming_distance"]["cells"], 14)
+        self.assertIsNone(events[0]["bytes_allocated"])
+        self.assertEqual(
+            [event["method"] for event in events],
+            ["levenshtein_edit_distance"] * 2 + ["hamming_distance"],
+        )
+        # Example 2: Nested calls are recorded for each method.
+        algs.jaccard_index("abc", "abd")
+        self.assertEqual(
+            [event["method"] for event in events[-2:]],
+            ["jaccard_similarity_coefficient", "jaccard_index"],
+        )
+        # Example 3: The snapshot is not affected by later calls.
+        algs.levenshtein_edit_distance("abc", "abd")
+        self.assertEqual(stats["levenshtein_edit_distance"]["calls"], 2)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.stats(), {})
+
+    def test_trace_memory(self):
+        instrumentation = Instrumentation(trace_memory=True)
+        algs = EditDistAlgs(instrumentation=instrumentation)
+        algs.edit_script("ab" * 100, "ba" * 100)
+        stats = instrumentation.stats()["edit_script"]
+        self.assertGreater(stats["bytes_allocated"], 200 * 200)
+        self.assertEqual(stats["slowest_lengths"], (200, 200))
+
+    def test_cache(self):
+        # Results served from the cache are not recorded.
+        instrumentation = Instrumentation()
+        algs = EditDistAlgs(cache=ResultCache(), instrumentation=instrumentation)
+        for _ in range(3):
+            algs.levenshtein_edit_distance("kitten", "sitting")
+        self.assertEqual(
+            instrumentation.stats()["levenshtein_edit_distance"]["calls"], 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
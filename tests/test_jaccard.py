@@ -0,0 +1,91 @@
+"""
+    Unit test cases for jaccard.py
+"""
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+import string2string.jaccard as jaccard
+from string2string.edit_distance import EditDistAlgs
+from string2string.jaccard import JaccardCorpus
+
+
+class JaccardCorpusTestCase(TestCase):
+    def test_encoding(self):
+        corpus = JaccardCorpus(["abca", "", "cb"])
+        # Example 1: CSR layout of the sorted shingle ids
+        self.assertEqual(len(corpus), 3)
+        self.assertEqual(corpus.indptr.tolist(), [0, 3, 3, 5])
+        for i in range(len(corpus)):
+            row = corpus.indices[corpus.indptr[i] : corpus.indptr[i + 1]]
+            self.assertEqual(row.tolist(), sorted(row.tolist()))
+        self.assertEqual(corpus.sizes.tolist(), [3, 0, 2])
+        # Example 2
+        with self.assertRaises(ValueError):
+            JaccardCorpus(["abc"], shingle_size=0)
+
+    def test_similarities(self):
+        algs = EditDistAlgs()
+        documents = ["kurt", "godel", "", "turk", ["kurt", "godel"], "dogel"]
+        corpus = JaccardCorpus(documents)
+        # Example 1: The coefficients agree with EditDistAlgs.jaccard_similarity_coefficient.
+        for query in ["kurt", "", "xyz", "ok", ["godel"]]:
+            expected = [
+                algs.jaccard_similarity_coefficient(query, document)
+                for document in documents
+            ]
+            self.assertTrue(np.allclose(corpus.similarities(query), expected))
+        # Example 2: All pairs
+        matrix = corpus.pdist()
+        for i, document1 in enumerate(documents):
+            for j, document2 in enumerate(documents):
+                self.assertAlmostEqual(
+                    matrix[i, j],
+                    algs.jaccard_similarity_coefficient(document1, document2),
+                )
+        self.assertTrue(np.allclose(corpus.cdist(documents), matrix))
+        # Example 3: Shingles of length 2
+        corpus = JaccardCorpus(["abcd", "abce", "xbcd"], shingle_size=2)
+        self.assertTrue(np.allclose(corpus.similarities("abcd"), [1.0, 0.5, 0.5]))
+
+    def test_similar_pairs(self):
+        documents = ["abcd", "abce", "", "wxyz", "abcd", ""]
+        corpus = JaccardCorpus(documents)
+        # Example 1: Pairs (i, j) with i < j
+        rows, columns, values = corpus.similar_pairs(0.5)
+        self.assertEqual(
+            list(zip(rows.tolist(), columns.tolist())),
+            [(0, 1), (0, 4), (1, 4), (2, 5)],
+        )
+        self.assertTrue(np.allclose(values, [0.6, 1.0, 0.6, 1.0]))
+        # Example 2: Query-document pairs
+        rows, columns, values = corpus.similar_pairs(1.0, ["abcd", "dcba", "q"])
+        self.assertEqual(rows.tolist(), [0, 0, 1, 1])
+        self.assertEqual(columns.tolist(), [0, 4, 0, 4])
+        # Example 3: The results do not depend on the size of the blocks.
+        matrix = corpus.pdist()
+        default_block_cells = jaccard._BLOCK_CELLS
+        try:
+            jaccard._BLOCK_CELLS = 7
+            self.assertTrue(np.allclose(corpus.pdist(), matrix))
+            rows, columns, values = corpus.similar_pairs(0.5)
+            self.assertEqual(columns.tolist(), [1, 4, 4, 5])
+            # The blocks are sized by the postings of their shingles (e.g., the row "abcd" costs 6 + 4 + 11 entries).
+            jaccard._BLOCK_CELLS = 40
+            blocks = corpus._similarity_blocks(corpus.indptr, corpus.indices, True)
+            self.assertEqual([start for start, _ in blocks], [0, 1, 4])
+            self.assertTrue(np.allclose(corpus.pdist(), matrix))
+        finally:
+            jaccard._BLOCK_CELLS = default_block_cells
+        # Example 4: Two empty documents have a coefficient of 1 (for any threshold).
+        rows, columns, values = corpus.similar_pairs(1.0)
+        self.assertEqual(list(zip(rows.tolist(), columns.tolist())), [(0, 4), (2, 5)])
+        # Example 5
+        with self.assertRaises(ValueError):
+            corpus.similar_pairs(0.0)
+        self.assertEqual(len(JaccardCorpus([]).similar_pairs(0.5)[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+    Unit test cases for minhash.py
+"""
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.minhash import (
+    LSHIndex,
+    MinHasher,
+    optimal_bands,
+    shingles,
+)
+
+
+class MinHashTestCase(TestCase):
+    def test_shingles(self):
+        # Example 1
+        self.assertEqual(shingles("abab"), {"a", "b"})
+        self.assertEqual(shingles("abab", 2), {"ab", "ba"})
+        # Example 2
+        self.assertEqual(shingles("ab", 3), {"ab"})
+        self.assertEqual(shingles("", 3), set())
+        # Example 3
+        self.assertEqual(
+            shingles(["kurt", "godel", "kurt"], 2),
+            {("kurt", "godel"), ("godel", "kurt")},
+        )
+
+    def test_signatures(self):
+        hasher = MinHasher(num_perm=256, shingle_size=2, seed=1)
+        sequences = ["abcdefgh", "abcdefgx", "", ["kurt", "godel"]]
+        signatures = hasher.signatures(sequences)
+        # Example 1: Batched and single signatures agree.
+        self.assertEqual(signatures.shape, (4, 256))
+        for signature, sequence in zip(signatures, sequences):
+            self.assertTrue(np.array_equal(signature, hasher.signature(sequence)))
+        # Example 2: The exact Jaccard similarity is 6 / 8.
+        estimate = hasher.estimate_jaccard(signatures[0], signatures[1])
+        self.assertAlmostEqual(estimate, 0.75, delta=0.15)
+        # Example 3
+        self.assertEqual(hasher.estimate_jaccard(signatures[0], signatures[0]), 1.0)
+        self.assertEqual(hasher.estimate_jaccard(signatures[2], signatures[2]), 1.0)
+
+    def test_optimal_bands(self):
+        # Example 1
+        bands, rows = optimal_bands(0.5, 128)
+        self.assertLessEqual(bands * rows, 128)
+        # Example 2: A higher threshold calls for longer bands.
+        self.assertGreater(optimal_bands(0.9, 128)[1], rows)
+
+    def test_lsh_index(self):
+        documents = [
+            "the quick brown fox jumps over the lazy dog",
+            "the quick brown fox jumped over the lazy dog",
+            "lorem ipsum dolor sit amet consectetur adipiscing",
+            "string to string algorithms in pure python",
+        ]
+        index = LSHIndex(threshold=0.6, shingle_size=3, verify=True)
+        for key, document in enumerate(documents[:2]):
+            index.insert(key, document)
+        index.update(enumerate(documents[2:], start=2))
+        # Example 1
+        self.assertEqual(len(index), 4)
+        self.assertIn(3, index)
+        with self.assertRaises(ValueError):
+            index.insert(0, documents[0])
+        # Example 2: The similarities are exact.
+        results = index.query(documents[0])
+        self.assertEqual([key for key, _ in results], [0, 1])
+        self.assertEqual(results[0][1], 1.0)
+        self.assertAlmostEqual(
+            results[1][1],
+            EditDistAlgs().jaccard_similarity_coefficient(
+                list(shingles(documents[0], 3)), list(shingles(documents[1], 3))
+            ),
+        )
+        # Example 3
+        self.assertEqual(index.query("an unrelated query string"), [])
+        # Example 4
+        pairs = index.near_duplicate_pairs()
+        self.assertEqual([(key1, key2) for key1, key2, _ in pairs], [(0, 1)])
+        # Example 5: Lists of tokens and estimated similarities.
+        index = LSHIndex(threshold=0.5, bands=16, rows=4, num_perm=64)
+        index.insert("a", ["kurt", "godel", "escher", "bach"])
+        index.insert("b", ["kurt", "godel", "escher", "bach", "hofstadter"])
+        results = index.query(["kurt", "godel", "escher", "bach"])
+        self.assertEqual(results[0], ("a", 1.0))
+        with self.assertRaises(ValueError):
+            index.query(["kurt"], verify=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+    Unit test cases for pairwise.py
+"""
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.pairwise import METRICS, cdist, iter_pdist_blocks, pdist
+
+
+class PairwiseTestCase(TestCase):
+    def setUp(self):
+        self.items = ["kitten", "sitting", "", "mitten", "bitten", "kitchen", "sit"]
+
+    def test_cdist(self):
+        algs_unit = EditDistAlgs()
+        queries = self.items[:3]
+        # Example 1: Every metric matches the pairwise method calls.
+        for metric in METRICS:
+            targets = self.items if metric != "hamming_distance" else ["abcdef"] * 2
+            if metric == "hamming_distance":
+                queries = ["abcdeg", "bbcdef", "abcdef"]
+            dist = cdist(queries, targets, metric=metric, chunk_size=2)
+            self.assertEqual(dist.shape, (len(queries), len(targets)))
+            for i, query in enumerate(queries):
+                for j, target in enumerate(targets):
+                    expected = getattr(algs_unit, metric)(query, target)
+                    if isinstance(expected, tuple):
+                        expected = expected[0]
+                    self.assertEqual(dist[i, j], expected)
+        # Example 2: Keyword arguments are passed to the metric.
+        dist = cdist(["kitten"], ["sitting", "mitten"], max_distance=1)
+        self.assertEqual(dist.tolist(), [[float("inf"), 1.0]])
+        # Example 3
+        with self.assertRaises(ValueError):
+            cdist(["a"], ["b"], metric="edit_distance")
+
+    def test_pdist(self):
+        # Example 1
+        dist = pdist(self.items, chunk_size=3)
+        expected = cdist(self.items, self.items)
+        self.assertTrue(np.array_equal(dist, expected))
+        # Example 2: Only the blocks on or above the block diagonal are computed for symmetric metrics.
+        blocks = list(iter_pdist_blocks(self.items, chunk_size=3))
+        self.assertEqual(len(blocks), 6)
+        # Example 3: Asymmetric weights.
+        algs_asymmetric = EditDistAlgs(insert_weight=1.0, delete_weight=3.0)
+        dist = pdist(self.items, algs=algs_asymmetric, chunk_size=3)
+        expected = cdist(self.items, self.items, algs=algs_asymmetric)
+        self.assertTrue(np.array_equal(dist, expected))
+        self.assertEqual(
+            len(
+                list(iter_pdist_blocks(self.items, algs=algs_asymmetric, chunk_size=3))
+            ),
+            9,
+        )
+        # Example 4
+        self.assertEqual(pdist([]).shape, (0, 0))
+
+    def test_process_pool(self):
+        # Example 1
+        dist = pdist(self.items, chunk_size=2, max_workers=2)
+        expected = cdist(self.items, self.items)
+        self.assertTrue(np.array_equal(dist, expected))
+        # Example 2: The result can be written into a preallocated (e.g., memory-mapped) array.
+        out = np.full((2, len(self.items)), -1.0)
+        dist = cdist(self.items[:2], self.items, chunk_size=2, max_workers=2, out=out)
+        self.assertIs(dist, out)
+        self.assertTrue(np.array_equal(out, expected[:2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
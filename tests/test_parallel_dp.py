@@ -0,0 +1,82 @@
+"""
+    Unit test cases for parallel_dp.py
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.parallel_dp import (
+    parallel_levenshtein_edit_distance,
+    parallel_longest_common_subsequence_length,
+    parallel_longest_common_substring_length,
+)
+
+
+class ParallelDPTestCase(TestCase):
+    def setUp(self):
+        self.pairs = [
+            ("kitten", "sitting"),
+            ("", "abc"),
+            ("abc", ""),
+            ("", ""),
+            ("abcabcabcxyz", "xyzabcabcab"),
+            (["kurt", "godel", "kurt"], ["godel", "kurt"]),
+        ]
+
+    def test_levenshtein_edit_distance(self):
+        for algs in [
+            EditDistAlgs(),
+            EditDistAlgs(insert_weight=2.0, substite_weight=1.5),
+        ]:
+            for str1, str2 in self.pairs:
+                expected = algs.levenshtein_edit_distance(str1, str2)
+                # Example 1: Serially, with blocks of several sizes
+                for tile_size in [1, 2, 5, 100]:
+                    dist = parallel_levenshtein_edit_distance(
+                        str1, str2, algs, tile_size=tile_size, max_workers=1
+                    )
+                    self.assertAlmostEqual(dist, expected)
+                # Example 2: On an executor
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    dist = parallel_levenshtein_edit_distance(
+                        str1, str2, algs, tile_size=2, executor=executor
+                    )
+                self.assertAlmostEqual(dist, expected)
+        # Example 3: Worker processes
+        str1, str2 = "abcdefgh" * 4, "bacdfegh" * 4
+        dist = parallel_levenshtein_edit_distance(
+            str1, str2, tile_size=8, max_workers=2
+        )
+        self.assertEqual(dist, EditDistAlgs().levenshtein_edit_distance(str1, str2))
+        with self.assertRaises(ValueError):
+            parallel_levenshtein_edit_distance("abc", "abd", tile_size=0)
+
+    def test_longest_common_subsequence_length(self):
+        algs = EditDistAlgs()
+        for str1, str2 in self.pairs:
+            expected, _ = algs.longest_common_subsequence(str1, str2)
+            for tile_size in [1, 3, 100]:
+                length = parallel_longest_common_subsequence_length(
+                    str1, str2, tile_size=tile_size, max_workers=1
+                )
+                self.assertEqual(length, expected)
+
+    def test_longest_common_substring_length(self):
+        algs = EditDistAlgs()
+        for str1, str2 in self.pairs:
+            expected, _ = algs.longest_common_substring(str1, str2)
+            for tile_size in [1, 3, 100]:
+                length = parallel_longest_common_substring_length(
+                    str1, str2, tile_size=tile_size, max_workers=1
+                )
+                self.assertEqual(length, expected)
+        # Example 2: Worker processes
+        length = parallel_longest_common_substring_length(
+            "xx" + "abcdefgh" * 3, "abcdefgh" * 3 + "yy", tile_size=5, max_workers=2
+        )
+        self.assertEqual(length, 24.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+    Unit test cases for suffix_automaton.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.suffix_automaton import (
+    SuffixAutomaton,
+    multi_longest_common_substring,
+)
+
+
+class SuffixAutomatonTestCase(TestCase):
+    def test_suffix_automaton(self):
+        automaton = SuffixAutomaton("abcbc")
+        # Example 1
+        self.assertIn("bcb", automaton)
+        self.assertIn("", automaton)
+        self.assertNotIn("cc", automaton)
+        # Example 2: At most 2n - 1 states.
+        self.assertLessEqual(len(automaton), 2 * 5 - 1)
+        # Example 3
+        automaton = SuffixAutomaton(["kurt", "godel", "kurt"])
+        self.assertIn(["godel", "kurt"], automaton)
+        self.assertNotIn(["kurt", "kurt"], automaton)
+
+    def test_longest_common_substring(self):
+        automaton = SuffixAutomaton("xyxy")
+        # Example 1: The automaton is reused across queries.
+        length, candidates = automaton.longest_common_substring("yxyx")
+        self.assertEqual(length, 3)
+        self.assertCountEqual(candidates, ["xyx", "yxy"])
+        length, candidates = automaton.longest_common_substring("zzz")
+        self.assertEqual(length, 0)
+        self.assertEqual(candidates, [])
+        length, candidates = automaton.longest_common_substring("xyxy")
+        self.assertEqual(length, 4)
+        self.assertEqual(candidates, ["xyxy"])
+        # Example 2
+        automaton = SuffixAutomaton(" julia ")
+        length, candidates = automaton.longest_common_substring("  julie ")
+        self.assertEqual(length, 5)
+        self.assertEqual(candidates, [" juli"])
+        # Example 3
+        with self.assertRaises(ValueError):
+            automaton.longest_common_substring()
+
+    def test_multi_longest_common_substring(self):
+        # Example 1
+        length, candidates = multi_longest_common_substring(
+            ["julia", "julie", "juliet", "july"]
+        )
+        self.assertEqual(length, 3)
+        self.assertEqual(candidates, ["jul"])
+        # Example 2
+        length, candidates = multi_longest_common_substring(
+            ["abcxyz", "xyzabc", "zzabcxyzz"]
+        )
+        self.assertEqual(length, 3)
+        self.assertCountEqual(candidates, ["abc", "xyz"])
+        # Example 3
+        length, candidates = multi_longest_common_substring(
+            [["a", "bb", "c"], ["bb", "c", "a"], ["x", "bb", "c"]]
+        )
+        self.assertEqual(length, 2)
+        self.assertEqual(candidates, [["bb", "c"]])
+        # Example 4
+        length, candidates = multi_longest_common_substring(["abc", "", "abc"])
+        self.assertEqual(length, 0)
+        self.assertEqual(candidates, [])
+        # Example 5
+        with self.assertRaises(ValueError):
+            multi_longest_common_substring([])
+
+
+if __name__ == "__main__":
+    unittest.main()
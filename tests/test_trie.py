@@ -0,0 +1,75 @@
+"""
+    Unit test cases for trie.py
+"""
+import unittest
+from unittest import TestCase
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.trie import Trie
+
+
+class TrieTestCase(TestCase):
+    def test_trie(self):
+        trie = Trie(["book", "books", "boo", "cake"])
+        # Example 1
+        self.assertEqual(len(trie), 4)
+        self.assertFalse(trie.add("book"))
+        self.assertTrue(trie.add(""))
+        # Example 2
+        self.assertIn("boo", trie)
+        self.assertIn("", trie)
+        self.assertNotIn("bo", trie)
+        self.assertNotIn("cakes", trie)
+
+    def test_search(self):
+        words = ["book", "books", "cake", "boo", "cape", "cart", "boon", "bool"]
+        trie = Trie(words)
+        # Example 1
+        self.assertEqual(trie.search("book", 0), [("book", 0.0)])
+        # Example 2: Ties are listed in depth-first order of the trie.
+        self.assertEqual(
+            trie.search("book", 1),
+            [("book", 0.0), ("boo", 1.0), ("books", 1.0), ("boon", 1.0), ("bool", 1.0)],
+        )
+        self.assertEqual(trie.search("xyz", 2), [])
+        # Example 3: The subtrees of "c" are pruned.
+        trie.search("boko", 1)
+        self.assertGreater(trie.last_stats["pruned_subtrees"], 0)
+        # Example 4: Transpositions
+        self.assertEqual(trie.search("caek", 1), [])
+        self.assertEqual(trie.search("caek", 1, transpositions=True), [("cake", 1.0)])
+
+    def test_weights(self):
+        algs = EditDistAlgs(
+            insert_weight=2.0,
+            delete_weight=1.0,
+            substite_weight=1.5,
+            adjacent_transposition_weight=0.5,
+        )
+        words = ["kitten", "sitting", "kiten", "iktten"]
+        trie = Trie(words, algs=algs)
+        # Example 1: The distances agree with EditDistAlgs.
+        for transpositions in (False, True):
+            function = (
+                algs.damerau_levenshtein_edit_distance
+                if transpositions
+                else algs.levenshtein_edit_distance
+            )
+            expected = sorted(
+                (word, function("kitten", word))
+                for word in words
+                if function("kitten", word) <= 3.0
+            )
+            self.assertEqual(
+                sorted(trie.search("kitten", 3.0, transpositions)), expected
+            )
+        # Example 2: Lists of tokens
+        trie = Trie([["kurt", "godel"], ["kurt", "escher", "bach"]])
+        self.assertEqual(
+            trie.search(["kurt", "bach"], 1.0),
+            [(["kurt", "godel"], 1.0), (["kurt", "escher", "bach"], 1.0)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
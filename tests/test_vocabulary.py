@@ -0,0 +1,40 @@
+"""
+    Unit test cases for vocabulary.py
+"""
+import unittest
+from array import array
+from unittest import TestCase
+
+from string2string.vocabulary import Vocabulary
+
+
+class VocabularyTestCase(TestCase):
+    def test_encode_decode(self):
+        vocabulary = Vocabulary()
+        # Example 1
+        ids = vocabulary.encode(["kurt", "godel", "kurt"])
+        self.assertEqual(ids, array("i", [0, 1, 0]))
+        self.assertEqual(vocabulary.decode(ids), ["kurt", "godel", "kurt"])
+        # Example 2: Characters share the same vocabulary.
+        ids = vocabulary.encode("abba")
+        self.assertEqual(ids, array("i", [2, 3, 3, 2]))
+        self.assertEqual(len(vocabulary), 4)
+        # Example 3
+        self.assertIn("godel", vocabulary)
+        self.assertNotIn("escher", vocabulary)
+        # Example 4
+        with self.assertRaises(KeyError):
+            vocabulary.encode(["escher"], grow=False)
+        self.assertEqual(len(vocabulary), 4)
+
+    def test_initial_symbols(self):
+        vocabulary = Vocabulary("abc")
+        # Example 1
+        self.assertEqual(vocabulary.add("b"), 1)
+        # Example 2
+        self.assertEqual(vocabulary.add("d"), 3)
+        self.assertEqual(vocabulary.id_to_symbol, ["a", "b", "c", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
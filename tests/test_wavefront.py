@@ -0,0 +1,85 @@
+"""
+    Unit test cases for wavefront.py
+"""
+import random
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from string2string.edit_distance import EditDistAlgs
+from string2string.wavefront import encode_pair, wavefront_levenshtein
+
+
+class WavefrontTestCase(TestCase):
+    def test_encode_pair(self):
+        # Example 1
+        codes1, codes2 = encode_pair("abc", "cab")
+        self.assertEqual(codes1.tolist(), [97, 98, 99])
+        self.assertEqual(codes2.tolist(), [99, 97, 98])
+        # Example 2
+        codes1, codes2 = encode_pair(["kurt", "godel"], ["godel", "escher"])
+        self.assertEqual(codes1.tolist(), [0, 1])
+        self.assertEqual(codes2.tolist(), [1, 2])
+
+    def test_wavefront_levenshtein(self):
+        # Example 1
+        codes1, codes2 = encode_pair("kitten", "sitting")
+        self.assertEqual(wavefront_levenshtein(codes1, codes2), 3.0)
+        # Example 2
+        codes1, codes2 = encode_pair("", "abcdef")
+        self.assertEqual(wavefront_levenshtein(codes1, codes2), 6.0)
+        self.assertEqual(wavefront_levenshtein(codes2, codes1), 6.0)
+        # Example 3
+        codes1, codes2 = encode_pair("ttss", "stst")
+        dist = wavefront_levenshtein(
+            codes1, codes2, insert_weight=2.0, delete_weight=2.0
+        )
+        self.assertEqual(dist, 2.0)
+
+    def test_cost_tables(self):
+        # Alphabet: 0 = "l", 1 = "1", 2 = "I", 3 = "o", 4 = "0"
+        substitution_costs = np.ones((5, 5)) - np.eye(5)
+        substitution_costs[[0, 1, 2, 0, 1, 2], [1, 2, 0, 2, 0, 1]] = 0.1
+        substitution_costs[[3, 4], [4, 3]] = 0.2
+        insert_costs = np.full(5, 1.0)
+        delete_costs = np.full(5, 1.0)
+        delete_costs[2] = 0.5
+        # Example 1: "l0" -> "1o"
+        dist = wavefront_levenshtein(
+            [0, 4], [1, 3], substitution_costs=substitution_costs
+        )
+        self.assertAlmostEqual(dist, 0.3)
+        # Example 2: "lIo" -> "lo"
+        dist = wavefront_levenshtein(
+            [0, 2, 3],
+            [0, 3],
+            substitution_costs=substitution_costs,
+            insert_costs=insert_costs,
+            delete_costs=delete_costs,
+        )
+        self.assertAlmostEqual(dist, 0.5)
+
+    def test_agrees_with_dynamic_programming(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            weights = dict(
+                insert_weight=rng.choice([1.0, 2.0, 0.5]),
+                delete_weight=rng.choice([1.0, 3.0]),
+                match_weight=rng.choice([0.0, 0.5]),
+                substite_weight=rng.choice([1.5, 0.7]),
+            )
+            algs = EditDistAlgs(**weights)
+            str1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 60)))
+            str2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 60)))
+            # A large max_distance forces the row-by-row dynamic programming solution.
+            expected = algs.levenshtein_edit_distance(str1, str2, max_distance=1000.0)
+            codes1, codes2 = encode_pair(str1, str2)
+            self.assertAlmostEqual(
+                wavefront_levenshtein(codes1, codes2, **weights), expected
+            )
+            self.assertAlmostEqual(algs.levenshtein_edit_distance(str1, str2), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()